@@ -1,12 +1,18 @@
 import os
+import click
 from flask import Flask, jsonify
 from flask_cors import CORS
 from .config import Config
-from .database import db, ma
+from .database import db, ma, apply_engine_profile, register_engine_events
 from .errors import register_error_handlers
+from .metrics import register_metrics
+from .utils.cache_utils import init_cache
+from .utils.auth_utils import init_principal_cache
+from .utils.categorize_utils import init_categorizer_cache
+from .utils.precompute_utils import start_report_scheduler
 from .routes import all_blueprints
 
-def create_app(config_class=Config):
+def create_app(config_class=Config, start_scheduler=True):
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     instance_path_abs = os.path.join(project_root, '..', 'instance')
     app = Flask(__name__, instance_relative_config=True, instance_path=instance_path_abs)
@@ -25,8 +31,13 @@ def create_app(config_class=Config):
          supports_credentials=True
     )
 
+    apply_engine_profile(app)
     db.init_app(app)
+    register_engine_events(app)
     ma.init_app(app)
+    init_cache(app)
+    init_principal_cache(app)
+    init_categorizer_cache(app)
 
     # Register blueprints with explicit prefixes
     for bp in all_blueprints:
@@ -43,6 +54,11 @@ def create_app(config_class=Config):
             app.register_blueprint(bp)
 
     register_error_handlers(app)
+    register_metrics(app)
+    register_cli_commands(app)
+    # Pod gunicornom s preloadom sa plánovač spúšťa až v jednom workeri (gunicorn.conf.py), nie v mastri
+    if start_scheduler:
+        start_report_scheduler(app)
     return app
 
 def register_cli_commands(app):
@@ -73,6 +89,7 @@ def register_cli_commands(app):
          print("Attempting to seed database...")
          with app.app_context():
              from .models import User, Expense, Income, Budget # Importuj všetky modely
+             from .services import SummaryService
              # Seeduj len ak je tabuľka User prázdna
              if User.query.first():
                   print("Database already contains users. Skipping seed.")
@@ -95,11 +112,93 @@ def register_cli_commands(app):
 
                  db.session.add_all([expense1, expense2, expense3, income1, budget1, budget2])
                  db.session.commit()
+                 SummaryService.rebuild(user_id=user1.id) # Seed obchádza služby, súhrny dopočítame
                  print("Database seeded successfully with user 'testuser' (pw: password) and sample data.")
              except Exception as e:
                  db.session.rollback()
                  print(f"Error seeding database: {e}")
 
+    @app.cli.command('seed-load')
+    @click.option('--users', default=10, show_default=True, help='Number of users to generate.')
+    @click.option('--expenses-per-user', default=1000, show_default=True, help='Expenses per user.')
+    @click.option('--years', default=2, show_default=True, help='Length of each ledger in years.')
+    @click.option('--seed', default=42, show_default=True, help='Random seed (same seed = same data).')
+    @click.option('--end-date', type=click.DateTime(formats=['%Y-%m-%d']), default=None, help='Last day of the generated ledgers (default: today).')
+    @click.option('--workers', default=1, show_default=True, help='Processes to spread users across.')
+    def seed_load_command(users, expenses_per_user, years, seed, end_date, workers):
+        import datetime
+        from .utils.seed_utils import seed_load
+        end_date = end_date.date() if end_date else datetime.date.today()
+        print(f"Generating {users} users x {expenses_per_user} expenses over {years} years (seed {seed}, {workers} workers)...")
+        totals = seed_load(app.config['SQLALCHEMY_DATABASE_URI'], users, expenses_per_user, years, seed, end_date, workers)
+        rows = totals['expenses'] + totals['incomes'] + totals['budgets']
+        print(f"Inserted {totals['users']} users, {totals['expenses']} expenses, {totals['incomes']} incomes, "
+              f"{totals['budgets']} budgets in {totals['seconds']:.1f}s ({rows / max(totals['seconds'], 1e-9):.0f} rows/s).")
+        print("All generated users share the password 'password' (usernames loaduser0, loaduser1, ...).")
+
+    @app.cli.command('precompute-reports')
+    @click.option('--workers', default=1, show_default=True, help='Processes to spread users across.')
+    @click.option('--active-days', default=None, type=int, help='Only users with activity in this many days (default: REPORT_ACTIVE_DAYS).')
+    def precompute_reports_command(workers, active_days):
+        from .utils.precompute_utils import precompute_reports
+        active_days = active_days or app.config.get('REPORT_ACTIVE_DAYS', 90)
+        print(f"Precomputing reports for users active in the last {active_days} days ({workers} workers)...")
+        totals = precompute_reports(app.config['SQLALCHEMY_DATABASE_URI'], workers=workers, active_days=active_days)
+        print(f"Stored {totals['reports']} reports for {totals['users']} users in {totals['seconds']:.1f}s"
+              + (f", {totals['failed']} users failed." if totals['failed'] else "."))
+        if totals['failed']:
+            raise SystemExit(1)
+
+    @app.cli.command('run-jobs')
+    @click.option('--threads', default=None, type=int, help='Worker threads (default: JOB_WORKER_THREADS, at least 1).')
+    def run_jobs_command(threads):
+        import time
+        from .utils.job_utils import JobWorkerPool
+        threads = threads or max(app.config.get('JOB_WORKER_THREADS', 2), 1)
+        pool = JobWorkerPool(app, threads).start()
+        print("Processing background jobs, press Ctrl+C to stop.")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pool.stop()
+            print("Stopping job workers (running jobs are requeued after JOB_STALE_SECONDS).")
+
+    @app.cli.command('rebuild-summaries')
+    @click.option('--check', is_flag=True, help='Only compare monthly_summary with the raw data and report drift.')
+    @click.option('--user-id', type=int, default=None, help='Limit to a single user.')
+    def rebuild_summaries_command(check, user_id):
+        from .services import SummaryService, SummaryServiceError
+        if check:
+            drift = SummaryService.find_drift(user_id=user_id)
+            if not drift:
+                print("Monthly summaries are consistent with expenses and incomes.")
+                return
+            print(f"Found {len(drift)} drifting monthly summary rows:")
+            for row in drift:
+                print(f"  user {row['user_id']} {row['kind']:7s} {row['month']:02d}/{row['year']} "
+                      f"{row['category'] or '-'} / {row['rule_category'] or '-'}: "
+                      f"expected {row['expected_cents'] / 100:.2f} ({row['expected_count']}), "
+                      f"stored {row['actual_cents'] / 100:.2f} ({row['actual_count']})")
+            raise SystemExit(1)
+        try:
+            SummaryService.rebuild(user_id=user_id)
+            print("Monthly summaries rebuilt successfully.")
+        except SummaryServiceError as e:
+            print(f"Error rebuilding monthly summaries: {e}")
+            raise SystemExit(1)
+
+    @app.cli.command('rebuild-search-index')
+    def rebuild_search_index_command():
+        from .models import Expense, Income
+        from .utils.search_utils import rebuild_fts_index
+        if db.engine.dialect.name != 'sqlite':
+            print("Full-text index is only used with SQLite, other databases search with LIKE.")
+            return
+        for model in (Expense, Income):
+            rebuild_fts_index(model.__table__)
+        print("Search index rebuilt for expenses and incomes.")
+
     @app.cli.command('list-routes')
     def list_routes_command():
         import urllib
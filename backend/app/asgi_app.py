@@ -0,0 +1,97 @@
+# backend/app/asgi_app.py
+import io
+import sys
+from urllib.parse import parse_qs
+from flask import jsonify
+from .database import init_async_engine
+from .metrics import register_engine_metrics
+from .routes.async_report_routes import async_routes
+
+def _build_environ(scope):
+    """WSGI environ pre GET/HEAD požiadavku bez tela, aby korutína mohla bežať v request kontexte Flasku."""
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf8').decode('latin1'),
+        'PATH_INFO': scope['path'].encode('utf8').decode('latin1'),
+        'QUERY_STRING': scope['query_string'].decode('latin1'),
+        'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+        'SERVER_NAME': scope['server'][0] if scope.get('server') else 'localhost',
+        'SERVER_PORT': str(scope['server'][1]) if scope.get('server') else '80',
+        'REMOTE_ADDR': scope['client'][0] if scope.get('client') else '',
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(b''),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope['headers']:
+        name = name.decode('latin1')
+        key = name.upper().replace('-', '_') if name in ('content-type', 'content-length') else 'HTTP_' + name.upper().replace('-', '_')
+        value = value.decode('latin1')
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+class AsyncReportApp:
+    """
+    ASGI aplikácia: GET na prehľadoch (async_routes) beží ako korutína nad async enginom,
+    takže jeden worker drží veľa pomalých požiadaviek bez vlákna na každú. Ostatné požiadavky
+    (a prehľady mimo podmienky trasy) obslúži pôvodná Flask aplikácia cez WsgiToAsgi v poole vlákien.
+    Korutína beží v request kontexte Flasku: funguje request, g, jsonify aj after_request (CORS, metriky).
+    """
+
+    def __init__(self, flask_app):
+        from asgiref.wsgi import WsgiToAsgi
+        self.flask_app = flask_app
+        self.wsgi = WsgiToAsgi(flask_app)
+        self.engine = init_async_engine(flask_app)
+        if 'finapp_metrics' in flask_app.extensions:
+            register_engine_metrics(self.engine.sync_engine)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self._lifespan(receive, send)
+        if scope['type'] == 'http' and scope['method'] in ('GET', 'HEAD'):
+            path, root_path = scope['path'], scope.get('root_path', '')
+            route = async_routes.get(path[len(root_path):] if root_path and path.startswith(root_path) else path)
+            if route is not None and route[1](self.flask_app, parse_qs(scope['query_string'].decode('latin1'))):
+                return await self._handle(route[0], scope, send)
+        return await self.wsgi(scope, receive, send)
+
+    async def _handle(self, view, scope, send):
+        app = self.flask_app
+        ctx = app.request_context(_build_environ(scope))
+        ctx.push()
+        error = None
+        try:
+            try:
+                response = app.preprocess_request()
+                if response is None:
+                    response = await view()
+            except Exception as e:
+                error = e
+                print(f"Unexpected error in async route {scope['path']}: {e}")
+                response = (jsonify({"error": "Internal server error"}), 500)
+            response = app.process_response(app.make_response(response))
+            body = b'' if scope['method'] == 'HEAD' else response.get_data()
+        finally:
+            ctx.pop(error)
+        await send({
+            'type': 'http.response.start',
+            'status': response.status_code,
+            'headers': [(name.lower().encode('latin1'), value.encode('latin1')) for name, value in response.headers.to_wsgi_list()],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.engine.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+def create_asgi_app(flask_app):
+    return AsyncReportApp(flask_app)
@@ -6,15 +6,16 @@ from dotenv import load_dotenv
 dotenv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env')
 flask_dotenv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.flaskenv')
 
-# Skús načítať .flaskenv prioritne, potom .env
+# Skús načítať .flaskenv prioritne, potom .env. Bez výpisov: modul sa importuje v každom procese
+# (CLI, benchmarky, master aj workery servera), hlási ho až run.py / gunicorn.conf.py.
 if os.path.exists(flask_dotenv_path):
     load_dotenv(dotenv_path=flask_dotenv_path, override=True) # override=True zabezpečí, že .flaskenv prepíše .env
-    print(f".flaskenv loaded from: {flask_dotenv_path}")
+    LOADED_ENV_FILE = flask_dotenv_path
 elif os.path.exists(dotenv_path):
-     load_dotenv(dotenv_path=dotenv_path)
-     print(f".env loaded from: {dotenv_path}")
+    load_dotenv(dotenv_path=dotenv_path)
+    LOADED_ENV_FILE = dotenv_path
 else:
-    print(f"No .env or .flaskenv file found in project root.")
+    LOADED_ENV_FILE = None
 
 
 # Absolútna cesta k priečinku, kde je tento config.py (t.j. backend/app)
@@ -32,13 +33,68 @@ class Config:
         'sqlite:///' + os.path.join(instance_path, 'tracker.db')
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Profil enginu: 'auto' (podľa URI), 'sqlite' (WAL + PRAGMA), 'server' (pool pre Postgres/MySQL), 'none'
+    DB_ENGINE_PROFILE = os.environ.get('DB_ENGINE_PROFILE', 'auto')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+    SQLITE_CACHE_SIZE_KB = int(os.environ.get('SQLITE_CACHE_SIZE_KB', 64 * 1024))
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 20))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes')
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'velmi-tajny-jwt-kluc-zmen-v-produkcii!'
     # Voliteľné: Ako dlho má token platiť (napr. 1 hodina)
     JWT_ACCESS_TOKEN_EXPIRES_SECONDS = int(os.environ.get('JWT_ACCESS_TOKEN_EXPIRES_SECONDS', 3600)) # 1 
+    # Cache overených používateľov pre @token_required (TTL = max. oneskorenie odvolania tokenu v inom workeri)
+    PRINCIPAL_CACHE_MAX_ENTRIES = int(os.environ.get('PRINCIPAL_CACHE_MAX_ENTRIES', 4096))
+    PRINCIPAL_CACHE_TTL_SECONDS = int(os.environ.get('PRINCIPAL_CACHE_TTL_SECONDS', 60))
+    # Cache skompilovaných pravidiel kategorizácie (kľúč obsahuje User.rules_version, TTL len uvoľňuje pamäť)
+    CATEGORIZER_CACHE_MAX_ENTRIES = int(os.environ.get('CATEGORIZER_CACHE_MAX_ENTRIES', 1024))
+    CATEGORIZER_CACHE_TTL_SECONDS = int(os.environ.get('CATEGORIZER_CACHE_TTL_SECONDS', 3600))
+    # Cache prehľadov: 'memory' (LRU v procese), 'null' alebo 'modul:Trieda' s rozhraním CacheBackend
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'memory')
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 1024))
+    CACHE_TTL_SECONDS = int(os.environ.get('CACHE_TTL_SECONDS', 300))
+    # ETag / 304 pre zoznamy a prehľady (odvodené z User.data_version)
+    ETAGS_ENABLED = os.environ.get('ETAGS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    # Zoznamy výdavkov, príjmov a rozpočtov kódované priamo z n-tíc (výstup zhodný so schémami)
+    FAST_SERIALIZATION_ENABLED = os.environ.get('FAST_SERIALIZATION_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    # Nočný prepočet prehľadov do report_cache: čas 'HH:MM' (UTC) pre plánovač v procese, prázdne = vypnuté
+    REPORT_PRECOMPUTE_AT = os.environ.get('REPORT_PRECOMPUTE_AT', '')
+    REPORT_PRECOMPUTE_WORKERS = int(os.environ.get('REPORT_PRECOMPUTE_WORKERS', 1))
+    REPORT_ACTIVE_DAYS = int(os.environ.get('REPORT_ACTIVE_DAYS', 90))
+    # Úlohy na pozadí (/api/jobs): vlákna v procese servera (0 = len flask run-jobs), fronta je tabuľka job
+    JOB_WORKER_THREADS = int(os.environ.get('JOB_WORKER_THREADS', 2))
+    JOB_POLL_SECONDS = float(os.environ.get('JOB_POLL_SECONDS', 2.0))
+    JOB_MAX_ACTIVE_PER_USER = int(os.environ.get('JOB_MAX_ACTIVE_PER_USER', 3))
+    JOB_STALE_SECONDS = int(os.environ.get('JOB_STALE_SECONDS', 600))
+    JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', 2))
+    JOB_RESULT_RETENTION_DAYS = int(os.environ.get('JOB_RESULT_RETENTION_DAYS', 7))
+    JOB_RESULTS_DIR = os.environ.get('JOB_RESULTS_DIR') or os.path.join(instance_path, 'job_results')
+    # Produkčný server (gunicorn.conf.py): 0 = podľa počtu CPU, WEB_CONCURRENCY má prednosť
+    WEB_WORKERS = int(os.environ.get('WEB_CONCURRENCY') or os.environ.get('WEB_WORKERS', 0))
+    WEB_MAX_WORKERS = int(os.environ.get('WEB_MAX_WORKERS', 16))
+    WEB_THREADS = int(os.environ.get('WEB_THREADS', 0))
+    # Načítanie a zahriatie aplikácie raz v master procese pred forkom workerov
+    WEB_PRELOAD = os.environ.get('WEB_PRELOAD', 'true').lower() in ('1', 'true', 'yes')
+    WEB_WARMUP = os.environ.get('WEB_WARMUP', 'true').lower() in ('1', 'true', 'yes')
+    # Worker sa po toľkých požiadavkách (+ náhodný rozptyl) vymení za nový, s preloadom je to lacné
+    WEB_MAX_REQUESTS = int(os.environ.get('WEB_MAX_REQUESTS', 5000))
+    WEB_TIMEOUT = int(os.environ.get('WEB_TIMEOUT', 60))
+    WEB_GRACEFUL_TIMEOUT = int(os.environ.get('WEB_GRACEFUL_TIMEOUT', 30))
+    # ASGI režim (asgi.py): async ovládač pre tú istú DB, prázdne = odvodí sa z DATABASE_URL (sqlite+aiosqlite, postgresql+asyncpg)
+    ASYNC_DATABASE_URL = os.environ.get('ASYNC_DATABASE_URL', '')
+    # Pool async enginu (jeden na worker) a koľko spojení si z neho naraz vezme jedna požiadavka:
+    # (pool + overflow) / súbežnosť = počet prehľadov, ktoré bežia bez čakania na spojenie
+    ASYNC_DB_POOL_SIZE = int(os.environ.get('ASYNC_DB_POOL_SIZE', 20))
+    ASYNC_DB_MAX_OVERFLOW = int(os.environ.get('ASYNC_DB_MAX_OVERFLOW', 10))
+    ASYNC_QUERY_CONCURRENCY = int(os.environ.get('ASYNC_QUERY_CONCURRENCY', 3))
+    # Metriky latencie a SQL na /api/metrics (formát Prometheus)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
     # Zaistenie existencie 'instance' priečinka (Flask to vie urobiť sám, ale istota je istota)
     if not os.path.exists(instance_path):
         try:
-            os.makedirs(instance_path)
-            print(f"Created instance directory: {instance_path}")
+            os.makedirs(instance_path, exist_ok=True)
         except OSError as e:
             print(f"Error creating instance directory {instance_path}: {e}")
\ No newline at end of file
@@ -1,6 +1,110 @@
 # backend/app/database.py
 from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 
 db = SQLAlchemy()
-ma = Marshmallow()
\ No newline at end of file
+ma = Marshmallow()
+
+ENGINE_PROFILES = ('auto', 'sqlite', 'server', 'none')
+
+def resolve_engine_profile(app):
+    profile = app.config.get('DB_ENGINE_PROFILE', 'auto')
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown DB_ENGINE_PROFILE '{profile}', expected one of: {', '.join(ENGINE_PROFILES)}")
+    if profile == 'auto':
+        profile = 'sqlite' if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite') else 'server'
+    return profile
+
+def apply_engine_profile(app):
+    """
+    Doplní SQLALCHEMY_ENGINE_OPTIONS podľa profilu. Volá sa pred db.init_app,
+    explicitne nastavené SQLALCHEMY_ENGINE_OPTIONS majú prednosť.
+    """
+    profile = resolve_engine_profile(app)
+    app.config['DB_ENGINE_PROFILE_ACTIVE'] = profile
+    options = {}
+    if profile == 'server':
+        options = {
+            'pool_size': app.config.get('DB_POOL_SIZE', 10),
+            'max_overflow': app.config.get('DB_MAX_OVERFLOW', 20),
+            'pool_timeout': app.config.get('DB_POOL_TIMEOUT', 30),
+            'pool_recycle': app.config.get('DB_POOL_RECYCLE', 1800),
+            'pool_pre_ping': app.config.get('DB_POOL_PRE_PING', True),
+        }
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+def _sqlite_pragmas(app):
+    return (
+        # WAL: čitatelia neblokujú zapisovateľa a naopak
+        ('journal_mode', app.config.get('SQLITE_JOURNAL_MODE', 'WAL')),
+        # Pri WAL je NORMAL bezpečné (commit prežije pád aplikácie, nie výpadok napájania)
+        ('synchronous', app.config.get('SQLITE_SYNCHRONOUS', 'NORMAL')),
+        # Namiesto okamžitého "database is locked" počkaj na zámok
+        ('busy_timeout', app.config.get('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+        ('mmap_size', app.config.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        # Záporná hodnota = veľkosť v KiB
+        ('cache_size', -abs(app.config.get('SQLITE_CACHE_SIZE_KB', 64 * 1024))),
+        ('temp_store', 'MEMORY'),
+    )
+
+def _sqlite_pragma_listener(app):
+    pragmas = _sqlite_pragmas(app)
+
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+    return set_sqlite_pragmas
+
+def register_engine_events(app):
+    """Po db.init_app: pre SQLite profil nastaví PRAGMA na každom novom spojení."""
+    if app.config.get('DB_ENGINE_PROFILE_ACTIVE') != 'sqlite':
+        return
+    with app.app_context():
+        event.listen(db.engine, 'connect', _sqlite_pragma_listener(app))
+
+# --- Async engine pre ASGI režim (app/asgi_app.py) ---
+# Synchrónny ovládač z URI -> async ovládač pre tú istú databázu
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+    'postgresql+psycopg2': 'postgresql+asyncpg',
+    'mysql': 'mysql+aiomysql',
+    'mysql+pymysql': 'mysql+aiomysql',
+}
+
+def async_database_uri(uri):
+    scheme, separator, rest = uri.partition('://')
+    if scheme not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver known for '{scheme}', set ASYNC_DATABASE_URL explicitly")
+    return ASYNC_DRIVERS[scheme] + separator + rest
+
+def init_async_engine(app):
+    """
+    Vytvorí async engine nad tou istou databázou (rovnaké PRAGMA, timeout a recyklácia spojení)
+    a uloží ho do app.extensions. Veľkosť poolu je vlastná (ASYNC_DB_POOL_SIZE), lebo jeden worker
+    obsluhuje naraz veľa požiadaviek a každá si berie viac spojení.
+    Potrebuje SQLAlchemy[asyncio] a async ovládač (aiosqlite, asyncpg).
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+    uri = app.config.get('ASYNC_DATABASE_URL') or async_database_uri(app.config['SQLALCHEMY_DATABASE_URI'])
+    options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    # SQLite v pamäti používa StaticPool (jedno spojenie), ten veľkosť poolu nepozná
+    if make_url(uri).database not in (None, '', ':memory:'):
+        options['pool_size'] = app.config.get('ASYNC_DB_POOL_SIZE', 20)
+        options['max_overflow'] = app.config.get('ASYNC_DB_MAX_OVERFLOW', 10)
+    engine = create_async_engine(uri, **options)
+    if app.config.get('DB_ENGINE_PROFILE_ACTIVE') == 'sqlite':
+        event.listen(engine.sync_engine, 'connect', _sqlite_pragma_listener(app))
+    app.extensions['finapp_async_engine'] = engine
+    return engine
+
+def get_async_engine():
+    return current_app.extensions['finapp_async_engine']
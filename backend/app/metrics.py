@@ -0,0 +1,124 @@
+# backend/app/metrics.py
+import threading
+import time
+from collections import defaultdict
+from flask import g, request, has_request_context, Response
+from sqlalchemy import event
+from .database import db
+
+# Hranice histogramu latencie v sekundách
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class MetricsRegistry:
+    """Metriky požiadaviek a SQL v rámci jedného procesu (každý worker má vlastné)."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.latency_buckets = defaultdict(lambda: [0] * len(self.buckets))
+        self.latency_sum = defaultdict(float)
+        self.latency_count = defaultdict(int)
+        self.requests = defaultdict(int)
+        self.sql_statements = defaultdict(int)
+        self.sql_seconds = defaultdict(float)
+
+    def observe_request(self, endpoint, method, status, duration, sql_statements, sql_seconds):
+        with self._lock:
+            for index, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    self.latency_buckets[endpoint][index] += 1
+            self.latency_sum[endpoint] += duration
+            self.latency_count[endpoint] += 1
+            self.requests[(endpoint, method, status)] += 1
+            self.sql_statements[endpoint] += sql_statements
+            self.sql_seconds[endpoint] += sql_seconds
+
+    def render(self, extra_lines=()):
+        """Výstup v textovom formáte Prometheus."""
+        lines = []
+        with self._lock:
+            lines += ["# HELP finapp_request_duration_seconds Request latency per endpoint.",
+                      "# TYPE finapp_request_duration_seconds histogram"]
+            for endpoint in sorted(self.latency_count):
+                for bound, count in zip(self.buckets, self.latency_buckets[endpoint]):
+                    lines.append(f'finapp_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {count}')
+                lines.append(f'finapp_request_duration_seconds_bucket{{endpoint="{endpoint}",le="+Inf"}} {self.latency_count[endpoint]}')
+                lines.append(f'finapp_request_duration_seconds_sum{{endpoint="{endpoint}"}} {self.latency_sum[endpoint]:.6f}')
+                lines.append(f'finapp_request_duration_seconds_count{{endpoint="{endpoint}"}} {self.latency_count[endpoint]}')
+
+            lines += ["# HELP finapp_requests_total Requests per endpoint, method and status code.",
+                      "# TYPE finapp_requests_total counter"]
+            for (endpoint, method, status), count in sorted(self.requests.items()):
+                lines.append(f'finapp_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {count}')
+
+            lines += ["# HELP finapp_sql_statements_total SQL statements executed while serving an endpoint.",
+                      "# TYPE finapp_sql_statements_total counter"]
+            for endpoint in sorted(self.sql_statements):
+                lines.append(f'finapp_sql_statements_total{{endpoint="{endpoint}"}} {self.sql_statements[endpoint]}')
+
+            lines += ["# HELP finapp_sql_duration_seconds_total Time spent in the database per endpoint.",
+                      "# TYPE finapp_sql_duration_seconds_total counter"]
+            for endpoint in sorted(self.sql_seconds):
+                lines.append(f'finapp_sql_duration_seconds_total{{endpoint="{endpoint}"}} {self.sql_seconds[endpoint]:.6f}')
+        lines += list(extra_lines)
+        return "\n".join(lines) + "\n"
+
+def _cache_metric_lines(app):
+    cache = app.extensions.get('finapp_cache')
+    if cache is None:
+        return []
+    stats = cache.stats()
+    lines = []
+    for name in ('hits', 'misses', 'evictions'):
+        lines += [f"# TYPE finapp_cache_{name}_total counter", f"finapp_cache_{name}_total {stats[name]}"]
+    lines += ["# TYPE finapp_cache_entries gauge", f"finapp_cache_entries {stats['size']}"]
+    return lines
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('finapp_query_start', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info['finapp_query_start'].pop()
+    if has_request_context() and 'metrics_sql_count' in g:
+        g.metrics_sql_count += 1
+        g.metrics_sql_seconds += time.perf_counter() - started
+
+def register_engine_metrics(engine):
+    """Počítanie SQL do metrík požiadavky, aj pre async engine (cez jeho sync_engine)."""
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+def register_metrics(app):
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+    registry = MetricsRegistry()
+    app.extensions['finapp_metrics'] = registry
+
+    with app.app_context():
+        register_engine_metrics(db.engine)
+
+    @app.before_request
+    def start_request_timer():
+        g.metrics_start = time.perf_counter()
+        g.metrics_sql_count = 0
+        g.metrics_sql_seconds = 0.0
+
+    @app.after_request
+    def record_request_metrics(response):
+        if 'metrics_start' not in g:
+            return response
+        duration = time.perf_counter() - g.metrics_start
+        registry.observe_request(
+            request.endpoint or 'unmatched', request.method, response.status_code,
+            duration, g.metrics_sql_count, g.metrics_sql_seconds
+        )
+        if app.debug:
+            response.headers['Server-Timing'] = (
+                f"app;dur={duration * 1000:.1f}, db;dur={g.metrics_sql_seconds * 1000:.1f};desc=\"{g.metrics_sql_count} queries\""
+            )
+        return response
+
+    def metrics_view():
+        return Response(registry.render(_cache_metric_lines(app)), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+    app.add_url_rule('/api/metrics', 'metrics', metrics_view, methods=['GET'])
@@ -3,4 +3,8 @@ from .expense import Expense
 from .income import Income
 from .budget import Budget
 from .user import User
-from .weekly_focus import WeeklyFocus
\ No newline at end of file
+from .weekly_focus import WeeklyFocus
+from .monthly_summary import MonthlySummary
+from .report_cache import ReportCache
+from .job import Job
+from .category_rule import CategoryRule
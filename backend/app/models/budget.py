@@ -1,12 +1,14 @@
 # backend/app/models/budget.py
 from ..database import db
+from ..utils.money_utils import money_property
 from sqlalchemy import UniqueConstraint
 
 class Budget(db.Model):
     __tablename__ = 'budget'
     id = db.Column(db.Integer, primary_key=True)
     category = db.Column(db.String(50), nullable=False)
-    amount = db.Column(db.Float, nullable=False)
+    amount_cents = db.Column(db.Integer, nullable=False) # Suma v centoch
+    amount = money_property('amount_cents')
     month = db.Column(db.Integer, nullable=False)
     year = db.Column(db.Integer, nullable=False)
     # Cudzí kľúč
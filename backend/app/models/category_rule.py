@@ -0,0 +1,24 @@
+# backend/app/models/category_rule.py
+from ..database import db
+from sqlalchemy import UniqueConstraint
+from datetime import datetime, timezone
+
+class CategoryRule(db.Model):
+    """
+    Pravidlo automatickej kategorizácie výdavkov: ak popis obsahuje `pattern`
+    (bez ohľadu na veľkosť písmen a diakritiku), doplní sa category a/alebo rule_category.
+    """
+    __tablename__ = 'category_rule'
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+    pattern = db.Column(db.String(100), nullable=False)
+    match_type = db.Column(db.String(10), nullable=False, default='contains') # 'contains' alebo 'word' (celé slovo)
+    category = db.Column(db.String(50), nullable=True)
+    rule_category = db.Column(db.String(10), nullable=True)
+    priority = db.Column(db.Integer, nullable=False, default=0) # vyššia vyhráva pri viacerých zhodách
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (UniqueConstraint('user_id', 'pattern', 'match_type', name='uq_category_rule_pattern'),)
+
+    def __repr__(self):
+        return f'<CategoryRule {self.id}: {self.pattern!r} -> {self.category}/{self.rule_category} by User {self.user_id}>'
@@ -1,17 +1,32 @@
 # backend/app/models/expense.py
 from ..database import db
+from ..utils.money_utils import money_property
+from ..utils.search_utils import register_fts_index
 from datetime import datetime, timezone
 
 class Expense(db.Model):
     __tablename__ = 'expense'
     id = db.Column(db.Integer, primary_key=True)
     description = db.Column(db.String(200), nullable=False)
-    amount = db.Column(db.Float, nullable=False)
+    amount_cents = db.Column(db.Integer, nullable=False) # Suma v centoch
+    amount = money_property('amount_cents')
     category = db.Column(db.String(50), nullable=True, default='Nezaradené')
     date_created = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     rule_category = db.Column(db.String(10), nullable=True) # Pre 50/30/20 pravidlo
     # Cudzí kľúč - MAL BY TU UŽ BYŤ
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
 
+    # Mesačné a týždenné prehľady filtrujú podľa používateľa a rozsahu dátumov,
+    # zoznam aj podľa kategórie / rule_category (zoradené podľa dátumu) a zoraďuje podľa sumy
+    __table_args__ = (
+        db.Index('ix_expense_user_id_date_created', 'user_id', 'date_created'),
+        db.Index('ix_expense_user_id_category_date_created', 'user_id', 'category', 'date_created'),
+        db.Index('ix_expense_user_id_rule_category_date_created', 'user_id', 'rule_category', 'date_created'),
+        db.Index('ix_expense_user_id_amount_cents', 'user_id', 'amount_cents'),
+    )
+
     def __repr__(self):
-        return f'<Expense {self.id}: {self.description} by User {self.user_id}>'
\ No newline at end of file
+        return f'<Expense {self.id}: {self.description} by User {self.user_id}>'
+
+# Fulltextové vyhľadávanie (SQLite FTS5), index udržiavajú triggre
+register_fts_index(Expense.__table__, 'expense_fts', ('description', 'category'))
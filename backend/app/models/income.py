@@ -1,16 +1,30 @@
 # backend/app/models/income.py
 from ..database import db
+from ..utils.money_utils import money_property
+from ..utils.search_utils import register_fts_index
 from datetime import datetime, timezone
 
 class Income(db.Model):
     __tablename__ = 'income'
     id = db.Column(db.Integer, primary_key=True)
     description = db.Column(db.String(200), nullable=False)
-    amount = db.Column(db.Float, nullable=False)
+    amount_cents = db.Column(db.Integer, nullable=False) # Suma v centoch
+    amount = money_property('amount_cents')
     source = db.Column(db.String(100), nullable=True, default='Neznámy zdroj')
     date_created = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     # Cudzí kľúč
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False) # Nové
 
+    # Mesačné a týždenné prehľady filtrujú podľa používateľa a rozsahu dátumov,
+    # zoznam aj podľa zdroja (zoradené podľa dátumu) a zoraďuje podľa sumy
+    __table_args__ = (
+        db.Index('ix_income_user_id_date_created', 'user_id', 'date_created'),
+        db.Index('ix_income_user_id_source_date_created', 'user_id', 'source', 'date_created'),
+        db.Index('ix_income_user_id_amount_cents', 'user_id', 'amount_cents'),
+    )
+
     def __repr__(self):
-        return f'<Income {self.id}: {self.description} for User {self.user_id}>'
\ No newline at end of file
+        return f'<Income {self.id}: {self.description} for User {self.user_id}>'
+
+# Fulltextové vyhľadávanie (SQLite FTS5), index udržiavajú triggre
+register_fts_index(Income.__table__, 'income_fts', ('description', 'source'))
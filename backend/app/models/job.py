@@ -0,0 +1,39 @@
+# backend/app/models/job.py
+from ..database import db
+from datetime import datetime, timezone
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+
+class Job(db.Model):
+    """
+    Fronta úloh na pozadí (exporty, ročný prehľad, prepočty). Workery si úlohu
+    zoberú podmieneným UPDATE status='queued' -> 'running', takže netreba broker.
+    Výsledok je súbor v JOB_RESULTS_DIR, v tabuľke je len jeho názov a typ.
+    """
+    __tablename__ = 'job'
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    kind = db.Column(db.String(50), nullable=False) # napr. 'export_expenses', 'yearly_review'
+    params = db.Column(db.Text, nullable=False, default='{}') # JSON parametrov
+    status = db.Column(db.String(10), nullable=False, default=JOB_QUEUED)
+    progress = db.Column(db.Integer, nullable=False, default=0) # 0 - 100
+    message = db.Column(db.String(255), nullable=True) # posledný krok alebo chyba
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    result_filename = db.Column(db.String(100), nullable=True)
+    result_content_type = db.Column(db.String(100), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    started_at = db.Column(db.DateTime, nullable=True)
+    heartbeat_at = db.Column(db.DateTime, nullable=True) # posledný zápis priebehu, podľa neho sa hľadajú zaseknuté úlohy
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    # Worker hľadá najstaršiu čakajúcu úlohu, používateľ svoje posledné úlohy
+    __table_args__ = (
+        db.Index('ix_job_status_id', 'status', 'id'),
+        db.Index('ix_job_user_id_created_at', 'user_id', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f'<Job {self.id}: {self.kind} {self.status} {self.progress}% by User {self.user_id}>'
@@ -0,0 +1,25 @@
+# backend/app/models/monthly_summary.py
+from ..database import db
+from sqlalchemy import UniqueConstraint
+
+class MonthlySummary(db.Model):
+    """
+    Priebežne udržiavané mesačné súčty výdavkov a príjmov.
+    Prázdna kategória / rule_category sa ukladá ako '' (NULL by rozbil unikátny kľúč).
+    Pri príjmoch je v 'category' uložený zdroj (source).
+    """
+    __tablename__ = 'monthly_summary'
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    kind = db.Column(db.String(10), nullable=False) # 'expense' alebo 'income'
+    year = db.Column(db.Integer, nullable=False)
+    month = db.Column(db.Integer, nullable=False)
+    category = db.Column(db.String(100), nullable=False, default='')
+    rule_category = db.Column(db.String(10), nullable=False, default='')
+    total_cents = db.Column(db.BigInteger, nullable=False, default=0)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (UniqueConstraint('user_id', 'kind', 'year', 'month', 'category', 'rule_category', name='uq_monthly_summary_key'),)
+
+    def __repr__(self):
+        return f'<MonthlySummary User {self.user_id} {self.kind} {self.month}/{self.year} {self.category}/{self.rule_category}: {self.total_cents} ({self.count})>'
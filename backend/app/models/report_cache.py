@@ -0,0 +1,23 @@
+# backend/app/models/report_cache.py
+from ..database import db
+from sqlalchemy import UniqueConstraint
+from datetime import datetime, timezone
+
+class ReportCache(db.Model):
+    """
+    Predpočítané prehľady (flask precompute-reports). Záznam platí, kým sa
+    data_version zhoduje s User.data_version, inak sa prehľad počíta naživo.
+    """
+    __tablename__ = 'report_cache'
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    name = db.Column(db.String(50), nullable=False) # napr. 'weekly_snapshot', 'budget_status'
+    params = db.Column(db.String(100), nullable=False) # JSON parametrov, rovnaký ako kľúč v CacheService
+    data_version = db.Column(db.Integer, nullable=False)
+    payload = db.Column(db.Text, nullable=False) # JSON výsledku
+    computed_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (UniqueConstraint('user_id', 'name', 'params', name='uq_report_cache_key'),)
+
+    def __repr__(self):
+        return f'<ReportCache User {self.user_id} {self.name} {self.params} v{self.data_version}>'
@@ -10,6 +10,12 @@ class User(db.Model):
     email = db.Column(db.String(120), unique=True, nullable=False)
     password_hash = db.Column(db.String(256), nullable=False)
     date_registered = db.Column(db.DateTime, nullable=False, default=datetime.datetime.now(datetime.timezone.utc))
+    # Zvyšuje sa pri každej zmene dát používateľa, slúži ako kľúč pre cache prehľadov
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Súčasť JWT ('ver'), zvýšením sa zneplatnia všetky skôr vydané tokeny
+    token_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Zvyšuje sa pri zmene pravidiel kategorizácie, kľúč pre cache skompilovaného automatu
+    rules_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     # Relationships
     expenses = db.relationship('Expense', backref='author', lazy='dynamic', cascade="all, delete-orphan")
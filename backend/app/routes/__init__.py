@@ -4,6 +4,9 @@ from .budget_routes import budget_bp
 from .base_routes import base_bp
 from .auth_routes import auth_bp
 from .report_routes import report_bp
+from .dashboard_routes import dashboard_bp
+from .job_routes import job_bp
+from .category_rule_routes import category_rule_bp
 
 all_blueprints = (
     expense_bp,
@@ -12,4 +15,7 @@ all_blueprints = (
     base_bp,
     auth_bp,
     report_bp,
+    dashboard_bp,
+    job_bp,
+    category_rule_bp,
 )
\ No newline at end of file
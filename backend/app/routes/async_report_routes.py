@@ -0,0 +1,84 @@
+# backend/app/routes/async_report_routes.py
+"""
+Korutíny pre ASGI režim (app/asgi_app.py). Obsluhujú GET na rovnakých URL ako synchrónne
+blueprinty a vracajú rovnaké odpovede, všetko ostatné ide naďalej cez Flask (WSGI).
+"""
+from flask import request, jsonify, g
+from ..services import AsyncReportService, BudgetServiceError, DashboardServiceError
+from ..services.report_service import SNAPSHOT_DEFAULT_DAYS, SNAPSHOT_ALLOWED_DAYS
+from ..utils.auth_utils import async_token_required
+from ..utils.etag_utils import async_conditional_get
+from datetime import datetime
+
+# cesta -> (korutína, podmienka nad (app, args)); ak podmienka neplatí, požiadavku obslúži synchrónny Flask
+async_routes = {}
+
+def async_route(path, when=None):
+    def decorator(f):
+        async_routes[path] = (f, when or (lambda app, args: True))
+        return f
+    return decorator
+
+@async_route('/api/reports/weekly-snapshot')
+@async_token_required
+@async_conditional_get('weekly_snapshot')
+async def get_weekly_snapshot_async():
+    user_id = g.current_user.id
+    try:
+        days = int(request.args.get('days', SNAPSHOT_DEFAULT_DAYS))
+    except ValueError: days = None
+    if days not in SNAPSHOT_ALLOWED_DAYS:
+        return jsonify({"error": "Invalid days", "message": f"Allowed values: {', '.join(map(str, SNAPSHOT_ALLOWED_DAYS))}"}), 400
+    snapshot = await AsyncReportService.get_weekly_snapshot(user_id, days=days)
+    if isinstance(snapshot, dict) and snapshot.get("error"):
+        return jsonify({"error": snapshot["error"]}), 500
+    return jsonify(snapshot), 200
+
+# Rozsah mesiacov (?from=&to=) zostáva na synchrónnej ceste
+@async_route('/api/budget-status', when=lambda app, args: 'from' not in args and 'to' not in args)
+@async_token_required
+@async_conditional_get('budget_status')
+async def get_budget_status_async():
+    user_id = g.current_user.id
+    try:
+        year = int(request.args.get('year', datetime.now().year))
+        month = int(request.args.get('month', datetime.now().month))
+    except ValueError: return jsonify({"error": "Invalid year or month"}), 400
+    if not 1 <= month <= 12: return jsonify({"error": "Invalid year or month"}), 400
+    try:
+        status = await AsyncReportService.get_budget_status_for_month(year, month, user_id=user_id)
+        return jsonify(status), 200
+    except BudgetServiceError as e: return jsonify({"error": str(e)}), 500
+
+@async_route('/api/budget-rules-status')
+@async_token_required
+async def get_rules_status_async():
+    user_id = g.current_user.id
+    try:
+        year = int(request.args.get('year', datetime.now().year))
+        month = int(request.args.get('month', datetime.now().month))
+    except ValueError: return jsonify({"error": "Invalid year or month"}), 400
+    if not 1 <= month <= 12: return jsonify({"error": "Invalid year or month"}), 400
+    try:
+        status = await AsyncReportService.get_rules_status(year, month, user_id=user_id)
+        return jsonify(status), 200
+    except BudgetServiceError as e: return jsonify({"error": str(e)}), 500
+
+# V debug režime dashboard meria sekcie postupne, to robí synchrónna cesta
+@async_route('/api/dashboard', when=lambda app, args: not app.debug)
+@async_token_required
+@async_conditional_get('dashboard')
+async def get_dashboard_async():
+    user_id = g.current_user.id
+    try:
+        year = int(request.args.get('year', datetime.now().year))
+        month = int(request.args.get('month', datetime.now().month))
+        days = int(request.args.get('days', SNAPSHOT_DEFAULT_DAYS))
+    except ValueError: return jsonify({"error": "Invalid year, month or days"}), 400
+    if not 1 <= month <= 12: return jsonify({"error": "Invalid year or month"}), 400
+    if days not in SNAPSHOT_ALLOWED_DAYS:
+        return jsonify({"error": "Invalid days", "message": f"Allowed values: {', '.join(map(str, SNAPSHOT_ALLOWED_DAYS))}"}), 400
+    try:
+        dashboard = await AsyncReportService.get_dashboard(year, month, user_id, days=days)
+        return jsonify(dashboard), 200
+    except DashboardServiceError as e: return jsonify({"error": str(e)}), 500
@@ -5,7 +5,7 @@ from marshmallow import Schema, fields, ValidationError, validate, validates_sch
 from ..database import db
 from ..models import User
 from ..schemas import user_schema # Importuj inštanciu user_schema
-from ..utils.auth_utils import generate_token, token_required
+from ..utils.auth_utils import generate_token, token_required, load_current_user, invalidate_principal
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -53,7 +53,7 @@ def register():
     try:
         db.session.add(new_user)
         db.session.commit()
-        token = generate_token(new_user.id)
+        token = generate_token(new_user.id, new_user.token_version)
         if token:
             user_data = user_schema.dump(new_user)
             return jsonify({
@@ -85,7 +85,7 @@ def login():
     user = User.query.filter((User.username == data['login']) | (User.email == data['login'])).first()
 
     if user and user.check_password(data['password']):
-        token = generate_token(user.id)
+        token = generate_token(user.id, user.token_version)
         if token:
             user_data = user_schema.dump(user) # Použi inštanciu user_schema
             return jsonify({"access_token": token, "user": user_data}), 200
@@ -98,8 +98,8 @@ def login():
 @auth_bp.route('/me', methods=['GET'])
 @token_required
 def get_current_user():
-    # g.current_user je nastavený dekorátorom @token_required
-    return jsonify(user_schema.dump(g.current_user)), 200
+    # g.current_user je Principal z @token_required, pre plné údaje načítame usera
+    return jsonify(user_schema.dump(load_current_user())), 200
 
 
 # --- NOVÝ ENDPOINT ---
@@ -119,8 +119,8 @@ def change_user_password():
         # Vráť validačné chyby (napr. krátke heslo, nezhodujúce sa heslá)
         return jsonify({"error": "Invalid input", "messages": err.messages}), 400
 
-    # Získaj aktuálne prihláseného používateľa z `g` (nastavené v @token_required)
-    user = g.current_user
+    # Načítaj plného používateľa podľa `g.current_user` (nastavené v @token_required)
+    user = load_current_user()
 
     # Over aktuálne heslo
     if not user.check_password(data['currentPassword']):
@@ -131,8 +131,11 @@ def change_user_password():
     # Ak aktuálne heslo sedí, nastav nové heslo
     try:
         user.set_password(data['newPassword'])
+        # Zvýšením verzie zneplatníme všetky staré tokeny, klient dostane nový
+        user.token_version = (user.token_version or 0) + 1
         db.session.commit()
-        return jsonify({"message": "Password changed successfully"}), 200
+        invalidate_principal(user.id)
+        return jsonify({"message": "Password changed successfully", "access_token": generate_token(user.id, user.token_version)}), 200
     except Exception as e:
         db.session.rollback()
         print(f"Error changing password for user {user.id}: {e}")
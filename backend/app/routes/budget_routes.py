@@ -1,17 +1,20 @@
 from flask import Blueprint, request, jsonify, g
-from ..schemas import budget_schema, budgets_schema, budget_input_schema
+from ..schemas import budget_schema, budget_input_schema, budget_rows
 from ..services import BudgetService, BudgetServiceError, BudgetNotFoundError
-from ..services import IncomeService, IncomeServiceError as IncomeServiceErr
-from ..models import Income
+from ..services import IncomeServiceError as IncomeServiceErr
 from ..utils.auth_utils import token_required
+from ..utils.etag_utils import conditional_get
+from ..utils.date_utils import parse_year_month
 from marshmallow import ValidationError
 from datetime import datetime
-from sqlalchemy import extract
+
+MAX_STATUS_RANGE_MONTHS = 120
 
 budget_bp = Blueprint('budgets', __name__)
 
 @budget_bp.route('/budgets', methods=['GET'])
 @token_required
+@conditional_get('budgets')
 def get_budgets_route():
     user_id = g.current_user.id
     try:
@@ -19,8 +22,8 @@ def get_budgets_route():
         month = int(request.args.get('month', datetime.now().month))
     except ValueError: return jsonify({"error": "Invalid year or month"}), 400
     try:
-        budgets = BudgetService.get_budgets_for_month(year, month, user_id=user_id)
-        return jsonify(budgets_schema.dump(budgets)), 200
+        budgets = BudgetService.get_budget_rows_for_month(year, month, user_id=user_id)
+        return budget_rows.list_response(budgets), 200
     except BudgetServiceError as e: return jsonify({"error": str(e)}), 500
     except Exception as e:
         print(f"Unexpected error in get_budgets_route: {e}"); return jsonify({"error": "Internal server error"}), 500
@@ -43,12 +46,16 @@ def set_budget_route():
 
 @budget_bp.route('/budget-status', methods=['GET'])
 @token_required
+@conditional_get('budget_status')
 def get_budget_status_route():
     user_id = g.current_user.id
+    if 'from' in request.args or 'to' in request.args:
+        return get_budget_status_range(user_id)
     try:
         year = int(request.args.get('year', datetime.now().year))
         month = int(request.args.get('month', datetime.now().month))
     except ValueError: return jsonify({"error": "Invalid year or month"}), 400
+    if not 1 <= month <= 12: return jsonify({"error": "Invalid year or month"}), 400
     try:
         status = BudgetService.get_budget_status_for_month(year, month, user_id=user_id)
         return jsonify(status), 200
@@ -56,6 +63,22 @@ def get_budget_status_route():
     except Exception as e:
         print(f"Unexpected error in get_budget_status_route: {e}"); return jsonify({"error": "Internal server error"}), 500
 
+def get_budget_status_range(user_id):
+    """?from=YYYY-MM&to=YYYY-MM: stav po mesiacoch za celé obdobie (jeden dotaz)."""
+    try:
+        start = parse_year_month(request.args.get('from'))
+        end = parse_year_month(request.args.get('to'))
+    except ValueError as e: return jsonify({"error": "Invalid month range", "message": str(e)}), 400
+    months = (end[0] - start[0]) * 12 + end[1] - start[1] + 1
+    if not 1 <= months <= MAX_STATUS_RANGE_MONTHS:
+        return jsonify({"error": "Invalid month range", "message": f"'from' must not be after 'to' and the range is limited to {MAX_STATUS_RANGE_MONTHS} months"}), 400
+    try:
+        status = BudgetService.get_budget_status_for_range(start, end, user_id=user_id)
+        return jsonify(status), 200
+    except BudgetServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in get_budget_status_range: {e}"); return jsonify({"error": "Internal server error"}), 500
+
 @budget_bp.route('/budget-rules-status', methods=['GET'])
 @token_required
 def get_rules_status_route():
@@ -64,14 +87,9 @@ def get_rules_status_route():
         year = int(request.args.get('year', datetime.now().year))
         month = int(request.args.get('month', datetime.now().month))
     except ValueError: return jsonify({"error": "Invalid year or month"}), 400
+    if not 1 <= month <= 12: return jsonify({"error": "Invalid year or month"}), 400
     try:
-        monthly_incomes = Income.query.filter(
-            Income.user_id == user_id,
-            extract('year', Income.date_created) == year,
-            extract('month', Income.date_created) == month
-        ).all()
-        total_income = sum(inc.amount for inc in monthly_incomes)
-        status = BudgetService.get_50_30_20_status(year, month, total_income, user_id=user_id)
+        status = BudgetService.get_rules_status(year, month, user_id=user_id)
         return jsonify(status), 200
     except (BudgetServiceError, IncomeServiceErr) as e:
          print(f"Service error getting rules status: {e}"); return jsonify({"error": str(e)}), 500
@@ -0,0 +1,65 @@
+from flask import Blueprint, request, jsonify, g
+from ..schemas import category_rule_schema, category_rules_schema, category_rule_input_schema
+from ..services import CategoryRuleService, CategoryRuleServiceError, CategoryRuleNotFoundError, CategoryRuleConflictError
+from ..utils.auth_utils import token_required
+from marshmallow import ValidationError
+
+category_rule_bp = Blueprint('category_rules', __name__)
+
+@category_rule_bp.route('/category-rules', methods=['GET'])
+@token_required
+def get_category_rules_route():
+    user_id = g.current_user.id
+    try:
+        rules = CategoryRuleService.get_rules(user_id)
+        return jsonify(category_rules_schema.dump(rules)), 200
+    except CategoryRuleServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in get_category_rules_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+
+@category_rule_bp.route('/category-rules', methods=['POST'])
+@token_required
+def create_category_rule_route():
+    user_id = g.current_user.id
+    json_data = request.get_json()
+    if not json_data: return jsonify({"error": "No input data"}), 400
+    try:
+        data = category_rule_input_schema.load(json_data)
+    except ValidationError as err: return jsonify({"error": "Invalid input", "messages": err.messages}), 400
+    try:
+        rule = CategoryRuleService.create_rule(data, user_id=user_id)
+        return jsonify(category_rule_schema.dump(rule)), 201
+    except CategoryRuleConflictError as e: return jsonify({"error": str(e)}), 409
+    except CategoryRuleServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in create_category_rule_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+
+@category_rule_bp.route('/category-rules/<int:rule_id>', methods=['PUT'])
+@token_required
+def update_category_rule_route(rule_id):
+    user_id = g.current_user.id
+    json_data = request.get_json()
+    if not json_data: return jsonify({"error": "No input data"}), 400
+    try:
+        data = category_rule_input_schema.load(json_data)
+    except ValidationError as err: return jsonify({"error": "Invalid input", "messages": err.messages}), 400
+    try:
+        rule = CategoryRuleService.update_rule(rule_id, data, user_id=user_id)
+        return jsonify(category_rule_schema.dump(rule)), 200
+    except CategoryRuleNotFoundError as e: return jsonify({"error": str(e)}), 404
+    except CategoryRuleConflictError as e: return jsonify({"error": str(e)}), 409
+    except CategoryRuleServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in update_category_rule_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+
+@category_rule_bp.route('/category-rules/<int:rule_id>', methods=['DELETE'])
+@token_required
+def delete_category_rule_route(rule_id):
+    user_id = g.current_user.id
+    try:
+        CategoryRuleService.delete_rule(rule_id, user_id=user_id)
+        return '', 204
+    except CategoryRuleNotFoundError as e: return jsonify({"error": str(e)}), 404
+    except CategoryRuleServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in delete_category_rule_route: {e}"); return jsonify({"error": "Internal server error"}), 500
@@ -0,0 +1,32 @@
+from flask import Blueprint, request, jsonify, g, current_app
+from ..services import DashboardService, DashboardServiceError
+from ..services.report_service import SNAPSHOT_DEFAULT_DAYS, SNAPSHOT_ALLOWED_DAYS
+from ..utils.auth_utils import token_required
+from ..utils.etag_utils import conditional_get
+from datetime import datetime
+
+dashboard_bp = Blueprint('dashboard', __name__)
+
+@dashboard_bp.route('/dashboard', methods=['GET'])
+@token_required
+@conditional_get('dashboard')
+def get_dashboard_route():
+    user_id = g.current_user.id
+    try:
+        year = int(request.args.get('year', datetime.now().year))
+        month = int(request.args.get('month', datetime.now().month))
+        days = int(request.args.get('days', SNAPSHOT_DEFAULT_DAYS))
+    except ValueError: return jsonify({"error": "Invalid year, month or days"}), 400
+    if not 1 <= month <= 12: return jsonify({"error": "Invalid year or month"}), 400
+    if days not in SNAPSHOT_ALLOWED_DAYS:
+        return jsonify({"error": "Invalid days", "message": f"Allowed values: {', '.join(map(str, SNAPSHOT_ALLOWED_DAYS))}"}), 400
+    # V debug režime sa cache obchádza a odpoveď obsahuje čas jednotlivých sekcií
+    timings = {} if current_app.debug else None
+    try:
+        dashboard = DashboardService.get_dashboard(year, month, user_id, days=days, timings=timings)
+    except DashboardServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in get_dashboard_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+    if timings is not None:
+        dashboard = {**dashboard, 'debug': {'sections_ms': timings, 'sql_statements': g.get('metrics_sql_count')}}
+    return jsonify(dashboard), 200
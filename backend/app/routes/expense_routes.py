@@ -1,7 +1,13 @@
 from flask import Blueprint, request, jsonify, g
-from ..schemas import expense_schema, expenses_schema, expense_input_schema
-from ..services import ExpenseService, ExpenseNotFoundError, ExpenseServiceError
+from ..schemas import expense_schema, expense_input_schema, expense_rows
+from ..services import ExpenseService, ExpenseNotFoundError, ExpenseServiceError, SummaryServiceError
 from ..utils.auth_utils import token_required
+from ..utils.etag_utils import conditional_get
+from ..utils.pagination_utils import is_paginated_request, parse_page_args, parse_sort
+from ..utils.filter_utils import parse_list_filters
+from ..utils.search_utils import parse_search_args
+from ..utils.export_utils import EXPORT_FORMATS, EXPENSE_EXPORT_FIELDS, stream_export
+from ..utils.import_utils import read_import_rows
 from marshmallow import ValidationError
 
 expense_bp = Blueprint('expenses', __name__)
@@ -12,15 +18,41 @@ def ping_api_route():
 
 @expense_bp.route('/expenses', methods=['GET'])
 @token_required
+@conditional_get('expenses')
 def get_expenses_route():
     user_id = g.current_user.id
+    paginated = is_paginated_request(request.args)
+    # Filtre a zoradenie sa vykonajú v SQL, klient nemusí sťahovať celý zoznam
     try:
-        user_expenses = ExpenseService.get_all_expenses(user_id=user_id)
-        return jsonify(expenses_schema.dump(user_expenses)), 200
+        filters = parse_list_filters(request.args, 'expenses')
+        sort = parse_sort(request.args.get('sort'))
+        if paginated:
+            limit, cursor = parse_page_args(request.args, sort)
+    except ValueError as e: return jsonify({"error": "Invalid query parameters", "message": str(e)}), 400
+    try:
+        if paginated:
+            page, next_cursor = ExpenseService.get_expense_rows_page(user_id=user_id, limit=limit, cursor=cursor, filters=filters, sort=sort)
+            return expense_rows.page_response(page, next_cursor), 200
+        # Zoznam len na čítanie: stĺpce ako n-tice a rýchly serializer namiesto ORM + marshmallow
+        return expense_rows.list_response(ExpenseService.get_all_expense_rows(user_id=user_id, filters=filters, sort=sort)), 200
     except ExpenseServiceError as e: return jsonify({"error": str(e)}), 500
     except Exception as e:
          print(f"Unexpected error in get_expenses_route: {e}"); return jsonify({"error": "Internal server error"}), 500
 
+@expense_bp.route('/expenses/search', methods=['GET'])
+@token_required
+@conditional_get('expenses_search')
+def search_expenses_route():
+    user_id = g.current_user.id
+    try:
+        text, limit, offset = parse_search_args(request.args)
+        rows, next_offset = ExpenseService.search_expenses(user_id, text, limit, offset)
+    except ValueError as e: return jsonify({"error": "Invalid search parameters", "message": str(e)}), 400
+    except ExpenseServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in search_expenses_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+    return jsonify({"items": expense_rows.dump(rows), "next_offset": next_offset}), 200
+
 @expense_bp.route('/expenses', methods=['POST'])
 @token_required
 def add_expense_route():
@@ -37,6 +69,50 @@ def add_expense_route():
     except Exception as e:
          print(f"Unexpected error in add_expense_route: {e}"); return jsonify({"error": "Internal server error"}), 500
 
+@expense_bp.route('/expenses/bulk', methods=['POST'])
+@token_required
+def bulk_add_expenses_route():
+    user_id = g.current_user.id
+    try:
+        rows = read_import_rows(request)
+    except ValueError as e: return jsonify({"error": "Invalid input", "message": str(e)}), 400
+    try:
+        report = ExpenseService.bulk_add_expenses(rows, user_id=user_id)
+        return jsonify(report), (201 if report["inserted"] else 400)
+    except ExpenseServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in bulk_add_expenses_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+
+@expense_bp.route('/expenses/recategorize', methods=['POST'])
+@token_required
+def recategorize_expenses_route():
+    user_id = g.current_user.id
+    # Telo je voliteľné: {"only_uncategorized": false} prepíše aj ručne zadané kategórie
+    json_data = request.get_json(silent=True) or {}
+    only_uncategorized = json_data.get('only_uncategorized', True)
+    if not isinstance(only_uncategorized, bool):
+        return jsonify({"error": "Invalid input", "messages": {"only_uncategorized": ["Not a valid boolean."]}}), 400
+    try:
+        report = ExpenseService.recategorize_expenses(user_id, only_uncategorized=only_uncategorized)
+        return jsonify(report), 200
+    except (ExpenseServiceError, SummaryServiceError) as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in recategorize_expenses_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+
+@expense_bp.route('/expenses/export', methods=['GET'])
+@token_required
+def export_expenses_route():
+    user_id = g.current_user.id
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": "Invalid format", "message": f"Supported formats: {', '.join(EXPORT_FORMATS)}"}), 400
+    try:
+        rows = ExpenseService.iter_expenses(user_id=user_id)
+        return stream_export(rows, expense_schema, EXPENSE_EXPORT_FIELDS, export_format, 'expenses')
+    except ExpenseServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in export_expenses_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+
 @expense_bp.route('/expenses/<int:expense_id>', methods=['GET'])
 @token_required
 def get_single_expense_route(expense_id):
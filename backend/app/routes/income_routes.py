@@ -1,22 +1,54 @@
 from flask import Blueprint, request, jsonify, g
-from ..schemas import income_schema, incomes_schema, income_input_schema
+from ..schemas import income_schema, income_input_schema, income_rows
 from ..services import IncomeService, IncomeNotFoundError, IncomeServiceError
 from ..utils.auth_utils import token_required
+from ..utils.etag_utils import conditional_get
+from ..utils.pagination_utils import is_paginated_request, parse_page_args, parse_sort
+from ..utils.filter_utils import parse_list_filters
+from ..utils.search_utils import parse_search_args
+from ..utils.export_utils import EXPORT_FORMATS, INCOME_EXPORT_FIELDS, stream_export
+from ..utils.import_utils import read_import_rows
 from marshmallow import ValidationError
 
 income_bp = Blueprint('incomes', __name__)
 
 @income_bp.route('/incomes', methods=['GET'])
 @token_required
+@conditional_get('incomes')
 def get_incomes_route():
     user_id = g.current_user.id
+    paginated = is_paginated_request(request.args)
+    # Filtre a zoradenie sa vykonajú v SQL, klient nemusí sťahovať celý zoznam
     try:
-        all_incomes = IncomeService.get_all_incomes(user_id=user_id)
-        return jsonify(incomes_schema.dump(all_incomes)), 200
+        filters = parse_list_filters(request.args, 'incomes')
+        sort = parse_sort(request.args.get('sort'))
+        if paginated:
+            limit, cursor = parse_page_args(request.args, sort)
+    except ValueError as e: return jsonify({"error": "Invalid query parameters", "message": str(e)}), 400
+    try:
+        if paginated:
+            page, next_cursor = IncomeService.get_income_rows_page(user_id=user_id, limit=limit, cursor=cursor, filters=filters, sort=sort)
+            return income_rows.page_response(page, next_cursor), 200
+        # Zoznam len na čítanie: stĺpce ako n-tice a rýchly serializer namiesto ORM + marshmallow
+        return income_rows.list_response(IncomeService.get_all_income_rows(user_id=user_id, filters=filters, sort=sort)), 200
     except IncomeServiceError as e: return jsonify({"error": str(e)}), 500
     except Exception as e:
         print(f"Unexpected error in get_incomes_route: {e}"); return jsonify({"error": "Internal server error"}), 500
 
+@income_bp.route('/incomes/search', methods=['GET'])
+@token_required
+@conditional_get('incomes_search')
+def search_incomes_route():
+    user_id = g.current_user.id
+    try:
+        text, limit, offset = parse_search_args(request.args)
+        rows, next_offset = IncomeService.search_incomes(user_id, text, limit, offset)
+    except ValueError as e: return jsonify({"error": "Invalid search parameters", "message": str(e)}), 400
+    except IncomeServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in search_incomes_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+    return jsonify({"items": income_rows.dump(rows), "next_offset": next_offset}), 200
+
 @income_bp.route('/incomes', methods=['POST'])
 @token_required
 def add_income_route():
@@ -33,6 +65,34 @@ def add_income_route():
     except Exception as e:
         print(f"Unexpected error in add_income_route: {e}"); return jsonify({"error": "Internal server error"}), 500
 
+@income_bp.route('/incomes/bulk', methods=['POST'])
+@token_required
+def bulk_add_incomes_route():
+    user_id = g.current_user.id
+    try:
+        rows = read_import_rows(request)
+    except ValueError as e: return jsonify({"error": "Invalid input", "message": str(e)}), 400
+    try:
+        report = IncomeService.bulk_add_incomes(rows, user_id=user_id)
+        return jsonify(report), (201 if report["inserted"] else 400)
+    except IncomeServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in bulk_add_incomes_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+
+@income_bp.route('/incomes/export', methods=['GET'])
+@token_required
+def export_incomes_route():
+    user_id = g.current_user.id
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": "Invalid format", "message": f"Supported formats: {', '.join(EXPORT_FORMATS)}"}), 400
+    try:
+        rows = IncomeService.iter_incomes(user_id=user_id)
+        return stream_export(rows, income_schema, INCOME_EXPORT_FIELDS, export_format, 'incomes')
+    except IncomeServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in export_incomes_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+
 @income_bp.route('/incomes/<int:income_id>', methods=['GET'])
 @token_required
 def get_single_income_route(income_id):
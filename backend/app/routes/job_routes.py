@@ -0,0 +1,70 @@
+import os
+from flask import Blueprint, request, jsonify, g, current_app, send_file
+from ..schemas import job_schema, jobs_schema, job_input_schema, JOB_PARAMS_SCHEMAS
+from ..services import JobService, JobServiceError, JobNotFoundError, JobLimitError
+from ..models.job import JOB_SUCCEEDED
+from ..utils.auth_utils import token_required
+from ..utils.job_utils import ensure_job_workers
+from marshmallow import ValidationError
+
+job_bp = Blueprint('jobs', __name__)
+
+@job_bp.route('/jobs', methods=['POST'])
+@token_required
+def create_job_route():
+    user_id = g.current_user.id
+    json_data = request.get_json()
+    if not json_data: return jsonify({"error": "No input data provided"}), 400
+    try:
+        data = job_input_schema.load(json_data)
+        params = JOB_PARAMS_SCHEMAS[data['kind']].load(data['params'])
+    except ValidationError as err: return jsonify({"error": "Validation failed", "messages": err.messages}), 400
+    try:
+        job = JobService.enqueue(user_id, data['kind'], params)
+    except JobLimitError as e: return jsonify({"error": "Too many active jobs", "message": str(e)}), 429
+    except JobServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in create_job_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+    pool = ensure_job_workers(current_app._get_current_object())
+    if pool is not None:
+        pool.wake()
+    response = jsonify(job_schema.dump(job))
+    response.headers['Location'] = f"/api/jobs/{job.id}"
+    return response, 202
+
+@job_bp.route('/jobs', methods=['GET'])
+@token_required
+def get_jobs_route():
+    user_id = g.current_user.id
+    ensure_job_workers(current_app._get_current_object())
+    try:
+        return jsonify(jobs_schema.dump(JobService.list_jobs(user_id))), 200
+    except JobServiceError as e: return jsonify({"error": str(e)}), 500
+    except Exception as e:
+        print(f"Unexpected error in get_jobs_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+
+@job_bp.route('/jobs/<int:job_id>', methods=['GET'])
+@token_required
+def get_job_route(job_id):
+    user_id = g.current_user.id
+    # Po reštarte servera sa čakajúce úlohy rozbehnú pri prvom dopyte na stav
+    ensure_job_workers(current_app._get_current_object())
+    try:
+        return jsonify(job_schema.dump(JobService.get_job(job_id, user_id))), 200
+    except JobNotFoundError as e: return jsonify({"error": str(e)}), 404
+    except Exception as e:
+        print(f"Unexpected error in get_job_route: {e}"); return jsonify({"error": "Internal server error"}), 500
+
+@job_bp.route('/jobs/<int:job_id>/result', methods=['GET'])
+@token_required
+def get_job_result_route(job_id):
+    user_id = g.current_user.id
+    try:
+        job = JobService.get_job(job_id, user_id)
+    except JobNotFoundError as e: return jsonify({"error": str(e)}), 404
+    if job.status != JOB_SUCCEEDED:
+        return jsonify({"error": "Result not ready", "status": job.status, "progress": job.progress}), 409
+    path = JobService.result_path(job)
+    if not os.path.exists(path):
+        return jsonify({"error": "Result expired"}), 410
+    return send_file(path, mimetype=job.result_content_type, as_attachment=True, download_name=job.result_filename)
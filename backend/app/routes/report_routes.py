@@ -1,9 +1,13 @@
 # backend/app/routes/report_routes.py
 from flask import Blueprint, jsonify, g, request
-from ..services.report_service import ReportService, ReportServiceError
+from ..services.report_service import ReportService, ReportServiceError, SNAPSHOT_DEFAULT_DAYS, SNAPSHOT_ALLOWED_DAYS, TIMESERIES_MAX_DAYS
 # Import schém s predpokladanými názvami
 from ..schemas.weekly_focus_schema import weekly_focus_schema, weekly_focus_input_schema
 from ..utils.auth_utils import token_required # Import dekorátora
+from ..utils.etag_utils import conditional_get
+from ..utils.cache_utils import get_cache
+from ..utils.timeseries_utils import GRANULARITIES
+from datetime import datetime, timedelta, timezone
 from marshmallow import ValidationError
 import traceback
 
@@ -11,10 +15,16 @@ report_bp = Blueprint('reports', __name__)
 
 @report_bp.route('/weekly-snapshot', methods=['GET'])
 @token_required # Pridanie autentizácie
+@conditional_get('weekly_snapshot')
 def get_weekly_snapshot_route():
     user_id = g.current_user.id
     try:
-        snapshot = ReportService.get_weekly_snapshot(user_id)
+        days = int(request.args.get('days', SNAPSHOT_DEFAULT_DAYS))
+    except ValueError: days = None
+    if days not in SNAPSHOT_ALLOWED_DAYS:
+        return jsonify({"error": "Invalid days", "message": f"Allowed values: {', '.join(map(str, SNAPSHOT_ALLOWED_DAYS))}"}), 400
+    try:
+        snapshot = ReportService.get_weekly_snapshot(user_id, days=days)
         # Skontroluj, či service nevrátil chybu v dátach
         if isinstance(snapshot, dict) and snapshot.get("error"):
              return jsonify({"error": snapshot["error"]}), 500
@@ -26,6 +36,30 @@ def get_weekly_snapshot_route():
         traceback.print_exc()
         return jsonify({"error": "Internal server error"}), 500
 
+@report_bp.route('/timeseries', methods=['GET'])
+@token_required
+@conditional_get('timeseries')
+def get_timeseries_route():
+    user_id = g.current_user.id
+    granularity = request.args.get('granularity', 'month')
+    if granularity not in GRANULARITIES:
+        return jsonify({"error": "Invalid granularity", "message": f"Allowed values: {', '.join(GRANULARITIES)}"}), 400
+    try:
+        today = datetime.now(timezone.utc).date()
+        end_date = datetime.strptime(request.args['to'], '%Y-%m-%d').date() if request.args.get('to') else today
+        start_date = datetime.strptime(request.args['from'], '%Y-%m-%d').date() if request.args.get('from') else end_date - timedelta(days=364)
+        window = int(request.args['window']) if request.args.get('window') else None
+    except ValueError: return jsonify({"error": "Invalid parameters", "message": "Use from/to as YYYY-MM-DD and an integer window"}), 400
+    if not 0 <= (end_date - start_date).days <= TIMESERIES_MAX_DAYS:
+        return jsonify({"error": "Invalid date range", "message": f"'from' must not be after 'to' and the range is limited to {TIMESERIES_MAX_DAYS} days"}), 400
+    if window is not None and not 1 <= window <= 366:
+        return jsonify({"error": "Invalid window", "message": "Window must be between 1 and 366 periods"}), 400
+    category = request.args.get('category') or None
+    series = ReportService.get_timeseries(user_id, granularity, start_date, end_date, category=category, window=window)
+    if isinstance(series, dict) and series.get("error"):
+        return jsonify({"error": series["error"]}), 500
+    return jsonify(series), 200
+
 @report_bp.route('/weekly-focus', methods=['POST'])
 @token_required # Pridanie autentizácie
 def set_weekly_focus_route():
@@ -53,4 +87,10 @@ def set_weekly_focus_route():
     except Exception as e:
         print(f"[RouteError] set_weekly_focus_route User:{user_id}: {e}")
         traceback.print_exc()
-        return jsonify({"error": "Internal server error"}), 500
\ No newline at end of file
+        return jsonify({"error": "Internal server error"}), 500
+
+@report_bp.route('/cache-stats', methods=['GET'])
+@token_required
+def get_cache_stats_route():
+    # Počítadlá hit/miss cache prehľadov (platia pre aktuálny proces/worker)
+    return jsonify(get_cache().stats()), 200
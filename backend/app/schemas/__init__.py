@@ -1,6 +1,9 @@
 # backend/app/schemas/__init__.py
 from .user_schema import user_schema, users_schema # Nové
-from .expense_schema import expense_schema, expenses_schema, expense_input_schema
-from .income_schema import income_schema, incomes_schema, income_input_schema
+from .expense_schema import expense_schema, expenses_schema, expense_input_schema, expense_import_schema
+from .income_schema import income_schema, incomes_schema, income_input_schema, income_import_schema
 from .budget_schema import budget_schema, budgets_schema, budget_input_schema
-from .weekly_focus_schema import weekly_focus_schema, weekly_focus_input_schema
\ No newline at end of file
+from .weekly_focus_schema import weekly_focus_schema, weekly_focus_input_schema
+from .row_serializers import expense_rows, income_rows, budget_rows
+from .job_schema import job_schema, jobs_schema, job_input_schema, JOB_PARAMS_SCHEMAS
+from .category_rule_schema import category_rule_schema, category_rules_schema, category_rule_input_schema
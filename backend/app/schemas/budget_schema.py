@@ -7,6 +7,7 @@ class BudgetSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = Budget
         load_instance = True
+        exclude = ("amount_cents",)
         # exclude = ("owner",) # backref
 
     category = fields.String(required=True, validate=validate.Length(min=1))
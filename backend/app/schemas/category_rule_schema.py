@@ -0,0 +1,30 @@
+# backend/app/schemas/category_rule_schema.py
+from ..database import ma
+from ..models import CategoryRule
+from ..utils.categorize_utils import MATCH_TYPES, normalize_text
+from marshmallow import fields, validate, validates_schema, ValidationError
+
+class CategoryRuleSchema(ma.SQLAlchemyAutoSchema):
+    class Meta:
+        model = CategoryRule
+        # Služba pracuje so slovníkmi, aby update mohol meniť len zadané polia
+        load_instance = False
+
+    pattern = fields.String(required=True, validate=validate.Length(min=1, max=100))
+    match_type = fields.String(load_default='contains', validate=validate.OneOf(list(MATCH_TYPES)))
+    category = fields.String(required=False, allow_none=True, validate=validate.Length(min=1, max=50))
+    rule_category = fields.String(required=False, allow_none=True, validate=validate.OneOf(['Needs', 'Wants', 'Savings']))
+    priority = fields.Integer(load_default=0, validate=validate.Range(min=-1000, max=1000))
+    created_at = fields.DateTime(dump_only=True, format='iso')
+    user_id = fields.Integer(dump_only=True) # Len na čítanie
+
+    @validates_schema
+    def validate_rule(self, data, **kwargs):
+        if not normalize_text(data.get('pattern', '')).strip():
+            raise ValidationError("Pattern must contain at least one non-space character.", "pattern")
+        if not data.get('category') and not data.get('rule_category'):
+            raise ValidationError("At least one of category or rule_category is required.", "_schema")
+
+category_rule_schema = CategoryRuleSchema()
+category_rules_schema = CategoryRuleSchema(many=True)
+category_rule_input_schema = CategoryRuleSchema(exclude=("id", "user_id", "created_at"))
@@ -7,6 +7,8 @@ class ExpenseSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = Expense
         load_instance = True
+        # Suma sa ukladá v centoch, navonok je len 'amount' v eurách
+        exclude = ("amount_cents",)
         # Nezahrnieme autora priamo, ale user_id
         # exclude = ("author",) # author je backref, nepotrebujeme ho tu
 
@@ -20,4 +22,12 @@ class ExpenseSchema(ma.SQLAlchemyAutoSchema):
 expense_schema = ExpenseSchema()
 expenses_schema = ExpenseSchema(many=True)
 # Vstupná schéma nepotrebuje user_id, id, date_created
-expense_input_schema = ExpenseSchema(exclude=("id", "date_created", "user_id"))
\ No newline at end of file
+expense_input_schema = ExpenseSchema(exclude=("id", "date_created", "user_id"))
+
+class ExpenseImportSchema(ExpenseSchema):
+    # Pri hromadnom importe (napr. bankový výpis) je dátum transakcie súčasťou vstupu
+    date_created = fields.DateTime(required=False, format='iso')
+    user_id = fields.Integer(dump_only=True) # Pri dedení sa FK polia nepreberajú
+
+# Import vracia slovníky (nie inštancie), aby sa dali vložiť hromadne
+expense_import_schema = ExpenseImportSchema(exclude=("id", "user_id"), load_instance=False)
\ No newline at end of file
@@ -7,6 +7,7 @@ class IncomeSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = Income
         load_instance = True
+        exclude = ("amount_cents",)
         # exclude = ("recipient",) # backref
 
     description = fields.String(required=True, validate=validate.Length(min=1))
@@ -17,4 +18,12 @@ class IncomeSchema(ma.SQLAlchemyAutoSchema):
 
 income_schema = IncomeSchema()
 incomes_schema = IncomeSchema(many=True)
-income_input_schema = IncomeSchema(exclude=("id", "date_created", "user_id"))
\ No newline at end of file
+income_input_schema = IncomeSchema(exclude=("id", "date_created", "user_id"))
+
+class IncomeImportSchema(IncomeSchema):
+    # Pri hromadnom importe (napr. bankový výpis) je dátum transakcie súčasťou vstupu
+    date_created = fields.DateTime(required=False, format='iso')
+    user_id = fields.Integer(dump_only=True) # Pri dedení sa FK polia nepreberajú
+
+# Import vracia slovníky (nie inštancie), aby sa dali vložiť hromadne
+income_import_schema = IncomeImportSchema(exclude=("id", "user_id"), load_instance=False)
\ No newline at end of file
@@ -0,0 +1,53 @@
+# backend/app/schemas/job_schema.py
+import json
+from datetime import datetime
+from ..database import ma
+from ..models import Job
+from ..utils.export_utils import EXPORT_FORMATS
+from marshmallow import fields, validate, Schema
+
+class JobSchema(ma.SQLAlchemyAutoSchema):
+    class Meta:
+        model = Job
+        load_instance = False
+        exclude = ("result_filename", "result_content_type", "attempts")
+
+    user_id = fields.Integer(dump_only=True)
+    params = fields.Method("get_params")
+    created_at = fields.DateTime(dump_only=True, format='iso')
+    started_at = fields.DateTime(dump_only=True, format='iso')
+    heartbeat_at = fields.DateTime(dump_only=True, format='iso')
+    finished_at = fields.DateTime(dump_only=True, format='iso')
+    # Odkaz na stiahnutie, len pri úspešne dokončenej úlohe
+    result_url = fields.Method("get_result_url")
+
+    def get_params(self, job):
+        return json.loads(job.params or '{}')
+
+    def get_result_url(self, job):
+        return f"/api/jobs/{job.id}/result" if job.result_filename else None
+
+# Parametre jednotlivých druhov úloh
+class ExportJobParamsSchema(Schema):
+    format = fields.String(load_default='csv', validate=validate.OneOf(list(EXPORT_FORMATS)))
+
+class YearlyReviewJobParamsSchema(Schema):
+    year = fields.Integer(load_default=lambda: datetime.now().year, validate=validate.Range(min=2000, max=2100))
+
+class NoJobParamsSchema(Schema):
+    pass
+
+JOB_PARAMS_SCHEMAS = {
+    'export_expenses': ExportJobParamsSchema(),
+    'export_incomes': ExportJobParamsSchema(),
+    'yearly_review': YearlyReviewJobParamsSchema(),
+    'recompute_summaries': NoJobParamsSchema(),
+}
+
+class JobInputSchema(Schema):
+    kind = fields.String(required=True, validate=validate.OneOf(list(JOB_PARAMS_SCHEMAS)))
+    params = fields.Dict(load_default=dict)
+
+job_schema = JobSchema()
+jobs_schema = JobSchema(many=True)
+job_input_schema = JobInputSchema()
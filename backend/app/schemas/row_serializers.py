@@ -0,0 +1,108 @@
+# backend/app/schemas/row_serializers.py
+from json.encoder import encode_basestring_ascii
+from flask import current_app, jsonify
+from flask.json.provider import DefaultJSONProvider
+from ..models import Expense, Income, Budget
+from ..utils.money_utils import from_cents
+
+# Druhy polí: (prevod na hodnotu pre dict, kódovanie do JSON). Kódovanie je rovnaké ako
+# json.dumps v jsonify (ensure_ascii, repr pre int/float), None je vždy null.
+FIELD_KINDS = {
+    'int': (None, int.__repr__),
+    'str': (None, encode_basestring_ascii),
+    'cents': (from_cents, lambda cents: float.__repr__(cents / 100)),
+    'iso': (lambda value: value.isoformat(), lambda value: '"' + value.isoformat() + '"'),
+}
+
+def _null_safe(convert):
+    return lambda value: None if value is None else convert(value)
+
+def _null_safe_json(encode):
+    return lambda value: 'null' if value is None else encode(value)
+
+class RowSerializer:
+    """
+    Rýchla cesta pre zoznamy len na čítanie: SELECT vyberie iba potrebné stĺpce (n-tice, žiadne
+    ORM objekty) a riadky sa prevedú predkompilovanými funkciami namiesto marshmallow.
+    Výstup je zhodný so schémou + jsonify (kľúče zoradené, kompaktný JSON), kontrolu zhody
+    robí benchmarks/bench_serializers.py.
+    """
+
+    def __init__(self, model, fields):
+        """fields: (kľúč vo výstupe, stĺpec modelu, druh poľa z FIELD_KINDS) v poradí stĺpcov SELECT-u."""
+        self.keys = tuple(key for key, _, _ in fields)
+        self.columns = tuple(getattr(model, column) for _, column, _ in fields)
+        # Funkcie sa zostavia raz zo zdrojového kódu (ako namedtuple), pri riadku sa už nič nehľadá
+        namespace = {}
+        dict_items, json_parts = [], []
+        for index, (key, _, kind) in sorted(enumerate(fields), key=lambda item: item[1][0]):
+            convert, encode = FIELD_KINDS[kind]
+            if convert is None:
+                dict_items.append(f"{key!r}: row[{index}]")
+            else:
+                namespace[f'c{index}'] = _null_safe(convert)
+                dict_items.append(f"{key!r}: c{index}(row[{index}])")
+            namespace[f'e{index}'] = _null_safe_json(encode)
+            prefix = '{' if not json_parts else ','
+            json_parts.append(f"{prefix + encode_basestring_ascii(key) + ':'!r} + e{index}(row[{index}])")
+        exec(f"def to_dict(row): return {{{', '.join(dict_items)}}}", namespace)
+        exec(f"def to_json(row): return {' + '.join(json_parts)} + '}}'", namespace)
+        self.to_dict = namespace['to_dict']
+        self.to_json = namespace['to_json']
+
+    def dump(self, rows):
+        return [self.to_dict(row) for row in rows]
+
+    def encode(self, rows):
+        return '[' + ','.join(map(self.to_json, rows)) + ']'
+
+    @staticmethod
+    def _can_encode_directly():
+        # Vlastné kódovanie zodpovedá len predvolenému kompaktnému výstupu jsonify (nie debug s odsadením)
+        provider = current_app.json
+        compact = provider.compact if provider.compact is not None else not current_app.debug
+        return (type(provider) is DefaultJSONProvider and compact and provider.sort_keys and provider.ensure_ascii
+                and current_app.config.get('FAST_SERIALIZATION_ENABLED', True))
+
+    def _response(self, body):
+        return current_app.response_class(body + '\n', mimetype=current_app.json.mimetype)
+
+    def list_response(self, rows):
+        """Ekvivalent jsonify(schema.dump(rows, many=True))."""
+        if not self._can_encode_directly():
+            return jsonify(self.dump(rows))
+        return self._response(self.encode(rows))
+
+    def page_response(self, rows, next_cursor):
+        """Ekvivalent jsonify({"items": ..., "next_cursor": ...}) pri stránkovaní."""
+        if not self._can_encode_directly():
+            return jsonify({"items": self.dump(rows), "next_cursor": next_cursor})
+        cursor = 'null' if next_cursor is None else encode_basestring_ascii(next_cursor)
+        return self._response('{"items":' + self.encode(rows) + ',"next_cursor":' + cursor + '}')
+
+# Polia zodpovedajú ExpenseSchema, IncomeSchema a BudgetSchema (bez amount_cents)
+expense_rows = RowSerializer(Expense, (
+    ('id', 'id', 'int'),
+    ('description', 'description', 'str'),
+    ('amount', 'amount_cents', 'cents'),
+    ('category', 'category', 'str'),
+    ('date_created', 'date_created', 'iso'),
+    ('rule_category', 'rule_category', 'str'),
+    ('user_id', 'user_id', 'int'),
+))
+income_rows = RowSerializer(Income, (
+    ('id', 'id', 'int'),
+    ('description', 'description', 'str'),
+    ('amount', 'amount_cents', 'cents'),
+    ('source', 'source', 'str'),
+    ('date_created', 'date_created', 'iso'),
+    ('user_id', 'user_id', 'int'),
+))
+budget_rows = RowSerializer(Budget, (
+    ('id', 'id', 'int'),
+    ('category', 'category', 'str'),
+    ('amount', 'amount_cents', 'cents'),
+    ('month', 'month', 'int'),
+    ('year', 'year', 'int'),
+    ('user_id', 'user_id', 'int'),
+))
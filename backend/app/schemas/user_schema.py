@@ -8,7 +8,7 @@ class UserSchema(ma.SQLAlchemyAutoSchema):
         model = User
         load_instance = True
         # Explicitne vylúčime hash hesla
-        exclude = ("password_hash",)
+        exclude = ("password_hash", "data_version", "token_version", "rules_version")
 
     # Polia sú načítané automaticky, email už je validovaný
     username = fields.String(dump_only=True) # Len na čítanie
@@ -2,3 +2,9 @@ from .expense_service import ExpenseService, ExpenseNotFoundError, ExpenseServic
 from .income_service import IncomeService, IncomeNotFoundError, IncomeServiceError
 from .budget_service import BudgetService, BudgetNotFoundError, BudgetServiceError
 from .report_service import ReportService, ReportServiceError
+from .summary_service import SummaryService, SummaryServiceError
+from .cache_service import CacheService
+from .dashboard_service import DashboardService, DashboardServiceError
+from .job_service import JobService, JobServiceError, JobNotFoundError, JobLimitError
+from .category_rule_service import CategoryRuleService, CategoryRuleServiceError, CategoryRuleNotFoundError, CategoryRuleConflictError
+from .async_report_service import AsyncReportService
@@ -0,0 +1,149 @@
+# backend/app/services/async_report_service.py
+import json
+from datetime import datetime, timezone
+from flask import current_app
+from ..database import get_async_engine
+from ..schemas import budget_rows
+from ..utils.cache_utils import get_cache, MISSING
+from ..utils.query_utils import fetch_concurrently
+from .budget_service import BudgetService, BudgetServiceError
+from .cache_service import CacheService
+from .dashboard_service import DashboardServiceError
+from .report_service import ReportService, SNAPSHOT_DEFAULT_DAYS
+from .summary_service import SummaryService
+
+class AsyncReportService:
+    """
+    Prehľady pre ASGI režim: rovnaké SELECT-y a výpočty ako synchrónne služby, no nad async
+    enginom a nezávislé dotazy jednej požiadavky bežia súbežne. Cache v pamäti a report_cache
+    zdieľajú kľúče so synchrónnou cestou, takže je jedno, ktorá z nich výsledok spočítala.
+    """
+
+    @staticmethod
+    async def _scalar(query):
+        async with get_async_engine().connect() as connection:
+            return (await connection.execute(query)).scalar()
+
+    @staticmethod
+    async def _fetch(queries):
+        return await fetch_concurrently(get_async_engine(), queries, current_app.config.get('ASYNC_QUERY_CONCURRENCY', 3))
+
+    @staticmethod
+    async def get_data_version(user_id):
+        return await AsyncReportService._scalar(CacheService._data_version_select(user_id)) or 0
+
+    @staticmethod
+    async def get_or_compute(user_id, name, params, compute, precomputed=False):
+        """Ako CacheService.get_or_compute, compute je korutína."""
+        cache = get_cache()
+        data_version = await AsyncReportService.get_data_version(user_id)
+        key = (user_id, data_version, name, params)
+        value = cache.get(key)
+        if value is MISSING and precomputed:
+            payload = await AsyncReportService._scalar(CacheService._precomputed_select(user_id, name, params, data_version))
+            if payload is not None:
+                value = json.loads(payload)
+                cache.set(key, value)
+        if value is MISSING:
+            value = await compute()
+            if not (isinstance(value, dict) and value.get('error')):
+                cache.set(key, value)
+        return value
+
+    @staticmethod
+    async def get_weekly_snapshot(user_id, days=SNAPSHOT_DEFAULT_DAYS):
+        today = datetime.now(timezone.utc).date()
+        return await AsyncReportService.get_or_compute(
+            user_id, 'weekly_snapshot', (today.isoformat(), days),
+            lambda: AsyncReportService._compute_weekly_snapshot(user_id, days),
+            precomputed=True
+        )
+
+    @staticmethod
+    async def _compute_weekly_snapshot(user_id, days):
+        try:
+            start_date, end_date, queries = ReportService._weekly_snapshot_queries(user_id, days)
+            results = await AsyncReportService._fetch(queries)
+            return ReportService._build_weekly_snapshot(days, start_date, end_date, results)
+        except Exception as e:
+            print(f"Error getting weekly snapshot (async) User:{user_id}: {e}")
+            return { "error": "Nepodarilo sa získať týždenný prehľad." }
+
+    @staticmethod
+    async def get_budget_status_for_month(year, month, user_id):
+        return await AsyncReportService.get_or_compute(
+            user_id, 'budget_status', (year, month),
+            lambda: AsyncReportService._compute_budget_status_for_month(year, month, user_id),
+            precomputed=True
+        )
+
+    @staticmethod
+    async def _compute_budget_status_for_month(year, month, user_id):
+        # Súčty sa berú pre všetky kategórie mesiaca, aby dotaz nečakal na zoznam rozpočtov
+        try:
+            results = await AsyncReportService._fetch({
+                'budgets': (BudgetService._budget_rows_select(year, month, user_id), 'all'),
+                'spent': (SummaryService._spent_by_category_select(user_id, year, month), 'all'),
+            })
+        except Exception as e:
+            print(f"DB error getting budget status (async) for {month}/{year} user {user_id}: {e}")
+            raise BudgetServiceError("Nepodarilo sa vypočítať čerpanie rozpočtov.") from e
+        if not results['budgets']:
+            return []
+        return BudgetService.build_budget_status(results['budgets'], dict(results['spent']))
+
+    @staticmethod
+    async def get_rules_status(year, month, user_id):
+        return await AsyncReportService.get_or_compute(
+            user_id, 'rules_status', (year, month),
+            lambda: AsyncReportService._compute_rules_status(year, month, user_id),
+            precomputed=True
+        )
+
+    @staticmethod
+    async def _compute_rules_status(year, month, user_id):
+        try:
+            results = await AsyncReportService._fetch({
+                'income': (SummaryService._income_total_select(user_id, year, month), 'scalar'),
+                'spent_by_rule': (SummaryService._spent_by_rule_select(user_id, year, month), 'all'),
+            })
+        except Exception as e:
+            print(f"Error loading rules status (async) for user {user_id}: {e}")
+            raise BudgetServiceError("Nepodarilo sa načítať príjmy za mesiac.") from e
+        return BudgetService.build_rules_status(results['income'] or 0, SummaryService._fold_spent_by_rule(results['spent_by_rule']))
+
+    @staticmethod
+    async def get_dashboard(year, month, user_id, days=SNAPSHOT_DEFAULT_DAYS):
+        today = datetime.now(timezone.utc).date()
+        return await AsyncReportService.get_or_compute(
+            user_id, 'dashboard', (year, month, days, today.isoformat()),
+            lambda: AsyncReportService._compute_dashboard(year, month, user_id, days),
+            precomputed=True
+        )
+
+    @staticmethod
+    async def _compute_dashboard(year, month, user_id, days):
+        """Rozpočty, mesačné súčty a všetky dotazy týždenného prehľadu naraz."""
+        start_date, end_date, queries = ReportService._weekly_snapshot_queries(user_id, days)
+        queries = {f'snapshot_{name}': query for name, query in queries.items()}
+        queries['budgets'] = (BudgetService._budget_rows_select(year, month, user_id), 'all')
+        queries['month_totals'] = (SummaryService._month_totals_select(user_id, year, month), 'all')
+        try:
+            results = await AsyncReportService._fetch(queries)
+        except Exception as e:
+            print(f"Error computing dashboard (async) {month}/{year} for user {user_id}: {e}")
+            raise DashboardServiceError("Nepodarilo sa načítať dashboard.") from e
+
+        budgets = results['budgets']
+        totals = SummaryService._fold_month_totals(results['month_totals'])
+        snapshot = ReportService._build_weekly_snapshot(days, start_date, end_date, {
+            name[len('snapshot_'):]: value for name, value in results.items() if name.startswith('snapshot_')
+        })
+        return {
+            'year': year,
+            'month': month,
+            'budgets': budget_rows.dump(budgets),
+            'budget_status': BudgetService.build_budget_status(budgets, totals['spent_by_category']),
+            'rules_status': BudgetService.build_rules_status(totals['income'], totals['spent_by_rule']),
+            'weekly_snapshot': snapshot,
+        }
@@ -1,6 +1,12 @@
+from sqlalchemy import func, and_, tuple_, select
 from ..database import db
-from ..models import Budget, Expense, Income
-from sqlalchemy import extract, func, and_
+from ..models import Budget, MonthlySummary
+from ..schemas import budget_rows
+from .summary_service import SummaryService
+from .cache_service import CacheService
+from ..utils.money_utils import from_cents
+from ..utils.date_utils import iter_months
+from .summary_service import EXPENSE
 
 class BudgetServiceError(Exception): pass
 class BudgetNotFoundError(BudgetServiceError): pass
@@ -14,6 +20,19 @@ class BudgetService:
             print(f"DB error getting budgets for {month}/{year} user {user_id}: {e}")
             raise BudgetServiceError("Nepodarilo sa načítať rozpočty.") from e
 
+    @staticmethod
+    def _budget_rows_select(year, month, user_id):
+        return select(*budget_rows.columns).where(Budget.year == year, Budget.month == month, Budget.user_id == user_id)
+
+    @staticmethod
+    def get_budget_rows_for_month(year, month, user_id):
+        """Ako get_budgets_for_month, ale len stĺpce pre budget_rows."""
+        try:
+            return db.session.execute(BudgetService._budget_rows_select(year, month, user_id)).all()
+        except Exception as e:
+            print(f"DB error getting budget rows for {month}/{year} user {user_id}: {e}")
+            raise BudgetServiceError("Nepodarilo sa načítať rozpočty.") from e
+
     @staticmethod
     def set_or_update_budget(budget_object, user_id):
         budget_object.user_id = user_id
@@ -25,6 +44,7 @@ class BudgetService:
         ).first()
 
         try:
+            CacheService.bump_data_version(user_id)
             if existing_budget:
                 existing_budget.amount = budget_object.amount
                 db.session.commit()
@@ -40,6 +60,14 @@ class BudgetService:
 
     @staticmethod
     def get_budget_status_for_month(year, month, user_id):
+        return CacheService.get_or_compute(
+            user_id, 'budget_status', (year, month),
+            lambda: BudgetService._compute_budget_status_for_month(year, month, user_id),
+            precomputed=True
+        )
+
+    @staticmethod
+    def _compute_budget_status_for_month(year, month, user_id):
         try:
             budgets = BudgetService.get_budgets_for_month(year, month, user_id)
         except BudgetServiceError as e: raise e
@@ -47,85 +75,129 @@ class BudgetService:
              print(f"Unexpected error fetching budgets in get_budget_status for user {user_id}: {e}")
              raise BudgetServiceError("Nastala neočakávaná chyba pri načítaní rozpočtov.") from e
 
-        status_list = []
-        if not budgets: return status_list
+        if not budgets: return []
 
         try:
-            all_expenses_for_month = db.session.query(
-                Expense.category,
-                func.sum(Expense.amount).label('total_spent')
-            ).filter(
-                Expense.user_id == user_id, # Filter by user
-                extract('year', Expense.date_created) == year,
-                extract('month', Expense.date_created) == month,
-                Expense.category.in_([b.category for b in budgets])
-            ).group_by(Expense.category).all()
-
-            spent_map = {category: total_spent for category, total_spent in all_expenses_for_month}
-
-            for budget in budgets:
-                spent_amount = spent_map.get(budget.category, 0.0)
-                remaining = budget.amount - spent_amount
-                percentage = (spent_amount / budget.amount * 100) if budget.amount > 0 else 0
-                status_list.append({
-                    'id': budget.id,
-                    'category': budget.category,
-                    'budgeted_amount': round(budget.amount, 2),
-                    'spent_amount': round(spent_amount, 2),
-                    'remaining_amount': round(remaining, 2),
-                    'percentage_spent': round(percentage, 1)
-                })
-            return status_list
+            # Bodové čítanie z predpočítaných mesačných súhrnov namiesto GROUP BY nad výdavkami
+            spent_map = SummaryService.get_spent_by_category(user_id, year, month, [b.category for b in budgets])
+            return BudgetService.build_budget_status(budgets, spent_map)
         except Exception as e:
             print(f"Error calculating budget status spending for user {user_id}: {e}")
             raise BudgetServiceError("Nepodarilo sa vypočítať čerpanie rozpočtov.") from e
 
     @staticmethod
-    def get_50_30_20_status(year, month, total_income, user_id):
-         default_status = {
-                 'needs': {'budgeted_percent': 50, 'spent_percent': 0, 'spent_amount': 0},
-                 'wants': {'budgeted_percent': 30, 'spent_percent': 0, 'spent_amount': 0},
-                 'savings_expenses': {'budgeted_percent': 20, 'spent_percent': 0, 'spent_amount': 0},
-                 'unclassified_amount': 0,
-                 'total_income': round(total_income, 2)
-             }
-         if total_income <= 0: return default_status
+    def get_budget_status_for_range(start, end, user_id):
+        """start a end sú (rok, mesiac) vrátane. Výsledok je v cache ako pri jednom mesiaci."""
+        return CacheService.get_or_compute(
+            user_id, 'budget_status_range', (start, end),
+            lambda: BudgetService._compute_budget_status_for_range(start, end, user_id)
+        )
+
+    @staticmethod
+    def _compute_budget_status_for_range(start, end, user_id):
+        """
+        Čerpanie rozpočtov za viac mesiacov jedným dotazom: rozpočty spojené s mesačnými súhrnmi
+        výdavkov a zoskupené podľa (rok, mesiac, kategória). Mesiace bez rozpočtov majú prázdny zoznam.
+        """
+        spent = func.coalesce(func.sum(MonthlySummary.total_cents), 0).label('spent_cents')
+        try:
+            rows = db.session.query(
+                Budget.id, Budget.year, Budget.month, Budget.category, Budget.amount_cents, spent
+            ).outerjoin(MonthlySummary, and_(
+                MonthlySummary.user_id == Budget.user_id, MonthlySummary.kind == EXPENSE,
+                MonthlySummary.year == Budget.year, MonthlySummary.month == Budget.month,
+                MonthlySummary.category == Budget.category,
+            )).filter(
+                Budget.user_id == user_id,
+                tuple_(Budget.year, Budget.month) >= start, tuple_(Budget.year, Budget.month) <= end,
+            ).group_by(
+                Budget.id, Budget.year, Budget.month, Budget.category, Budget.amount_cents
+            ).order_by(Budget.year, Budget.month, Budget.category).all()
+        except Exception as e:
+            print(f"DB error getting budget status {start}..{end} for user {user_id}: {e}")
+            raise BudgetServiceError("Nepodarilo sa vypočítať čerpanie rozpočtov.") from e
+
+        by_month = {key: [] for key in iter_months(start, end)}
+        for row in rows:
+            by_month[(row.year, row.month)].append(row)
+        return [
+            {'year': year, 'month': month,
+             'budgets': BudgetService.build_budget_status(month_rows, {row.category: row.spent_cents for row in month_rows})}
+            for (year, month), month_rows in by_month.items()
+        ]
+
+    @staticmethod
+    def build_budget_status(budgets, spent_map):
+        """Stav čerpania z rozpočtov a súčtov výdavkov v centoch podľa kategórie."""
+        status_list = []
+        for budget in budgets:
+            spent_cents = spent_map.get(budget.category, 0)
+            percentage = (spent_cents / budget.amount_cents * 100) if budget.amount_cents > 0 else 0
+            status_list.append({
+                'id': budget.id,
+                'category': budget.category,
+                'budgeted_amount': from_cents(budget.amount_cents),
+                'spent_amount': from_cents(spent_cents),
+                'remaining_amount': from_cents(budget.amount_cents - spent_cents),
+                'percentage_spent': round(percentage, 1)
+            })
+        return status_list
+
+    @staticmethod
+    def _default_rules_status(income_cents):
+        return {
+            'needs': {'budgeted_percent': 50, 'spent_percent': 0, 'spent_amount': 0},
+            'wants': {'budgeted_percent': 30, 'spent_percent': 0, 'spent_amount': 0},
+            'savings_expenses': {'budgeted_percent': 20, 'spent_percent': 0, 'spent_amount': 0},
+            'unclassified_amount': 0,
+            'total_income': from_cents(income_cents)
+        }
+
+    @staticmethod
+    def build_rules_status(income_cents, spending_by_rule):
+        """Stav 50/30/20 z príjmu a súčtov podľa rule_category (nezaradené pod kľúčom None), všetko v centoch."""
+        if income_cents <= 0: return BudgetService._default_rules_status(income_cents)
+
+        def rule_status(budgeted_percent, spent_cents):
+            return {
+                'budgeted_percent': budgeted_percent,
+                'spent_percent': round(spent_cents / income_cents * 100, 1),
+                'spent_amount': from_cents(spent_cents)
+            }
+
+        return {
+            'needs': rule_status(50, spending_by_rule.get('Needs', 0)),
+            'wants': rule_status(30, spending_by_rule.get('Wants', 0)),
+            'savings_expenses': rule_status(20, spending_by_rule.get('Savings', 0)),
+            'unclassified_amount': from_cents(spending_by_rule.get(None, 0)),
+            'total_income': from_cents(income_cents)
+        }
+
+    @staticmethod
+    def get_rules_status(year, month, user_id):
+        """Stav 50/30/20 vrátane príjmu za mesiac, výsledok je v cache."""
+        return CacheService.get_or_compute(
+            user_id, 'rules_status', (year, month),
+            lambda: BudgetService._compute_rules_status(year, month, user_id),
+            precomputed=True
+        )
+
+    @staticmethod
+    def _compute_rules_status(year, month, user_id):
+        try:
+            income_cents = SummaryService.get_income_total(user_id, year, month)
+        except Exception as e:
+            print(f"Error loading income total for rules status for user {user_id}: {e}")
+            raise BudgetServiceError("Nepodarilo sa načítať príjmy za mesiac.") from e
+        return BudgetService.get_50_30_20_status(year, month, income_cents, user_id)
 
+    @staticmethod
+    def get_50_30_20_status(year, month, income_cents, user_id):
+         """income_cents je príjem za mesiac v centoch, percentá sa počítajú z presných súčtov."""
+         if income_cents <= 0: return BudgetService._default_rules_status(income_cents)
          try:
-             spending_by_rule = db.session.query(
-                 Expense.rule_category,
-                 func.sum(Expense.amount).label('total_spent')
-             ).filter(
-                 Expense.user_id == user_id, # Filter by user
-                 extract('year', Expense.date_created) == year,
-                 extract('month', Expense.date_created) == month
-             ).group_by(Expense.rule_category).all()
-
-             spent_map = {rule: total for rule, total in spending_by_rule if rule}
-             unclassified_spent = sum(total for rule, total in spending_by_rule if not rule)
-             needs_spent = spent_map.get('Needs', 0.0)
-             wants_spent = spent_map.get('Wants', 0.0)
-             savings_spent_as_expense = spent_map.get('Savings', 0.0)
-
-             return {
-                 'needs': {
-                     'budgeted_percent': 50,
-                     'spent_percent': round((needs_spent / total_income) * 100, 1) if total_income > 0 else 0,
-                     'spent_amount': round(needs_spent, 2)
-                 },
-                 'wants': {
-                     'budgeted_percent': 30,
-                     'spent_percent': round((wants_spent / total_income) * 100, 1) if total_income > 0 else 0,
-                     'spent_amount': round(wants_spent, 2)
-                 },
-                 'savings_expenses': {
-                     'budgeted_percent': 20,
-                     'spent_percent': round((savings_spent_as_expense / total_income) * 100, 1) if total_income > 0 else 0,
-                     'spent_amount': round(savings_spent_as_expense, 2)
-                 },
-                 'unclassified_amount': round(unclassified_spent, 2),
-                 'total_income': round(total_income, 2)
-             }
+             spending_by_rule = SummaryService.get_spent_by_rule(user_id, year, month)
+             return BudgetService.build_rules_status(income_cents, spending_by_rule)
          except Exception as e:
              print(f"Error calculating 50/30/20 status spending for user {user_id}: {e}")
-             return default_status
\ No newline at end of file
+             return BudgetService._default_rules_status(income_cents)
@@ -0,0 +1,71 @@
+# backend/app/services/cache_service.py
+import json
+from sqlalchemy import select, update, delete, insert
+from ..database import db
+from ..models import User, ReportCache
+from ..utils.cache_utils import get_cache, MISSING
+
+class CacheService:
+    """
+    Cache prehľadov kľúčovaná verziou dát používateľa. Každý zápis (výdavky, príjmy,
+    rozpočty, fokus) zvýši User.data_version, takže staré záznamy sa už nikdy nenájdu
+    a netreba ich explicitne mazať. Opakované načítanie stojí jeden dotaz na verziu.
+    """
+
+    @staticmethod
+    def _data_version_select(user_id):
+        return select(User.data_version).where(User.id == user_id)
+
+    @staticmethod
+    def get_data_version(user_id):
+        return db.session.execute(CacheService._data_version_select(user_id)).scalar() or 0
+
+    @staticmethod
+    def bump_data_version(user_id):
+        """Necommituje, volá sa v transakcii zápisu pred commitom."""
+        db.session.execute(update(User).where(User.id == user_id).values(data_version=User.data_version + 1))
+
+    @staticmethod
+    def params_key(params):
+        return json.dumps(list(params), separators=(',', ':'))
+
+    @staticmethod
+    def get_precomputed(user_id, name, params, data_version):
+        """Výsledok z report_cache, ak bol spočítaný pre aktuálnu verziu dát, inak MISSING."""
+        payload = db.session.execute(CacheService._precomputed_select(user_id, name, params, data_version)).scalar()
+        return json.loads(payload) if payload is not None else MISSING
+
+    @staticmethod
+    def _precomputed_select(user_id, name, params, data_version):
+        return select(ReportCache.payload).where(
+            ReportCache.user_id == user_id, ReportCache.name == name,
+            ReportCache.params == CacheService.params_key(params), ReportCache.data_version == data_version
+        )
+
+    @staticmethod
+    def store_precomputed(user_id, name, params, data_version, value):
+        """Prepíše záznam v report_cache. Necommituje."""
+        key = {'user_id': user_id, 'name': name, 'params': CacheService.params_key(params)}
+        db.session.execute(delete(ReportCache).filter_by(**key))
+        db.session.execute(insert(ReportCache).values(**key, data_version=data_version, payload=json.dumps(value)))
+
+    @staticmethod
+    def get_or_compute(user_id, name, params, compute, precomputed=False):
+        """
+        Poradie: cache v pamäti, pri precomputed=True tabuľka report_cache (nočný prepočet),
+        nakoniec výpočet naživo.
+        """
+        cache = get_cache()
+        data_version = CacheService.get_data_version(user_id)
+        key = (user_id, data_version, name, params)
+        value = cache.get(key)
+        if value is MISSING and precomputed:
+            value = CacheService.get_precomputed(user_id, name, params, data_version)
+            if value is not MISSING:
+                cache.set(key, value)
+        if value is MISSING:
+            value = compute()
+            # Chybové odpovede (napr. {"error": ...} z reportov) neukladáme
+            if not (isinstance(value, dict) and value.get('error')):
+                cache.set(key, value)
+        return value
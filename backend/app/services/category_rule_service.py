@@ -0,0 +1,97 @@
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from ..database import db
+from ..models import CategoryRule, User
+from ..utils.categorize_utils import Categorizer, get_categorizer_cache
+from ..utils.cache_utils import MISSING
+
+class CategoryRuleServiceError(Exception): pass
+class CategoryRuleNotFoundError(CategoryRuleServiceError): pass
+class CategoryRuleConflictError(CategoryRuleServiceError): pass
+
+class CategoryRuleService:
+    @staticmethod
+    def get_rules(user_id):
+        try:
+            return CategoryRule.query.filter_by(user_id=user_id).order_by(CategoryRule.priority.desc(), CategoryRule.id).all()
+        except Exception as e:
+            print(f"DB error getting category rules for user {user_id}: {e}")
+            raise CategoryRuleServiceError("Nepodarilo sa načítať pravidlá kategorizácie.") from e
+
+    @staticmethod
+    def get_rule_by_id(rule_id, user_id):
+        rule = db.session.get(CategoryRule, rule_id)
+        if not rule or rule.user_id != user_id:
+            raise CategoryRuleNotFoundError(f"Pravidlo s ID {rule_id} nebolo nájdené.")
+        return rule
+
+    @staticmethod
+    def bump_rules_version(user_id):
+        """Necommituje. Nová verzia znamená nový kľúč v cache, starý automat sa už nepoužije."""
+        db.session.execute(update(User).where(User.id == user_id).values(rules_version=User.rules_version + 1))
+
+    @staticmethod
+    def create_rule(data, user_id):
+        try:
+            rule = CategoryRule(user_id=user_id, **data)
+            db.session.add(rule)
+            CategoryRuleService.bump_rules_version(user_id)
+            db.session.commit()
+            return rule
+        except IntegrityError as e:
+            db.session.rollback()
+            raise CategoryRuleConflictError("Pravidlo s rovnakým vzorom už existuje.") from e
+        except Exception as e:
+            db.session.rollback()
+            print(f"DB error creating category rule for user {user_id}: {e}")
+            raise CategoryRuleServiceError("Nepodarilo sa uložiť pravidlo.") from e
+
+    @staticmethod
+    def update_rule(rule_id, data, user_id):
+        """PUT nahrádza celé pravidlo, vynechaná category / rule_category sa vymaže."""
+        rule = CategoryRuleService.get_rule_by_id(rule_id, user_id)
+        try:
+            for key in ('pattern', 'match_type', 'category', 'rule_category', 'priority'):
+                setattr(rule, key, data.get(key))
+            CategoryRuleService.bump_rules_version(user_id)
+            db.session.commit()
+            return rule
+        except IntegrityError as e:
+            db.session.rollback()
+            raise CategoryRuleConflictError("Pravidlo s rovnakým vzorom už existuje.") from e
+        except Exception as e:
+            db.session.rollback()
+            print(f"DB error updating category rule {rule_id} for user {user_id}: {e}")
+            raise CategoryRuleServiceError(f"Nepodarilo sa aktualizovať pravidlo s ID {rule_id}.") from e
+
+    @staticmethod
+    def delete_rule(rule_id, user_id):
+        rule = CategoryRuleService.get_rule_by_id(rule_id, user_id)
+        try:
+            db.session.delete(rule)
+            CategoryRuleService.bump_rules_version(user_id)
+            db.session.commit()
+            return True
+        except Exception as e:
+            db.session.rollback()
+            print(f"DB error deleting category rule {rule_id} for user {user_id}: {e}")
+            raise CategoryRuleServiceError(f"Nepodarilo sa vymazať pravidlo s ID {rule_id}.") from e
+
+    @staticmethod
+    def get_categorizer(user_id):
+        """
+        Skompilovaný automat pravidiel používateľa z cache (kľúč user_id + rules_version).
+        Pri zmene pravidiel sa postaví nanovo, inak stojí jedno čítanie rules_version.
+        """
+        version = db.session.query(User.rules_version).filter(User.id == user_id).scalar() or 0
+        cache = get_categorizer_cache()
+        key = (user_id, version)
+        categorizer = cache.get(key)
+        if categorizer is MISSING:
+            rules = db.session.query(
+                CategoryRule.id, CategoryRule.pattern, CategoryRule.match_type,
+                CategoryRule.category, CategoryRule.rule_category, CategoryRule.priority
+            ).filter(CategoryRule.user_id == user_id).all()
+            categorizer = Categorizer(rules)
+            cache.set(key, categorizer)
+        return categorizer
@@ -0,0 +1,63 @@
+# backend/app/services/dashboard_service.py
+import time
+from datetime import datetime, timezone
+from ..schemas import budgets_schema
+from .budget_service import BudgetService, BudgetServiceError
+from .report_service import ReportService, SNAPSHOT_DEFAULT_DAYS
+from .summary_service import SummaryService
+from .cache_service import CacheService
+
+class DashboardServiceError(Exception): pass
+
+class DashboardService:
+    """
+    Všetky dáta dashboardu v jednej požiadavke. Rozpočty sa načítajú raz a mesačné súčty
+    (výdavky podľa kategórie aj rule_category, príjem) jedným dotazom nad monthly_summary.
+    """
+
+    @staticmethod
+    def get_dashboard(year, month, user_id, days=SNAPSHOT_DEFAULT_DAYS, timings=None):
+        """timings: ak je zadaný slovník, doplní sa časom jednotlivých sekcií (ms) a cache sa obíde."""
+        if timings is not None:
+            return DashboardService._compute_dashboard(year, month, user_id, days, timings)
+        today = datetime.now(timezone.utc).date()
+        return CacheService.get_or_compute(
+            user_id, 'dashboard', (year, month, days, today.isoformat()),
+            lambda: DashboardService._compute_dashboard(year, month, user_id, days),
+            precomputed=True
+        )
+
+    @staticmethod
+    def _compute_dashboard(year, month, user_id, days, timings=None):
+        timings = {} if timings is None else timings
+
+        def timed(section, compute):
+            started = time.perf_counter()
+            result = compute()
+            timings[section] = round((time.perf_counter() - started) * 1000, 2)
+            return result
+
+        try:
+            budgets = timed('budgets', lambda: BudgetService.get_budgets_for_month(year, month, user_id))
+            totals = timed('month_totals', lambda: SummaryService.get_month_totals(user_id, year, month))
+            budget_status = timed('budget_status', lambda: BudgetService.build_budget_status(budgets, totals['spent_by_category']))
+            rules_status = timed('rules_status', lambda: BudgetService.build_rules_status(totals['income'], totals['spent_by_rule']))
+            budgets_data = timed('budgets_dump', lambda: budgets_schema.dump(budgets))
+        except BudgetServiceError as e:
+            raise DashboardServiceError(str(e)) from e
+        except Exception as e:
+            print(f"Error computing dashboard {month}/{year} for user {user_id}: {e}")
+            raise DashboardServiceError("Nepodarilo sa načítať dashboard.") from e
+
+        snapshot = timed('weekly_snapshot', lambda: ReportService._compute_weekly_snapshot(user_id, days))
+        if isinstance(snapshot, dict) and snapshot.get("error"):
+            raise DashboardServiceError(snapshot["error"])
+
+        return {
+            'year': year,
+            'month': month,
+            'budgets': budgets_data,
+            'budget_status': budget_status,
+            'rules_status': rules_status,
+            'weekly_snapshot': snapshot,
+        }
@@ -1,23 +1,98 @@
 from ..database import db
 from ..models import Expense
+from ..schemas import expense_import_schema, expense_rows
+from ..utils.date_utils import to_utc_naive
+from ..utils.money_utils import to_cents
+from ..utils.import_utils import validate_import_chunk
+from ..utils.pagination_utils import keyset_page, order_by_sort, DEFAULT_SORT
+from ..utils.filter_utils import apply_list_filters
+from ..utils.search_utils import search_rows
+from .summary_service import SummaryService, EXPENSE
+from .cache_service import CacheService
+from .category_rule_service import CategoryRuleService
+from ..utils.categorize_utils import UNCATEGORIZED, normalize_text
+from sqlalchemy import insert, update, or_
+from datetime import datetime, timezone
+import time
 
 class ExpenseServiceError(Exception): pass
 class ExpenseNotFoundError(ExpenseServiceError): pass
 
+BULK_CHUNK_SIZE = 1000
+# Počet id v jednom UPDATE ... WHERE id IN (...) pri prekategorizovaní
+RECATEGORIZE_CHUNK_SIZE = 500
+
 class ExpenseService:
     @staticmethod
     def get_all_expenses(user_id):
         try:
-            return Expense.query.filter_by(user_id=user_id).order_by(Expense.date_created.desc()).all()
+            return Expense.query.filter_by(user_id=user_id).order_by(Expense.date_created.desc(), Expense.id.desc()).all()
         except Exception as e:
             print(f"DB error getting expenses for user {user_id}: {e}")
             raise ExpenseServiceError("Nepodarilo sa načítať výdavky.") from e
 
+    @staticmethod
+    def get_expenses_page(user_id, limit, cursor=None):
+        try:
+            return keyset_page(Expense.query.filter_by(user_id=user_id), Expense, limit, cursor)
+        except Exception as e:
+            print(f"DB error getting expenses page for user {user_id}: {e}")
+            raise ExpenseServiceError("Nepodarilo sa načítať výdavky.") from e
+
+    @staticmethod
+    def get_all_expense_rows(user_id, filters=None, sort=DEFAULT_SORT):
+        """Ako get_all_expenses, ale len stĺpce pre expense_rows (n-tice namiesto ORM objektov)."""
+        try:
+            query = apply_list_filters(db.session.query(*expense_rows.columns).filter(Expense.user_id == user_id), Expense, filters)
+            return order_by_sort(query, Expense, sort).all()
+        except Exception as e:
+            print(f"DB error getting expense rows for user {user_id}: {e}")
+            raise ExpenseServiceError("Nepodarilo sa načítať výdavky.") from e
+
+    @staticmethod
+    def get_expense_rows_page(user_id, limit, cursor=None, filters=None, sort=DEFAULT_SORT):
+        try:
+            query = apply_list_filters(db.session.query(*expense_rows.columns).filter(Expense.user_id == user_id), Expense, filters)
+            return keyset_page(query, Expense, limit, cursor, sort)
+        except Exception as e:
+            print(f"DB error getting expense rows page for user {user_id}: {e}")
+            raise ExpenseServiceError("Nepodarilo sa načítať výdavky.") from e
+
+    @staticmethod
+    def search_expenses(user_id, text, limit, offset=0):
+        """Fulltext nad popisom a kategóriou, vracia (riadky pre expense_rows, next_offset). Prázdny dopyt = ValueError."""
+        try:
+            return search_rows(Expense, expense_rows.columns, user_id, text, limit, offset)
+        except ValueError:
+            raise
+        except Exception as e:
+            print(f"DB error searching expenses for user {user_id}: {e}")
+            raise ExpenseServiceError("Nepodarilo sa vyhľadať výdavky.") from e
+
+    @staticmethod
+    def iter_expenses(user_id, batch_size=1000):
+        """
+        Generátor cez všetky záznamy používateľa, z databázy sa načítavajú po dávkach (yield_per).
+        Chyba DB nastane až pri čítaní, preto je celé čítanie v try.
+        """
+        try:
+            yield from Expense.query.filter_by(user_id=user_id).order_by(Expense.date_created.desc(), Expense.id.desc()).yield_per(batch_size)
+        except Exception as e:
+            print(f"DB error exporting expenses for user {user_id}: {e}")
+            raise ExpenseServiceError("Nepodarilo sa exportovať výdavky.") from e
+
     @staticmethod
     def add_new_expense(expense_object, user_id):
         expense_object.user_id = user_id
         try:
+            # Pravidlá dopĺňajú len chýbajúcu kategóriu / rule_category, ručne zadané hodnoty ostávajú
+            expense_object.category, expense_object.rule_category = CategoryRuleService.get_categorizer(user_id).apply(
+                expense_object.description, expense_object.category, expense_object.rule_category
+            )
             db.session.add(expense_object)
+            db.session.flush() # Doplní predvolené hodnoty (dátum, kategória) pred zápisom do súhrnu
+            SummaryService.record_expense(expense_object)
+            CacheService.bump_data_version(user_id)
             db.session.commit()
             return expense_object
         except Exception as e:
@@ -25,6 +100,95 @@ class ExpenseService:
             print(f"DB error adding expense for user {user_id}: {e}")
             raise ExpenseServiceError("Nepodarilo sa pridať výdavok.") from e
 
+    @staticmethod
+    def bulk_add_expenses(rows, user_id, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Hromadný import. Riadky sa validujú po dávkach a každá dávka sa vloží
+        jedným INSERT-om v samostatnej transakcii. Vracia počet vložených riadkov a chyby po riadkoch.
+        """
+        inserted, errors = 0, []
+        now = datetime.now(timezone.utc)
+        categorizer = CategoryRuleService.get_categorizer(user_id)
+        for offset in range(0, len(rows), chunk_size):
+            chunk = rows[offset:offset + chunk_size]
+            valid, chunk_errors = validate_import_chunk(expense_import_schema, chunk, offset)
+            errors.extend(chunk_errors)
+            if not valid: continue
+            for data in valid:
+                data['user_id'] = user_id
+                data['date_created'] = to_utc_naive(data['date_created']) if data.get('date_created') else now
+                data['amount_cents'] = to_cents(data.pop('amount'))
+                data['category'], data['rule_category'] = categorizer.apply(
+                    data['description'], data.get('category', UNCATEGORIZED), data.get('rule_category')
+                )
+            try:
+                db.session.execute(insert(Expense), valid)
+                SummaryService.record_bulk(EXPENSE, valid)
+                CacheService.bump_data_version(user_id)
+                db.session.commit()
+                inserted += len(valid)
+            except Exception as e:
+                db.session.rollback()
+                print(f"DB error bulk inserting expenses chunk at row {offset} for user {user_id}: {e}")
+                errors.append({"rows": [offset, offset + len(chunk) - 1], "messages": {"_schema": ["Nepodarilo sa uložiť dávku."]}})
+        return {"inserted": inserted, "failed": len(rows) - inserted, "errors": errors}
+
+    @staticmethod
+    def recategorize_expenses(user_id, only_uncategorized=True, chunk_size=RECATEGORIZE_CHUNK_SIZE):
+        """
+        Použije aktuálne pravidlá na históriu výdavkov. Riadky sa čítajú len ako (id, popis, kategórie),
+        výsledok sa pamätá pre každý normalizovaný popis (opakujúci sa obchodníci) a zmeny sa zapíšu
+        hromadne: jeden UPDATE ... WHERE id IN (...) na cieľovú dvojicu a dávku id.
+        only_uncategorized=False prepíše aj ručne zadané hodnoty, ak niektoré pravidlo sedí.
+        """
+        started = time.perf_counter()
+        categorizer = CategoryRuleService.get_categorizer(user_id)
+        scanned, targets = 0, {}
+        if len(categorizer):
+            query = db.session.query(Expense.id, Expense.description, Expense.category, Expense.rule_category).filter(Expense.user_id == user_id)
+            if only_uncategorized:
+                query = query.filter(or_(Expense.category.is_(None), Expense.category.in_(('', UNCATEGORIZED)), Expense.rule_category.is_(None)))
+            matches = {}
+            try:
+                for expense_id, description, category, rule_category in query.yield_per(RECATEGORIZE_CHUNK_SIZE * 10):
+                    scanned += 1
+                    key = normalize_text(description)
+                    if key not in matches:
+                        matches[key] = categorizer.match(description)
+                    matched = matches[key]
+                    if matched is None:
+                        continue
+                    if only_uncategorized:
+                        target = categorizer.fill_missing(matched, category, rule_category)
+                    else:
+                        target = (matched[0] or category, matched[1] or rule_category)
+                    if target != (category, rule_category):
+                        targets.setdefault(target, []).append(expense_id)
+            except Exception as e:
+                print(f"DB error reading expenses to recategorize for user {user_id}: {e}")
+                raise ExpenseServiceError("Nepodarilo sa načítať výdavky.") from e
+
+        updated = sum(len(ids) for ids in targets.values())
+        if updated:
+            try:
+                for (category, rule_category), ids in targets.items():
+                    for offset in range(0, len(ids), chunk_size):
+                        db.session.execute(
+                            update(Expense).where(Expense.id.in_(ids[offset:offset + chunk_size]))
+                            .values(category=category, rule_category=rule_category)
+                            .execution_options(synchronize_session=False)
+                        )
+                # Súhrny podľa kategórie a rule_category sa prepočítajú v tej istej transakcii, aby prehľad
+                # nikdy nevidel novú data_version so starými súhrnmi (a neuložil ich do cache pod ňou)
+                SummaryService.rebuild(user_id, commit=False)
+                CacheService.bump_data_version(user_id)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                print(f"DB error recategorizing expenses for user {user_id}: {e}")
+                raise ExpenseServiceError("Nepodarilo sa prekategorizovať výdavky.") from e
+        return {"scanned": scanned, "updated": updated, "seconds": round(time.perf_counter() - started, 3)}
+
     @staticmethod
     def get_expense_by_id(expense_id, user_id):
         try:
@@ -43,12 +207,15 @@ class ExpenseService:
     def update_expense(expense_id, update_payload, user_id):
         try:
             expense_to_update = ExpenseService.get_expense_by_id(expense_id, user_id)
+            SummaryService.record_expense(expense_to_update, sign=-1)
             expense_to_update.description = update_payload.description
             expense_to_update.amount = update_payload.amount
             if hasattr(update_payload, 'category'):
                  expense_to_update.category = update_payload.category
             if hasattr(update_payload, 'rule_category'):
                 expense_to_update.rule_category = update_payload.rule_category
+            SummaryService.record_expense(expense_to_update)
+            CacheService.bump_data_version(user_id)
             db.session.commit()
             return expense_to_update
         except ExpenseNotFoundError: raise
@@ -61,7 +228,9 @@ class ExpenseService:
     def delete_expense_by_id(expense_id, user_id):
         try:
             expense_to_delete = ExpenseService.get_expense_by_id(expense_id, user_id)
+            SummaryService.record_expense(expense_to_delete, sign=-1)
             db.session.delete(expense_to_delete)
+            CacheService.bump_data_version(user_id)
             db.session.commit()
             return True
         except ExpenseNotFoundError: raise
@@ -1,23 +1,89 @@
 from ..database import db
 from ..models import Income
+from ..schemas import income_import_schema, income_rows
+from ..utils.date_utils import to_utc_naive
+from ..utils.money_utils import to_cents
+from ..utils.import_utils import validate_import_chunk
+from ..utils.pagination_utils import keyset_page, order_by_sort, DEFAULT_SORT
+from ..utils.filter_utils import apply_list_filters
+from ..utils.search_utils import search_rows
+from .summary_service import SummaryService, INCOME
+from .cache_service import CacheService
+from sqlalchemy import insert
+from datetime import datetime, timezone
 
 class IncomeServiceError(Exception): pass
 class IncomeNotFoundError(IncomeServiceError): pass
 
+BULK_CHUNK_SIZE = 1000
+
 class IncomeService:
     @staticmethod
     def get_all_incomes(user_id):
         try:
-            return Income.query.filter_by(user_id=user_id).order_by(Income.date_created.desc()).all()
+            return Income.query.filter_by(user_id=user_id).order_by(Income.date_created.desc(), Income.id.desc()).all()
         except Exception as e:
             print(f"DB error retrieving incomes for user {user_id}: {e}")
             raise IncomeServiceError("Nepodarilo sa načítať príjmy.") from e
 
+    @staticmethod
+    def get_incomes_page(user_id, limit, cursor=None):
+        try:
+            return keyset_page(Income.query.filter_by(user_id=user_id), Income, limit, cursor)
+        except Exception as e:
+            print(f"DB error retrieving incomes page for user {user_id}: {e}")
+            raise IncomeServiceError("Nepodarilo sa načítať príjmy.") from e
+
+    @staticmethod
+    def get_all_income_rows(user_id, filters=None, sort=DEFAULT_SORT):
+        """Ako get_all_incomes, ale len stĺpce pre income_rows (n-tice namiesto ORM objektov)."""
+        try:
+            query = apply_list_filters(db.session.query(*income_rows.columns).filter(Income.user_id == user_id), Income, filters)
+            return order_by_sort(query, Income, sort).all()
+        except Exception as e:
+            print(f"DB error retrieving income rows for user {user_id}: {e}")
+            raise IncomeServiceError("Nepodarilo sa načítať príjmy.") from e
+
+    @staticmethod
+    def get_income_rows_page(user_id, limit, cursor=None, filters=None, sort=DEFAULT_SORT):
+        try:
+            query = apply_list_filters(db.session.query(*income_rows.columns).filter(Income.user_id == user_id), Income, filters)
+            return keyset_page(query, Income, limit, cursor, sort)
+        except Exception as e:
+            print(f"DB error retrieving income rows page for user {user_id}: {e}")
+            raise IncomeServiceError("Nepodarilo sa načítať príjmy.") from e
+
+    @staticmethod
+    def search_incomes(user_id, text, limit, offset=0):
+        """Fulltext nad popisom a zdrojom, vracia (riadky pre income_rows, next_offset). Prázdny dopyt = ValueError."""
+        try:
+            return search_rows(Income, income_rows.columns, user_id, text, limit, offset)
+        except ValueError:
+            raise
+        except Exception as e:
+            print(f"DB error searching incomes for user {user_id}: {e}")
+            raise IncomeServiceError("Nepodarilo sa vyhľadať príjmy.") from e
+
+    @staticmethod
+    def iter_incomes(user_id, batch_size=1000):
+        """
+        Generátor cez všetky záznamy používateľa, z databázy sa načítavajú po dávkach (yield_per).
+        Chyba DB nastane až pri čítaní, preto je celé čítanie v try.
+        """
+        try:
+            yield from Income.query.filter_by(user_id=user_id).order_by(Income.date_created.desc(), Income.id.desc()).yield_per(batch_size)
+        except Exception as e:
+            print(f"DB error exporting incomes for user {user_id}: {e}")
+            raise IncomeServiceError("Nepodarilo sa exportovať príjmy.") from e
+
     @staticmethod
     def add_new_income(income_object, user_id):
         income_object.user_id = user_id
         try:
             db.session.add(income_object)
+            db.session.flush() # Doplní predvolené hodnoty (dátum, kategória) pred zápisom do súhrnu
+            SummaryService.record_income(income_object)
+            CacheService.bump_data_version(user_id)
             db.session.commit()
             return income_object
         except Exception as e:
@@ -25,6 +91,36 @@ class IncomeService:
             print(f"DB error adding income for user {user_id}: {e}")
             raise IncomeServiceError("Nepodarilo sa pridať príjem.") from e
 
+    @staticmethod
+    def bulk_add_incomes(rows, user_id, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Hromadný import. Riadky sa validujú po dávkach a každá dávka sa vloží
+        jedným INSERT-om v samostatnej transakcii. Vracia počet vložených riadkov a chyby po riadkoch.
+        """
+        inserted, errors = 0, []
+        now = datetime.now(timezone.utc)
+        for offset in range(0, len(rows), chunk_size):
+            chunk = rows[offset:offset + chunk_size]
+            valid, chunk_errors = validate_import_chunk(income_import_schema, chunk, offset)
+            errors.extend(chunk_errors)
+            if not valid: continue
+            for data in valid:
+                data['user_id'] = user_id
+                data['date_created'] = to_utc_naive(data['date_created']) if data.get('date_created') else now
+                data['amount_cents'] = to_cents(data.pop('amount'))
+                data.setdefault('source', 'Neznámy zdroj')
+            try:
+                db.session.execute(insert(Income), valid)
+                SummaryService.record_bulk(INCOME, valid)
+                CacheService.bump_data_version(user_id)
+                db.session.commit()
+                inserted += len(valid)
+            except Exception as e:
+                db.session.rollback()
+                print(f"DB error bulk inserting incomes chunk at row {offset} for user {user_id}: {e}")
+                errors.append({"rows": [offset, offset + len(chunk) - 1], "messages": {"_schema": ["Nepodarilo sa uložiť dávku."]}})
+        return {"inserted": inserted, "failed": len(rows) - inserted, "errors": errors}
+
     @staticmethod
     def get_income_by_id(income_id, user_id):
         try:
@@ -43,10 +139,13 @@ class IncomeService:
     def update_income(income_id, update_payload, user_id):
         try:
             income_to_update = IncomeService.get_income_by_id(income_id, user_id)
+            SummaryService.record_income(income_to_update, sign=-1)
             income_to_update.description = update_payload.description
             income_to_update.amount = update_payload.amount
             if hasattr(update_payload, 'source'):
                 income_to_update.source = update_payload.source
+            SummaryService.record_income(income_to_update)
+            CacheService.bump_data_version(user_id)
             db.session.commit()
             return income_to_update
         except IncomeNotFoundError: raise
@@ -59,7 +158,9 @@ class IncomeService:
     def delete_income_by_id(income_id, user_id):
         try:
             income_to_delete = IncomeService.get_income_by_id(income_id, user_id)
+            SummaryService.record_income(income_to_delete, sign=-1)
             db.session.delete(income_to_delete)
+            CacheService.bump_data_version(user_id)
             db.session.commit()
             return True
         except IncomeNotFoundError: raise
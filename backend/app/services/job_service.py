@@ -0,0 +1,153 @@
+# backend/app/services/job_service.py
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from flask import current_app
+from sqlalchemy import select, update, func
+from ..database import db
+from ..models import Job
+from ..models.job import JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED
+
+class JobServiceError(Exception): pass
+class JobNotFoundError(JobServiceError): pass
+class JobLimitError(JobServiceError): pass
+
+JOB_ACTIVE_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+JOB_LIST_LIMIT = 50
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+class JobService:
+    """
+    Fronta úloh v tabuľke job. Zápisy priebehu a stavu idú krátkymi transakciami
+    mimo db.session úlohy, aby nerušili jej čítanie (napr. yield_per pri exporte).
+    """
+
+    @staticmethod
+    def results_dir():
+        path = current_app.config.get('JOB_RESULTS_DIR') or os.path.join(current_app.instance_path, 'job_results')
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @staticmethod
+    def result_path(job):
+        return os.path.join(JobService.results_dir(), f"{job.id}_{job.result_filename}")
+
+    @staticmethod
+    def enqueue(user_id, kind, params):
+        """Zaradí úlohu do fronty. Počet čakajúcich a bežiacich úloh používateľa je obmedzený."""
+        limit = current_app.config.get('JOB_MAX_ACTIVE_PER_USER', 3)
+        try:
+            active = db.session.query(func.count(Job.id)).filter(
+                Job.user_id == user_id, Job.status.in_(JOB_ACTIVE_STATUSES)
+            ).scalar()
+            if active >= limit:
+                raise JobLimitError(f"Najviac {limit} úlohy môžu naraz čakať alebo bežať.")
+            job = Job(user_id=user_id, kind=kind, params=json.dumps(params, sort_keys=True))
+            db.session.add(job)
+            db.session.commit()
+            return job
+        except JobLimitError:
+            raise
+        except Exception as e:
+            db.session.rollback()
+            print(f"DB error enqueuing {kind} job for user {user_id}: {e}")
+            raise JobServiceError("Nepodarilo sa zaradiť úlohu.") from e
+
+    @staticmethod
+    def get_job(job_id, user_id):
+        job = db.session.query(Job).filter_by(id=job_id, user_id=user_id).first()
+        if job is None:
+            raise JobNotFoundError(f"Úloha {job_id} neexistuje.")
+        return job
+
+    @staticmethod
+    def list_jobs(user_id, limit=JOB_LIST_LIMIT):
+        try:
+            return Job.query.filter_by(user_id=user_id).order_by(Job.created_at.desc(), Job.id.desc()).limit(limit).all()
+        except Exception as e:
+            print(f"DB error listing jobs for user {user_id}: {e}")
+            raise JobServiceError("Nepodarilo sa načítať úlohy.") from e
+
+    # --- Worker ---
+    @staticmethod
+    def claim_next():
+        """
+        Zoberie najstaršiu čakajúcu úlohu. Podmienka status='queued' v UPDATE zaručí,
+        že ju dostane len jeden worker (aj z iného procesu). Vracia id alebo None.
+        """
+        with db.engine.connect() as connection:
+            while True:
+                job_id = connection.execute(
+                    select(Job.id).where(Job.status == JOB_QUEUED).order_by(Job.id).limit(1)
+                ).scalar()
+                # Čítanie a zápis v samostatných transakciách: SQLite nevie povýšiť zastaraný snapshot na zápis
+                connection.commit()
+                if job_id is None:
+                    return None
+                now = _utcnow()
+                claimed = connection.execute(
+                    update(Job).where(Job.id == job_id, Job.status == JOB_QUEUED).values(
+                        status=JOB_RUNNING, started_at=now, heartbeat_at=now, attempts=Job.attempts + 1,
+                        progress=0, message=None
+                    )
+                ).rowcount
+                connection.commit()
+                if claimed:
+                    return job_id
+
+    @staticmethod
+    def _update(job_id, **values):
+        with db.engine.begin() as connection:
+            connection.execute(update(Job).where(Job.id == job_id).values(**values))
+
+    @staticmethod
+    def set_progress(job_id, percent, message=None):
+        values = {'progress': max(0, min(int(percent), 99)), 'heartbeat_at': _utcnow()}
+        if message is not None:
+            values['message'] = message[:255]
+        JobService._update(job_id, **values)
+
+    @staticmethod
+    def mark_succeeded(job_id, filename, content_type):
+        now = _utcnow()
+        JobService._update(job_id, status=JOB_SUCCEEDED, progress=100, message=None, heartbeat_at=now,
+                           finished_at=now, result_filename=filename, result_content_type=content_type)
+
+    @staticmethod
+    def mark_failed(job_id, message):
+        now = _utcnow()
+        JobService._update(job_id, status=JOB_FAILED, message=message[:255], heartbeat_at=now, finished_at=now)
+
+    @staticmethod
+    def recover_stale(stale_seconds, max_attempts):
+        """
+        Úlohy v stave 'running' bez zápisu priebehu dlhšie ako stale_seconds (worker spadol)
+        vráti do fronty, po max_attempts pokusoch ich označí ako neúspešné.
+        """
+        cutoff = _utcnow() - timedelta(seconds=stale_seconds)
+        stale = (Job.status == JOB_RUNNING, Job.heartbeat_at < cutoff)
+        with db.engine.begin() as connection:
+            requeued = connection.execute(
+                update(Job).where(*stale, Job.attempts < max_attempts).values(status=JOB_QUEUED, message="Requeued after worker stopped")
+            ).rowcount
+            failed = connection.execute(
+                update(Job).where(*stale).values(status=JOB_FAILED, message="Worker stopped while running the job", finished_at=_utcnow())
+            ).rowcount
+        return requeued, failed
+
+    @staticmethod
+    def purge_finished(retention_days):
+        """Zmaže dokončené úlohy staršie ako retention_days aj s ich súbormi."""
+        cutoff = _utcnow() - timedelta(days=retention_days)
+        jobs = Job.query.filter(Job.status.in_((JOB_SUCCEEDED, JOB_FAILED)), Job.finished_at < cutoff).all()
+        for job in jobs:
+            if job.result_filename:
+                try:
+                    os.remove(JobService.result_path(job))
+                except FileNotFoundError:
+                    pass
+            db.session.delete(job)
+        db.session.commit()
+        return len(jobs)
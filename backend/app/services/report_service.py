@@ -1,21 +1,35 @@
 # backend/app/services/report_service.py
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone, date
-from sqlalchemy import func, and_, desc, extract, DateTime, Date as SQLDate
-from ..models import Expense, Income, WeeklyFocus
+import numpy as np
+from sqlalchemy import func, desc, select
+from ..models import Expense, Income, WeeklyFocus, MonthlySummary
 from ..database import db
+from ..utils.date_utils import day_range_filter
+from ..utils.query_utils import fetch_result
+from ..utils.money_utils import from_cents
+from ..utils.timeseries_utils import (
+    DEFAULT_WINDOWS, to_day_array, period_range, bucket_sums, rolling_mean, period_delta, to_json_list
+)
+from .cache_service import CacheService
+from .summary_service import EXPENSE, INCOME
 import traceback
-from decimal import Decimal, InvalidOperation
 
 class ReportServiceError(Exception): pass
 
+SNAPSHOT_DEFAULT_DAYS = 7
+SNAPSHOT_ALLOWED_DAYS = (7, 30, 90)
+# Najdlhšie obdobie časového radu (10 rokov)
+TIMESERIES_MAX_DAYS = 3660
+YEARLY_REVIEW_TOP_EXPENSES = 10
+
 class ReportService:
 
     @staticmethod
-    def _get_last_7_days_range():
+    def _get_last_days_range(days):
         today = datetime.now(timezone.utc).date()
         end_date = today
-        start_date = today - timedelta(days=6)
-        print(f"DEBUG: Calculating last 7 days range: {start_date.isoformat()} to {end_date.isoformat()}")
+        start_date = today - timedelta(days=days - 1)
         return start_date, end_date
 
     @staticmethod
@@ -25,82 +39,241 @@ class ReportService:
          return start_of_current_week
 
     @staticmethod
-    def get_weekly_snapshot(user_id):
-        try:
-            start_date, end_date = ReportService._get_last_7_days_range()
-            start_datetime = datetime.combine(start_date, datetime.min.time(), tzinfo=timezone.utc)
-            end_datetime = datetime.combine(end_date, datetime.max.time(), tzinfo=timezone.utc)
-            print(f"DEBUG: Filtering data between {start_datetime.isoformat()} and {end_datetime.isoformat()}")
-
-            print(f"DEBUG: Querying expenses for user {user_id}...")
-            expenses_query = Expense.query.filter(
-                Expense.user_id == user_id,
-                Expense.date_created >= start_datetime,
-                Expense.date_created <= end_datetime
-            )
-            expenses_last_7_days = expenses_query.all()
-            print(f"DEBUG: Found {len(expenses_last_7_days)} expenses in the range.")
-            for i, exp in enumerate(expenses_last_7_days[:3]):
-                 print(f"DEBUG: Expense {i+1}: ID={exp.id}, Date={exp.date_created}, Amount={exp.amount}")
-
-            print(f"DEBUG: Querying incomes for user {user_id}...")
-            income_date_column = getattr(Income, 'date_created', getattr(Income, 'date', None))
-            if income_date_column is None: raise ReportServiceError("Income model nemá dátumový stĺpec.")
-            print(f"DEBUG: Using Income date column: {income_date_column.key}")
-            is_datetime_col = isinstance(income_date_column.type, DateTime)
-            incomes_query = Income.query.filter(
-                Income.user_id == user_id,
-                income_date_column >= start_datetime if is_datetime_col else income_date_column >= start_date,
-                income_date_column <= end_datetime if is_datetime_col else income_date_column <= end_date
-            )
-            incomes_last_7_days = incomes_query.all()
-            print(f"DEBUG: Found {len(incomes_last_7_days)} incomes in the range.")
-            for i, inc in enumerate(incomes_last_7_days[:3]):
-                 date_val = getattr(inc, income_date_column.key, None)
-                 print(f"DEBUG: Income {i+1}: ID={inc.id}, Date={date_val}, Amount={inc.amount}")
-
-            expense_amounts = [e.amount for e in expenses_last_7_days if e.amount is not None]
-            income_amounts = [i.amount for i in incomes_last_7_days if i.amount is not None]
-            print(f"DEBUG: Expense amounts to sum: {expense_amounts}")
-            print(f"DEBUG: Income amounts to sum: {income_amounts}")
-            total_expenses_dec = sum((Decimal(str(a)) for a in expense_amounts), Decimal(0))
-            total_income_dec = sum((Decimal(str(a)) for a in income_amounts), Decimal(0))
-            print(f"DEBUG: Calculated sums: Income={total_income_dec}, Expenses={total_expenses_dec}")
-            net_flow_dec = total_income_dec - total_expenses_dec
-
-            categories = {}
-            for expense in expenses_last_7_days:
-                cat = expense.category or "Nezaradené"
-                categories[cat] = categories.get(cat, Decimal(0)) + (Decimal(str(expense.amount)) if expense.amount is not None else Decimal(0))
-            top_spending_categories = sorted( [{"category": cat, "amount": float(amount.quantize(Decimal('0.01')))} for cat, amount in categories.items()], key=lambda x: x['amount'], reverse=True )[:3]
-
-            biggest_expense_obj = max(expenses_last_7_days, key=lambda x: x.amount or 0) if expenses_last_7_days else None
-            biggest_expense_data = { "description": biggest_expense_obj.description, "amount": float(Decimal(str(biggest_expense_obj.amount or 0)).quantize(Decimal('0.01'))) } if biggest_expense_obj else None
+    def get_weekly_snapshot(user_id, days=SNAPSHOT_DEFAULT_DAYS):
+        # Rozsah sa posúva každý deň, preto je dnešný dátum súčasťou kľúča
+        today = datetime.now(timezone.utc).date()
+        return CacheService.get_or_compute(
+            user_id, 'weekly_snapshot', (today.isoformat(), days),
+            lambda: ReportService._compute_weekly_snapshot(user_id, days),
+            precomputed=True
+        )
 
-            current_week_start = ReportService._get_current_week_start_date()
-            print(f"DEBUG: Querying focus for week starting {current_week_start.isoformat()}")
-            current_focus_obj = WeeklyFocus.query.filter_by( user_id=user_id, week_start_date=current_week_start ).order_by(desc(WeeklyFocus.date_set)).first()
-            current_focus_text = current_focus_obj.focus_text if current_focus_obj else None
-            print(f"DEBUG: Found focus: {current_focus_text}")
-
-            result_data = {
-                "start_date_range": start_date.isoformat(),
-                "end_date_range": end_date.isoformat(),
-                "total_income_last_period": float(total_income_dec.quantize(Decimal('0.01'))),
-                "total_expenses_last_period": float(total_expenses_dec.quantize(Decimal('0.01'))),
-                "net_flow_last_period": float(net_flow_dec.quantize(Decimal('0.01'))),
-                "biggest_expense": biggest_expense_data,
-                "top_spending_categories": top_spending_categories,
-                "current_focus": current_focus_text
-            }
-            print(f"DEBUG: Returning snapshot data: {result_data}")
-            return result_data
+    @staticmethod
+    def _weekly_snapshot_queries(user_id, days):
+        """
+        Nezávislé SELECT-y prehľadu ako {názov: (dotaz, 'scalar' | 'all' | 'first')}.
+        Synchrónne sa vykonajú postupne, async režim (app/asgi_app.py, AsyncReportService) ich spustí súbežne.
+        """
+        start_date, end_date = ReportService._get_last_days_range(days)
+        expense_range = day_range_filter(Expense.date_created, start_date, end_date)
+        income_range = day_range_filter(Income.date_created, start_date, end_date)
+        category = func.coalesce(Expense.category, 'Nezaradené')
+        category_total = func.sum(Expense.amount_cents)
+        queries = {
+            'total_expenses': (select(func.sum(Expense.amount_cents)).where(Expense.user_id == user_id, expense_range), 'scalar'),
+            'total_income': (select(func.sum(Income.amount_cents)).where(Income.user_id == user_id, income_range), 'scalar'),
+            'top_categories': (select(category, category_total).where(
+                Expense.user_id == user_id, expense_range
+            ).group_by(category).order_by(category_total.desc()).limit(3), 'all'),
+            'biggest_expense': (select(Expense.description, Expense.amount_cents).where(
+                Expense.user_id == user_id, expense_range
+            ).order_by(Expense.amount_cents.desc()).limit(1), 'first'),
+            'current_focus': (select(WeeklyFocus.focus_text).where(
+                WeeklyFocus.user_id == user_id, WeeklyFocus.week_start_date == ReportService._get_current_week_start_date()
+            ).order_by(desc(WeeklyFocus.date_set)).limit(1), 'scalar'),
+        }
+        return start_date, end_date, queries
+
+    @staticmethod
+    def _build_weekly_snapshot(days, start_date, end_date, results):
+        """Odpoveď prehľadu z výsledkov _weekly_snapshot_queries."""
+        total_income = results['total_income'] or 0
+        total_expenses = results['total_expenses'] or 0
+        biggest_expense = results['biggest_expense']
+        return {
+            "days": days,
+            "start_date_range": start_date.isoformat(),
+            "end_date_range": end_date.isoformat(),
+            "total_income_last_period": from_cents(total_income),
+            "total_expenses_last_period": from_cents(total_expenses),
+            "net_flow_last_period": from_cents(total_income - total_expenses),
+            "biggest_expense": {
+                "description": biggest_expense.description, "amount": from_cents(biggest_expense.amount_cents)
+            } if biggest_expense else None,
+            "top_spending_categories": [{"category": cat, "amount": from_cents(cents)} for cat, cents in results['top_categories']],
+            "current_focus": results['current_focus']
+        }
+
+    @staticmethod
+    def _compute_weekly_snapshot(user_id, days=SNAPSHOT_DEFAULT_DAYS):
+        """
+        Prehľad za posledných `days` dní. Všetko počíta databáza (SUM, GROUP BY, LIMIT),
+        nenačítavajú sa ORM objekty, takže dlhšie obdobie nestojí viac pamäte.
+        Súčty centov sú celé čísla, takže sú presné bez prevodu cez Decimal.
+        """
+        try:
+            start_date, end_date, queries = ReportService._weekly_snapshot_queries(user_id, days)
+            results = {name: fetch_result(db.session.execute(query), mode) for name, (query, mode) in queries.items()}
+            return ReportService._build_weekly_snapshot(days, start_date, end_date, results)
 
         except Exception as e:
             print(f"Error getting weekly snapshot User:{user_id}: {e}")
             traceback.print_exc()
             return { "error": "Nepodarilo sa získať týždenný prehľad." }
 
+    @staticmethod
+    def get_timeseries(user_id, granularity, start_date, end_date, category=None, window=None):
+        window = window or DEFAULT_WINDOWS[granularity]
+        return CacheService.get_or_compute(
+            user_id, 'timeseries', (granularity, start_date.isoformat(), end_date.isoformat(), category, window),
+            lambda: ReportService._compute_timeseries(user_id, granularity, start_date, end_date, category, window)
+        )
+
+    @staticmethod
+    def _load_daily_arrays(model, user_id, start, end, category=None):
+        """
+        Denné súčty (centy) jedným SELECT-om ako polia. Databáza zoskupí riadky po dňoch,
+        takže do Pythonu príde najviac jeden riadok na deň a žiadne ORM objekty.
+        """
+        day = func.date(model.date_created)
+        query = select(day, func.sum(model.amount_cents)).where(
+            model.user_id == user_id, model.date_created >= start, model.date_created < end
+        )
+        if category is not None:
+            query = query.where(model.category == category)
+        rows = db.session.execute(query.group_by(day)).all()
+        days = to_day_array([row[0] for row in rows])
+        cents = np.fromiter((row[1] for row in rows), dtype='int64', count=len(rows))
+        return days, cents
+
+    @staticmethod
+    def _compute_timeseries(user_id, granularity, start_date, end_date, category, window):
+        """
+        Výdavky a príjmy po obdobiach s kĺzavým priemerom, zmenou oproti predchádzajúcemu
+        obdobiu a kumulatívnym čistým tokom. Z databázy prídu denné súčty, zoskupenie do týždňov
+        a mesiacov aj všetky odvodené rady počíta NumPy nad poliami.
+        Filter kategórie sa týka len výdavkov.
+        """
+        try:
+            periods = period_range(start_date, end_date, granularity)
+            # Rozsah sa zarovná na celé obdobia (celé týždne/mesiace)
+            start = periods[0].astype(datetime)
+            if granularity == 'month':
+                end = (periods[-1].astype('datetime64[M]') + 1).astype('datetime64[D]').astype(datetime)
+            else:
+                end = (periods[-1] + (7 if granularity == 'week' else 1)).astype(datetime)
+            range_start = datetime.combine(start, datetime.min.time())
+            range_end = datetime.combine(end, datetime.min.time())
+
+            expense_days, expense_cents = ReportService._load_daily_arrays(Expense, user_id, range_start, range_end, category)
+            income_days, income_cents = ReportService._load_daily_arrays(Income, user_id, range_start, range_end)
+
+            expenses = bucket_sums(expense_days, expense_cents, periods, granularity)
+            income = bucket_sums(income_days, income_cents, periods, granularity)
+            net = income - expenses
+            expenses_delta, expenses_delta_pct = period_delta(expenses)
+            income_delta, income_delta_pct = period_delta(income)
+
+            return {
+                "granularity": granularity,
+                "from": start.isoformat(),
+                "to": (end - timedelta(days=1)).isoformat(),
+                "category": category,
+                "window": window,
+                "periods": [str(period) for period in periods],
+                "expenses": to_json_list(expenses, 100),
+                "income": to_json_list(income, 100),
+                "net": to_json_list(net, 100),
+                "cumulative_net": to_json_list(np.cumsum(net), 100),
+                "expenses_rolling_avg": to_json_list(rolling_mean(expenses, window), 100),
+                "income_rolling_avg": to_json_list(rolling_mean(income, window), 100),
+                "expenses_delta": to_json_list(expenses_delta, 100),
+                "expenses_delta_pct": to_json_list(expenses_delta_pct, 1, 1),
+                "income_delta": to_json_list(income_delta, 100),
+                "income_delta_pct": to_json_list(income_delta_pct, 1, 1),
+                "totals": {
+                    "expenses": from_cents(int(expenses.sum())),
+                    "income": from_cents(int(income.sum())),
+                    "net": from_cents(int(net.sum())),
+                },
+            }
+        except Exception as e:
+            print(f"Error computing timeseries User:{user_id}: {e}")
+            traceback.print_exc()
+            return { "error": "Nepodarilo sa vypočítať časový rad." }
+
+    @staticmethod
+    def compute_yearly_review(user_id, year, progress=None):
+        """
+        Ročný prehľad (beží ako úloha na pozadí): mesačné výdavky a príjmy, kategórie,
+        rozdelenie 50/30/20, porovnanie s predchádzajúcim rokom a najväčšie výdavky.
+        Súčty idú z monthly_summary, jednotlivé výdavky z tabuľky expense cez index (user_id, date_created).
+        progress: voliteľná funkcia progress(percento, správa).
+        """
+        report = progress or (lambda percent, message=None: None)
+        try:
+            report(10, "Monthly totals")
+            rows = db.session.query(
+                MonthlySummary.year, MonthlySummary.month, MonthlySummary.kind,
+                MonthlySummary.category, MonthlySummary.rule_category,
+                MonthlySummary.total_cents, MonthlySummary.count
+            ).filter(
+                MonthlySummary.user_id == user_id, MonthlySummary.year.in_((year - 1, year))
+            ).all()
+            months = {month: {"month": month, "expenses": 0, "income": 0, "count": 0} for month in range(1, 13)}
+            by_category, by_rule, by_source = defaultdict(int), defaultdict(int), defaultdict(int)
+            totals = {year: {EXPENSE: 0, INCOME: 0}, year - 1: {EXPENSE: 0, INCOME: 0}}
+            for row_year, month, kind, category, rule_category, total_cents, count in rows:
+                totals[row_year][kind] += total_cents
+                if row_year != year:
+                    continue
+                if kind == EXPENSE:
+                    months[month]["expenses"] += total_cents
+                    months[month]["count"] += count
+                    by_category[category or 'Nezaradené'] += total_cents
+                    by_rule[rule_category or 'Unassigned'] += total_cents
+                else:
+                    months[month]["income"] += total_cents
+                    by_source[category or 'Nezaradené'] += total_cents
+
+            report(50, "Largest expenses")
+            start, end = datetime(year, 1, 1), datetime(year + 1, 1, 1)
+            top_expenses = db.session.query(
+                Expense.id, Expense.description, Expense.category, Expense.amount_cents, Expense.date_created
+            ).filter(
+                Expense.user_id == user_id, Expense.date_created >= start, Expense.date_created < end
+            ).order_by(desc(Expense.amount_cents), Expense.id).limit(YEARLY_REVIEW_TOP_EXPENSES).all()
+
+            report(90, "Building review")
+            expenses, income = totals[year][EXPENSE], totals[year][INCOME]
+            previous_expenses, previous_income = totals[year - 1][EXPENSE], totals[year - 1][INCOME]
+
+            def sorted_totals(values):
+                return [{"name": name, "total": from_cents(total)} for name, total in sorted(values.items(), key=lambda item: -item[1])]
+
+            def change_pct(current, previous):
+                return round((current - previous) / previous * 100, 2) if previous else None
+
+            return {
+                "year": year,
+                "totals": {
+                    "expenses": from_cents(expenses), "income": from_cents(income), "net": from_cents(income - expenses),
+                    "savings_rate_pct": round((income - expenses) / income * 100, 2) if income else None,
+                },
+                "previous_year": {
+                    "expenses": from_cents(previous_expenses), "income": from_cents(previous_income),
+                    "expenses_change_pct": change_pct(expenses, previous_expenses),
+                    "income_change_pct": change_pct(income, previous_income),
+                },
+                "months": [
+                    {**values, "expenses": from_cents(values["expenses"]), "income": from_cents(values["income"]),
+                     "net": from_cents(values["income"] - values["expenses"])}
+                    for values in months.values()
+                ],
+                "by_category": sorted_totals(by_category),
+                "by_rule": sorted_totals(by_rule),
+                "by_source": sorted_totals(by_source),
+                "top_expenses": [
+                    {"id": expense_id, "description": description, "category": category,
+                     "amount": from_cents(amount_cents), "date": date_created.isoformat()}
+                    for expense_id, description, category, amount_cents, date_created in top_expenses
+                ],
+            }
+        except Exception as e:
+            print(f"Error computing yearly review User:{user_id} {year}: {e}")
+            traceback.print_exc()
+            return { "error": "Nepodarilo sa vypočítať ročný prehľad." }
+
     @staticmethod
     def set_weekly_focus(user_id, focus_text):
         try:
@@ -115,6 +288,7 @@ class ReportService:
                 new_focus = WeeklyFocus(user_id=user_id, week_start_date=current_week_start, focus_text=focus_text)
                 db.session.add(new_focus); saved_focus = new_focus
             else: saved_focus = None
+            CacheService.bump_data_version(user_id)
             db.session.commit()
             return saved_focus
         except Exception as e:
@@ -0,0 +1,214 @@
+# backend/app/services/summary_service.py
+from collections import defaultdict
+from sqlalchemy import func, extract, select, insert, update, delete, literal
+from sqlalchemy.dialects import sqlite, postgresql
+from ..database import db
+from ..models import MonthlySummary, Expense, Income
+
+class SummaryServiceError(Exception): pass
+
+EXPENSE = 'expense'
+INCOME = 'income'
+KEY_COLUMNS = ('user_id', 'kind', 'year', 'month', 'category', 'rule_category')
+
+class SummaryService:
+    """
+    Udržiava tabuľku monthly_summary. Metódy record_* necommitujú,
+    volajú sa zo služieb pred commitom, takže súčty sa menia v tej istej transakcii ako dáta.
+    Všetky sumy sú v celých centoch.
+    """
+
+    @staticmethod
+    def _upsert_statement(values):
+        dialect = db.session.get_bind(mapper=MonthlySummary).dialect.name
+        dialect_insert = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}.get(dialect)
+        if not dialect_insert:
+            return None
+        stmt = dialect_insert(MonthlySummary).values(**values)
+        return stmt.on_conflict_do_update(
+            index_elements=list(KEY_COLUMNS),
+            set_={'total_cents': MonthlySummary.total_cents + stmt.excluded.total_cents, 'count': MonthlySummary.count + stmt.excluded.count}
+        )
+
+    @staticmethod
+    def apply_delta(user_id, kind, year, month, category, rule_category, amount_cents, count):
+        values = {
+            'user_id': user_id, 'kind': kind, 'year': year, 'month': month,
+            'category': category or '', 'rule_category': rule_category or '',
+            'total_cents': amount_cents, 'count': count,
+        }
+        stmt = SummaryService._upsert_statement(values)
+        if stmt is not None:
+            db.session.execute(stmt)
+            return
+        # Iné databázy: UPDATE a ak riadok ešte neexistuje, INSERT
+        key_filter = [getattr(MonthlySummary, column) == values[column] for column in KEY_COLUMNS]
+        result = db.session.execute(
+            update(MonthlySummary).where(*key_filter)
+            .values(total_cents=MonthlySummary.total_cents + amount_cents, count=MonthlySummary.count + count)
+        )
+        if result.rowcount == 0:
+            db.session.execute(insert(MonthlySummary).values(**values))
+
+    @staticmethod
+    def record_expense(expense, sign=1):
+        """sign=1 pri pridaní, sign=-1 pri odobratí (vymazanie alebo stav pred úpravou)."""
+        SummaryService.apply_delta(
+            expense.user_id, EXPENSE, expense.date_created.year, expense.date_created.month,
+            expense.category, expense.rule_category, sign * expense.amount_cents, sign
+        )
+
+    @staticmethod
+    def record_income(income, sign=1):
+        SummaryService.apply_delta(
+            income.user_id, INCOME, income.date_created.year, income.date_created.month,
+            income.source, None, sign * income.amount_cents, sign
+        )
+
+    @staticmethod
+    def record_bulk(kind, rows):
+        """Pre hromadný import: riadky (slovníky s amount_cents) sa najprv zoskupia, potom jeden upsert na kľúč."""
+        category_key = 'category' if kind == EXPENSE else 'source'
+        grouped = defaultdict(lambda: [0, 0])
+        for row in rows:
+            key = (row['user_id'], row['date_created'].year, row['date_created'].month,
+                   row.get(category_key), row.get('rule_category') if kind == EXPENSE else None)
+            grouped[key][0] += row['amount_cents']
+            grouped[key][1] += 1
+        for (user_id, year, month, category, rule_category), (amount_cents, count) in grouped.items():
+            SummaryService.apply_delta(user_id, kind, year, month, category, rule_category, amount_cents, count)
+
+    # --- Čítanie ---
+    @staticmethod
+    def _month_filter(user_id, kind, year, month):
+        return (MonthlySummary.user_id == user_id, MonthlySummary.kind == kind,
+                MonthlySummary.year == year, MonthlySummary.month == month)
+
+    # SELECT-y čítania sú oddelené od vykonania, async režim (app/asgi_app.py, AsyncReportService) ich spúšťa súbežne
+    @staticmethod
+    def _spent_by_category_select(user_id, year, month, categories=None):
+        query = select(MonthlySummary.category, func.sum(MonthlySummary.total_cents)).where(
+            *SummaryService._month_filter(user_id, EXPENSE, year, month)
+        )
+        if categories is not None:
+            query = query.where(MonthlySummary.category.in_(categories))
+        return query.group_by(MonthlySummary.category)
+
+    @staticmethod
+    def _spent_by_rule_select(user_id, year, month):
+        return select(MonthlySummary.rule_category, func.sum(MonthlySummary.total_cents)).where(
+            *SummaryService._month_filter(user_id, EXPENSE, year, month)
+        ).group_by(MonthlySummary.rule_category)
+
+    @staticmethod
+    def _income_total_select(user_id, year, month):
+        return select(func.sum(MonthlySummary.total_cents)).where(*SummaryService._month_filter(user_id, INCOME, year, month))
+
+    @staticmethod
+    def _month_totals_select(user_id, year, month):
+        return select(
+            MonthlySummary.kind, MonthlySummary.category, MonthlySummary.rule_category, MonthlySummary.total_cents
+        ).where(MonthlySummary.user_id == user_id, MonthlySummary.year == year, MonthlySummary.month == month)
+
+    @staticmethod
+    def _fold_spent_by_rule(rows):
+        return {(rule or None): total for rule, total in rows}
+
+    @staticmethod
+    def _fold_month_totals(rows):
+        totals = {'spent_by_category': defaultdict(int), 'spent_by_rule': defaultdict(int), 'income': 0}
+        for kind, category, rule_category, total_cents in rows:
+            if kind == INCOME:
+                totals['income'] += total_cents
+            else:
+                totals['spent_by_category'][category] += total_cents
+                totals['spent_by_rule'][rule_category or None] += total_cents
+        totals['spent_by_category'] = dict(totals['spent_by_category'])
+        totals['spent_by_rule'] = dict(totals['spent_by_rule'])
+        return totals
+
+    @staticmethod
+    def get_spent_by_category(user_id, year, month, categories=None):
+        rows = db.session.execute(SummaryService._spent_by_category_select(user_id, year, month, categories)).all()
+        return {category: total for category, total in rows}
+
+    @staticmethod
+    def get_spent_by_rule(user_id, year, month):
+        """Súčty podľa rule_category, nezaradené výdavky sú pod kľúčom None."""
+        return SummaryService._fold_spent_by_rule(db.session.execute(SummaryService._spent_by_rule_select(user_id, year, month)).all())
+
+    @staticmethod
+    def get_income_total(user_id, year, month):
+        return db.session.execute(SummaryService._income_total_select(user_id, year, month)).scalar() or 0
+
+    @staticmethod
+    def get_month_totals(user_id, year, month):
+        """
+        Všetky súčty mesiaca jedným dotazom (pre dashboard). Vracia slovník s kľúčmi
+        'spent_by_category', 'spent_by_rule' (nezaradené pod None) a 'income' v centoch.
+        """
+        return SummaryService._fold_month_totals(db.session.execute(SummaryService._month_totals_select(user_id, year, month)).all())
+
+    # --- Prepočet a kontrola ---
+    @staticmethod
+    def _aggregate_select(kind, user_id=None):
+        """SELECT, ktorý spočíta súhrny priamo zo záznamov (rovnaké stĺpce ako KEY_COLUMNS + total_cents, count)."""
+        model = Expense if kind == EXPENSE else Income
+        category = func.coalesce(Expense.category if kind == EXPENSE else Income.source, '')
+        rule_category = func.coalesce(Expense.rule_category, '') if kind == EXPENSE else literal('')
+        year = extract('year', model.date_created)
+        month = extract('month', model.date_created)
+        group_by = [model.user_id, year, month, category] + ([rule_category] if kind == EXPENSE else [])
+        query = select(
+            model.user_id, literal(kind), year, month, category, rule_category,
+            func.sum(model.amount_cents), func.count(model.id)
+        ).group_by(*group_by)
+        if user_id is not None:
+            query = query.where(model.user_id == user_id)
+        return query
+
+    @staticmethod
+    def rebuild(user_id=None, commit=True):
+        """
+        Zahodí a nanovo spočíta súhrny (pre všetkých alebo jedného používateľa).
+        commit=False nechá zmeny v rozpracovanej transakcii volajúceho (hromadné úpravy výdavkov).
+        """
+        try:
+            stmt = delete(MonthlySummary)
+            if user_id is not None:
+                stmt = stmt.where(MonthlySummary.user_id == user_id)
+            db.session.execute(stmt)
+            for kind in (EXPENSE, INCOME):
+                db.session.execute(
+                    insert(MonthlySummary).from_select(list(KEY_COLUMNS) + ['total_cents', 'count'], SummaryService._aggregate_select(kind, user_id))
+                )
+            if commit:
+                db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"DB error rebuilding monthly summaries (user {user_id}): {e}")
+            raise SummaryServiceError("Nepodarilo sa prepočítať mesačné súhrny.") from e
+
+    @staticmethod
+    def find_drift(user_id=None):
+        """Porovná tabuľku so skutočnými dátami, vráti zoznam nezhodných kľúčov."""
+        expected = {}
+        for kind in (EXPENSE, INCOME):
+            for row in db.session.execute(SummaryService._aggregate_select(kind, user_id)):
+                expected[(row[0], row[1], int(row[2]), int(row[3]), row[4], row[5])] = (row[6] or 0, row[7])
+        query = MonthlySummary.query
+        if user_id is not None:
+            query = query.filter_by(user_id=user_id)
+        actual = {tuple(getattr(s, column) for column in KEY_COLUMNS): (s.total_cents, s.count) for s in query.all()}
+
+        drift = []
+        for key in set(expected) | set(actual):
+            expected_cents, expected_count = expected.get(key, (0, 0))
+            actual_cents, actual_count = actual.get(key, (0, 0))
+            if (expected_cents, expected_count) != (actual_cents, actual_count):
+                drift.append({
+                    **dict(zip(KEY_COLUMNS, key)),
+                    'expected_cents': expected_cents, 'actual_cents': actual_cents,
+                    'expected_count': expected_count, 'actual_count': actual_count,
+                })
+        return sorted(drift, key=lambda d: tuple(d[column] for column in KEY_COLUMNS))
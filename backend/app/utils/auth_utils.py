@@ -2,14 +2,17 @@
 import jwt # type: ignore
 from functools import wraps
 from flask import request, jsonify, current_app, g
-from ..database import db
+from sqlalchemy import select
+from ..database import db, get_async_engine
 from ..models import User
+from .cache_utils import LRUCache, MISSING
 import datetime
 
-def generate_token(user_id):
-    """Generuje JWT token."""
+def generate_token(user_id, token_version=0):
+    """Generuje JWT token. 'ver' = User.token_version, po zmene hesla staré tokeny neplatia."""
     try:
         payload = {
+            'ver': token_version,
             'exp': datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=current_app.config['JWT_ACCESS_TOKEN_EXPIRES_SECONDS']),
             'iat': datetime.datetime.now(datetime.timezone.utc),
             # === OPRAVA: Prevod ID na string ===
@@ -25,9 +28,8 @@ def generate_token(user_id):
         print(f"Error generating token: {e}")
         return None
 
-# --- verify_token zostáva rovnaká, ale očakáva string ---
-def verify_token(token):
-     """Overí JWT token a vráti user ID (ako integer)."""
+def decode_token(token):
+     """Overí JWT token a vráti (user ID, verzia tokenu) alebo None."""
      try:
          payload = jwt.decode(
              token,
@@ -37,7 +39,8 @@ def verify_token(token):
          user_id_str = payload.get('sub')
          # === OPRAVA: Konverzia späť na integer ===
          if user_id_str:
-             return int(user_id_str) # <<< Konvertuj string ID späť na integer
+             # Tokeny vydané pred zavedením verzií nemajú 'ver', berieme ich ako verziu 0
+             return int(user_id_str), int(payload.get('ver', 0)) # <<< Konvertuj string ID späť na integer
          else:
              return None
          # =======================================
@@ -55,23 +58,120 @@ def verify_token(token):
          print(f"Error verifying token: {e}")
          return None
 
-# --- token_required zostáva rovnaká ---
+def verify_token(token):
+     """Overí JWT token a vráti user ID (ako integer)."""
+     decoded = decode_token(token)
+     return decoded[0] if decoded else None
+
+# --- Cache overených používateľov ---
+class Principal:
+    """Overený používateľ v g.current_user. Nie je to ORM objekt, plného usera načíta load_current_user()."""
+    __slots__ = ('id', 'username', 'token_version')
+
+    def __init__(self, id, username, token_version):
+        self.id = id
+        self.username = username
+        self.token_version = token_version
+
+    def __repr__(self):
+        return f'<Principal {self.username}>'
+
+def init_principal_cache(app):
+    # Krátke TTL ohraničuje, ako dlho môže iný worker prijímať odvolaný token
+    app.extensions['finapp_principals'] = LRUCache(
+        max_entries=app.config.get('PRINCIPAL_CACHE_MAX_ENTRIES', 4096),
+        ttl_seconds=app.config.get('PRINCIPAL_CACHE_TTL_SECONDS', 60),
+    )
+
+def _principal_select(user_id):
+    return select(User.id, User.username, User.token_version).where(User.id == user_id)
+
+def _cache_principal(user_id, row):
+    if not row:
+        return None
+    principal = Principal(row.id, row.username, row.token_version)
+    current_app.extensions['finapp_principals'].set(user_id, principal)
+    return principal
+
+def get_principal(user_id):
+    """Vráti Principal z cache, pri miss ho načíta z DB (len potrebné stĺpce). None ak user neexistuje."""
+    principal = current_app.extensions['finapp_principals'].get(user_id)
+    if principal is MISSING:
+        principal = _cache_principal(user_id, db.session.execute(_principal_select(user_id)).first())
+    return principal
+
+async def get_principal_async(user_id):
+    """get_principal pre ASGI režim, pri miss číta cez async engine."""
+    principal = current_app.extensions['finapp_principals'].get(user_id)
+    if principal is MISSING:
+        async with get_async_engine().connect() as connection:
+            principal = _cache_principal(user_id, (await connection.execute(_principal_select(user_id))).first())
+    return principal
+
+def invalidate_principal(user_id):
+    current_app.extensions['finapp_principals'].delete(user_id)
+
+def load_current_user():
+    """Plný ORM objekt prihláseného používateľa (pre /me, zmenu hesla)."""
+    return db.session.get(User, g.current_user.id)
+
+def _bearer_token():
+    auth_header = request.headers.get('Authorization')
+    if auth_header and auth_header.startswith('Bearer '):
+        return auth_header.split(' ')[1]
+    return None
+
+def _is_newer_token(current_user, token_version):
+    # Heslo zmenené cez iný worker: cache tohto procesu drží starú verziu, novší token ju nesmie odmietnuť
+    return current_user is not None and token_version > current_user.token_version
+
+def _check_principal(current_user, token_version):
+    """Chybová odpoveď, ak používateľ neexistuje alebo bol token odvolaný, inak None."""
+    if not current_user: return jsonify({'error': 'Unauthorized', 'message': 'User not found!'}), 401
+    if token_version != current_user.token_version:
+        return jsonify({'error': 'Unauthorized', 'message': 'Token has been revoked!'}), 401
+    return None
+
 def token_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = None
-        auth_header = request.headers.get('Authorization')
-        if auth_header and auth_header.startswith('Bearer '):
-            token = auth_header.split(' ')[1]
+        token = _bearer_token()
         if not token: return jsonify({'error': 'Unauthorized', 'message': 'Token is missing!'}), 401
 
-        user_id = verify_token(token) # Získa ID už ako integer
-        if not user_id: return jsonify({'error': 'Unauthorized', 'message': 'Token is invalid or expired!'}), 401
+        decoded = decode_token(token) # Získa ID už ako integer
+        if not decoded: return jsonify({'error': 'Unauthorized', 'message': 'Token is invalid or expired!'}), 401
+        user_id, token_version = decoded
 
-        # Načítanie usera pomocou integer ID
-        current_user = db.session.get(User, user_id)
-        if not current_user: return jsonify({'error': 'Unauthorized', 'message': 'User not found!'}), 401
+        # Väčšina požiadaviek sa obslúži z cache bez dotazu na tabuľku user
+        current_user = get_principal(user_id)
+        if _is_newer_token(current_user, token_version):
+            invalidate_principal(user_id)
+            current_user = get_principal(user_id)
+        error = _check_principal(current_user, token_version)
+        if error: return error
 
         g.current_user = current_user
         return f(*args, **kwargs)
-    return decorated
\ No newline at end of file
+    return decorated
+
+def async_token_required(f):
+    """token_required pre korutíny v ASGI režime."""
+    @wraps(f)
+    async def decorated(*args, **kwargs):
+        token = _bearer_token()
+        if not token: return jsonify({'error': 'Unauthorized', 'message': 'Token is missing!'}), 401
+
+        decoded = decode_token(token)
+        if not decoded: return jsonify({'error': 'Unauthorized', 'message': 'Token is invalid or expired!'}), 401
+        user_id, token_version = decoded
+
+        current_user = await get_principal_async(user_id)
+        if _is_newer_token(current_user, token_version):
+            invalidate_principal(user_id)
+            current_user = await get_principal_async(user_id)
+        error = _check_principal(current_user, token_version)
+        if error: return error
+
+        g.current_user = current_user
+        return await f(*args, **kwargs)
+    return decorated
@@ -0,0 +1,121 @@
+# backend/app/utils/cache_utils.py
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from flask import current_app
+from werkzeug.utils import import_string
+
+MISSING = object()
+
+class CacheBackend(ABC):
+    """
+    Rozhranie cache. Vlastnú implementáciu stačí uviesť v CACHE_BACKEND ako 'modul:Trieda'.
+    Neúplná implementácia zlyhá už v init_cache pri vytvorení, nie až pri prvej požiadavke.
+    """
+
+    def __init__(self, max_entries=1024, ttl_seconds=300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    def get(self, key):
+        """Vráti uloženú hodnotu alebo MISSING."""
+
+    @abstractmethod
+    def set(self, key, value):
+        pass
+
+    @abstractmethod
+    def delete(self, key):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    @abstractmethod
+    def stats(self):
+        pass
+
+class NullCache(CacheBackend):
+    """Nič neukladá, každé čítanie je miss (napr. pre testy alebo ladenie)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.misses = 0
+
+    def get(self, key):
+        self.misses += 1
+        return MISSING
+
+    def set(self, key, value):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def clear(self):
+        pass
+
+    def stats(self):
+        return {"backend": "null", "hits": 0, "misses": self.misses, "evictions": 0, "size": 0, "max_entries": 0}
+
+class LRUCache(CacheBackend):
+    """Cache v pamäti procesu s obmedzenou veľkosťou (LRU) a časom platnosti (TTL)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key, MISSING)
+            if entry is MISSING or entry[0] < time.monotonic():
+                if entry is not MISSING:
+                    del self._data[key]
+                self.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "backend": "memory", "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self._data), "max_entries": self.max_entries,
+            }
+
+CACHE_BACKENDS = {'memory': LRUCache, 'null': NullCache}
+
+def init_cache(app):
+    backend = app.config.get('CACHE_BACKEND', 'memory')
+    backend_cls = CACHE_BACKENDS.get(backend) or import_string(backend)
+    app.extensions['finapp_cache'] = backend_cls(
+        max_entries=app.config.get('CACHE_MAX_ENTRIES', 1024),
+        ttl_seconds=app.config.get('CACHE_TTL_SECONDS', 300),
+    )
+
+def get_cache():
+    return current_app.extensions['finapp_cache']
@@ -0,0 +1,119 @@
+# backend/app/utils/categorize_utils.py
+import unicodedata
+from flask import current_app
+from .cache_utils import LRUCache
+
+UNCATEGORIZED = 'Nezaradené'
+MATCH_TYPES = ('contains', 'word')
+
+def normalize_text(text):
+    """Malé písmená bez diakritiky ('Káva' -> 'kava'), rovnako pre pravidlá aj popisy."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automat nad kľúčovými slovami: jeden prechod textom nájde výskyty
+    všetkých slov naraz, bez ohľadu na počet pravidiel.
+    """
+
+    def __init__(self, keywords):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+        for index, keyword in enumerate(keywords):
+            state = 0
+            for char in keyword:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] += (index,)
+        # Zlyhávajúce prechody do šírky, výstup stavu obsahuje aj výstupy jeho fail stavu
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def iter_matches(self, text):
+        """(index posledného znaku, index kľúčového slova) pre každý výskyt."""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                yield position, index
+
+class Categorizer:
+    """
+    Skompilované pravidlá jedného používateľa. Pri viacerých zhodách vyhrá pravidlo
+    s najvyššou prioritou, potom s dlhším vzorom, potom staršie (nižšie id).
+    """
+
+    def __init__(self, rules):
+        """rules: n-tice (id, pattern, match_type, category, rule_category, priority)."""
+        self.rules = []
+        for rule_id, pattern, match_type, category, rule_category, priority in rules:
+            keyword = normalize_text(pattern).strip()
+            if keyword:
+                self.rules.append((keyword, match_type, category, rule_category, (-priority, -len(keyword), rule_id)))
+        self.matcher = KeywordMatcher([rule[0] for rule in self.rules])
+
+    def __len__(self):
+        return len(self.rules)
+
+    def match(self, description):
+        """Najlepšie pravidlo pre popis ako (category, rule_category), alebo None."""
+        text = normalize_text(description)
+        best = None
+        for end, index in self.matcher.iter_matches(text):
+            keyword, match_type, category, rule_category, rank = self.rules[index]
+            if match_type == 'word':
+                start = end - len(keyword) + 1
+                if (start > 0 and text[start - 1].isalnum()) or (end + 1 < len(text) and text[end + 1].isalnum()):
+                    continue
+            if best is None or rank < best[2]:
+                best = (category, rule_category, rank)
+        return None if best is None else best[:2]
+
+    def apply(self, description, category, rule_category):
+        """
+        Doplní chýbajúcu kategóriu (None, prázdna alebo 'Nezaradené') a rule_category (None).
+        Ručne zadané hodnoty sa neprepisujú. Vracia (category, rule_category).
+        """
+        if category and category != UNCATEGORIZED and rule_category is not None:
+            return category, rule_category
+        return self.fill_missing(self.match(description), category, rule_category)
+
+    @staticmethod
+    def fill_missing(matched, category, rule_category):
+        """Doplní chýbajúce hodnoty z výsledku match() (môže byť None), ako apply()."""
+        if matched is None:
+            return category, rule_category
+        matched_category, matched_rule_category = matched
+        if (not category or category == UNCATEGORIZED) and matched_category:
+            category = matched_category
+        if rule_category is None and matched_rule_category:
+            rule_category = matched_rule_category
+        return category, rule_category
+
+def init_categorizer_cache(app):
+    # Kľúč obsahuje User.rules_version, takže zmena pravidiel starý automat nikdy nenájde
+    app.extensions['finapp_categorizers'] = LRUCache(
+        max_entries=app.config.get('CATEGORIZER_CACHE_MAX_ENTRIES', 1024),
+        ttl_seconds=app.config.get('CATEGORIZER_CACHE_TTL_SECONDS', 3600),
+    )
+
+def get_categorizer_cache():
+    return current_app.extensions['finapp_categorizers']
@@ -0,0 +1,30 @@
+# backend/app/utils/date_utils.py
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_
+
+def day_range_filter(column, start_date, end_date):
+    """Podmienka pre dni start_date..end_date vrátane, ako polotvorený interval."""
+    start = datetime.combine(start_date, datetime.min.time())
+    end = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+    return and_(column >= start, column < end)
+
+def to_utc_naive(value):
+    """Prevedie dátum s časovou zónou na UTC bez zóny (tak ako ho ukladá SQLite)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def parse_year_month(value):
+    """'YYYY-MM' na (rok, mesiac), pri neplatnom vstupe ValueError."""
+    try:
+        parsed = datetime.strptime(value or '', '%Y-%m')
+    except ValueError:
+        raise ValueError(f"Invalid month '{value}', expected YYYY-MM")
+    return parsed.year, parsed.month
+
+def iter_months(start, end):
+    """Mesiace (rok, mesiac) od start po end vrátane."""
+    year, month = start
+    while (year, month) <= end:
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
@@ -0,0 +1,61 @@
+# backend/app/utils/etag_utils.py
+import hashlib
+from datetime import datetime, timezone
+from functools import wraps
+from flask import request, g, make_response, current_app
+from ..services.cache_service import CacheService
+from ..services.async_report_service import AsyncReportService
+
+def compute_etag(name, user_id, data_version, args, view_args):
+    # Dnešný dátum je súčasťou kľúča: "posledných N dní" počítajú služby podľa UTC, no predvolený
+    # rok/mesiac berú routy z lokálneho času servera, preto oba dátumy (líšia sa okolo polnoci)
+    today = f"{datetime.now(timezone.utc).date().isoformat()}/{datetime.now().date().isoformat()}"
+    parts = [name, str(user_id), str(data_version), today]
+    parts += [f"{key}={value}" for key, value in sorted(args.items(multi=True))]
+    parts += [f"{key}={value}" for key, value in sorted(view_args.items())]
+    return hashlib.sha256("\x1f".join(parts).encode('utf-8')).hexdigest()[:32]
+
+def _not_modified_or(etag, make):
+    """304 pri zhode s If-None-Match, inak odpoveď z make(). ETag a Cache-Control len k 200/304."""
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(make())
+        if response.status_code != 200:
+            return response
+    response.set_etag(etag)
+    # Prehliadač má vždy overiť platnosť, odpoveď patrí len tomuto používateľovi
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+def conditional_get(name):
+    """
+    Dekorátor pre GET endpointy za @token_required. ETag sa odvodí z User.data_version
+    a parametrov požiadavky. Pri zhode s If-None-Match vráti 304 bez volania služby a dumpu.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            if not current_app.config.get('ETAGS_ENABLED', True):
+                return f(*args, **kwargs)
+            user_id = g.current_user.id
+            etag = compute_etag(name, user_id, CacheService.get_data_version(user_id), request.args, kwargs)
+            return _not_modified_or(etag, lambda: f(*args, **kwargs))
+        return decorated
+    return decorator
+
+def async_conditional_get(name):
+    """conditional_get pre korutíny v ASGI režime (za @async_token_required), ETag je rovnaký."""
+    def decorator(f):
+        @wraps(f)
+        async def decorated(*args, **kwargs):
+            if not current_app.config.get('ETAGS_ENABLED', True):
+                return await f(*args, **kwargs)
+            user_id = g.current_user.id
+            etag = compute_etag(name, user_id, await AsyncReportService.get_data_version(user_id), request.args, kwargs)
+            if request.if_none_match.contains_weak(etag):
+                return _not_modified_or(etag, None)
+            result = await f(*args, **kwargs)
+            return _not_modified_or(etag, lambda: result)
+        return decorated
+    return decorator
@@ -0,0 +1,72 @@
+# backend/app/utils/export_utils.py
+import csv
+import io
+import json
+from itertools import islice
+from flask import Response, stream_with_context
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+}
+EXPORT_BATCH_SIZE = 1000
+EXPENSE_EXPORT_FIELDS = ('id', 'date_created', 'description', 'amount', 'category', 'rule_category')
+INCOME_EXPORT_FIELDS = ('id', 'date_created', 'description', 'amount', 'source')
+
+def _batches(rows, size):
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _generate_csv(rows, schema, fields):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    yield buffer.getvalue()
+    for batch in _batches(rows, EXPORT_BATCH_SIZE):
+        buffer.seek(0); buffer.truncate(0)
+        for item in schema.dump(batch, many=True):
+            writer.writerow([item.get(field) for field in fields])
+        yield buffer.getvalue()
+
+def _generate_ndjson(rows, schema):
+    for batch in _batches(rows, EXPORT_BATCH_SIZE):
+        yield ''.join(json.dumps(item, ensure_ascii=False) + '\n' for item in schema.dump(batch, many=True))
+
+def export_chunks(rows, schema, fields, export_format):
+    """Textové kúsky exportu, jeden na dávku (pre stream aj pre zápis do súboru v úlohe na pozadí)."""
+    if export_format == 'csv':
+        return _generate_csv(rows, schema, fields)
+    return _generate_ndjson(rows, schema)
+
+def _error_marker(export_format):
+    """Posledný riadok prerušeného exportu, aby klient odlíšil neúplný súbor od kompletného."""
+    message = "Export interrupted, data is incomplete"
+    if export_format == 'csv':
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(['#error', message])
+        return buffer.getvalue()
+    return json.dumps({"error": message}) + '\n'
+
+def stream_export(rows, schema, fields, export_format, filename):
+    """
+    Streamuje riadky ako CSV alebo NDJSON po dávkach.
+    `rows` má byť iterátor zo servera (yield_per), takže v pamäti je vždy
+    len jedna dávka a prvé bajty odchádzajú hneď.
+    """
+    def generate():
+        try:
+            yield from export_chunks(rows, schema, fields, export_format)
+        except Exception as e:
+            # Hlavičky (200) sú už odoslané, stream ukončíme chybovým riadkom
+            print(f"Error while streaming {filename} export: {e}")
+            yield _error_marker(export_format)
+
+    return Response(
+        stream_with_context(generate()),
+        content_type=EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}.{export_format}"'}
+    )
@@ -0,0 +1,73 @@
+# backend/app/utils/filter_utils.py
+from datetime import date, datetime, timedelta
+from .money_utils import to_cents
+
+# Textové filtre zoznamov: parameter -> stĺpec. Viac hodnôt cez opakovaný parameter alebo čiarky.
+TEXT_FILTERS = {
+    'expenses': {'category': 'category', 'rule_category': 'rule_category'},
+    'incomes': {'source': 'source'},
+}
+RULE_CATEGORIES = ('Needs', 'Wants', 'Savings')
+
+def _parse_amount(args, name):
+    value = args.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        cents = to_cents(value)
+    except Exception:
+        raise ValueError(f"Invalid {name} '{value}'")
+    if cents < 0:
+        raise ValueError(f"{name} must not be negative")
+    return cents
+
+def _parse_date(args, name):
+    value = args.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name} '{value}', expected YYYY-MM-DD")
+
+def parse_list_filters(args, kind):
+    """
+    Filtre zoznamu ('expenses' alebo 'incomes') z query parametrov: textové stĺpce z TEXT_FILTERS,
+    min_amount / max_amount v eurách, date_from / date_to (YYYY-MM-DD, vrátane).
+    Vracia slovník pre apply_list_filters, pri neplatnom vstupe vyhodí ValueError.
+    """
+    filters = {'in': {}}
+    for param, column in TEXT_FILTERS[kind].items():
+        values = [value for raw in args.getlist(param) for value in raw.split(',') if value]
+        if not values:
+            continue
+        if column == 'rule_category' and any(value not in RULE_CATEGORIES for value in values):
+            raise ValueError(f"Invalid rule_category, allowed: {', '.join(RULE_CATEGORIES)}")
+        filters['in'][column] = values
+    filters['min_cents'] = _parse_amount(args, 'min_amount')
+    filters['max_cents'] = _parse_amount(args, 'max_amount')
+    if None not in (filters['min_cents'], filters['max_cents']) and filters['min_cents'] > filters['max_cents']:
+        raise ValueError("min_amount must not be greater than max_amount")
+    filters['date_from'] = _parse_date(args, 'date_from')
+    filters['date_to'] = _parse_date(args, 'date_to')
+    if None not in (filters['date_from'], filters['date_to']) and filters['date_from'] > filters['date_to']:
+        raise ValueError("date_from must not be after date_to")
+    return filters
+
+def apply_list_filters(query, model, filters):
+    """Pridá filtre do SQL dotazu. Kombinácia user_id + stĺpec + date_created ide cez zložené indexy."""
+    if not filters:
+        return query
+    for column, values in filters['in'].items():
+        attribute = getattr(model, column)
+        query = query.filter(attribute == values[0] if len(values) == 1 else attribute.in_(values))
+    if filters['min_cents'] is not None:
+        query = query.filter(model.amount_cents >= filters['min_cents'])
+    if filters['max_cents'] is not None:
+        query = query.filter(model.amount_cents <= filters['max_cents'])
+    if filters['date_from'] is not None:
+        query = query.filter(model.date_created >= datetime.combine(filters['date_from'], datetime.min.time()))
+    if filters['date_to'] is not None:
+        # Polotvorený interval, aby sa započítal celý posledný deň
+        query = query.filter(model.date_created < datetime.combine(filters['date_to'] + timedelta(days=1), datetime.min.time()))
+    return query
@@ -0,0 +1,43 @@
+# backend/app/utils/import_utils.py
+import csv
+import io
+from marshmallow import ValidationError
+
+MAX_IMPORT_ROWS = 50000
+
+def _parse_csv(text):
+    # Prázdne bunky vynecháme, aby sa použili predvolené hodnoty schémy
+    reader = csv.DictReader(io.StringIO(text))
+    return [{key.strip(): value for key, value in row.items() if key and value not in (None, '')} for row in reader]
+
+def read_import_rows(request):
+    """
+    Načíta riadky importu z požiadavky: JSON pole, CSV súbor (multipart pole 'file')
+    alebo CSV priamo v tele (Content-Type: text/csv). Pri neplatnom vstupe vyhodí ValueError.
+    """
+    if 'file' in request.files:
+        rows = _parse_csv(request.files['file'].read().decode('utf-8-sig'))
+    elif request.mimetype == 'text/csv':
+        rows = _parse_csv(request.get_data(as_text=True).lstrip('﻿'))
+    else:
+        rows = request.get_json(silent=True)
+        if not isinstance(rows, list):
+            raise ValueError("Expected a JSON array or a CSV upload")
+    if not rows:
+        raise ValueError("No rows to import")
+    if len(rows) > MAX_IMPORT_ROWS:
+        raise ValueError(f"Too many rows (max {MAX_IMPORT_ROWS})")
+    return rows
+
+def validate_import_chunk(schema, chunk, offset):
+    """
+    Zvaliduje dávku riadkov jedným volaním schémy (many=True je rádovo rýchlejšie
+    ako riadok po riadku). Vracia (platné dáta, chyby s indexom riadku).
+    """
+    try:
+        return schema.load(chunk, many=True), []
+    except ValidationError as err:
+        failed = err.messages if isinstance(err.messages, dict) else {}
+    errors = [{"row": offset + index, "messages": messages} for index, messages in sorted(failed.items())]
+    remaining = [row for index, row in enumerate(chunk) if index not in failed]
+    return (schema.load(remaining, many=True) if remaining else []), errors
@@ -0,0 +1,185 @@
+# backend/app/utils/job_utils.py
+import json
+import os
+import threading
+import time
+from sqlalchemy import func
+from ..database import db
+from ..models import Job, Expense, Income
+from ..schemas import expense_schema, income_schema
+from ..services.job_service import JobService, JobServiceError
+from ..services.report_service import ReportService
+from ..services.summary_service import SummaryService, SummaryServiceError
+from ..services.expense_service import ExpenseService
+from ..services.income_service import IncomeService
+from ..services.cache_service import CacheService
+from .export_utils import EXPORT_FORMATS, EXPORT_BATCH_SIZE, EXPENSE_EXPORT_FIELDS, INCOME_EXPORT_FIELDS, export_chunks
+
+# Zápis priebehu najviac raz za sekundu (každý zápis je krátka transakcia)
+PROGRESS_MIN_INTERVAL_SECONDS = 1.0
+# Ako často voľný worker skontroluje zaseknuté a staré úlohy
+MAINTENANCE_INTERVAL_SECONDS = 300
+
+_start_lock = threading.Lock()
+
+class JobProgress:
+    """Volá sa z handlera ako progress(percento, správa). Chyba zápisu priebehu úlohu nezastaví."""
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.last_write = 0.0
+
+    def __call__(self, percent, message=None):
+        now = time.monotonic()
+        if now - self.last_write < PROGRESS_MIN_INTERVAL_SECONDS:
+            return
+        self.last_write = now
+        try:
+            JobService.set_progress(self.job_id, percent, message)
+        except Exception as e:
+            print(f"Could not record progress of job {self.job_id}: {e}")
+
+# --- Handlery: (user_id, params, progress) -> (názov súboru, content type, textové kúsky) ---
+def _export_job(model, rows, schema, fields, name):
+    def handler(user_id, params, progress):
+        export_format = params['format']
+        total = db.session.query(func.count(model.id)).filter(model.user_id == user_id).scalar() or 0
+
+        def counted(iterator):
+            for done, row in enumerate(iterator, 1):
+                if done % EXPORT_BATCH_SIZE == 0:
+                    progress(done * 100 / total, f"Exported {done} of {total} rows")
+                yield row
+
+        chunks = export_chunks(counted(rows(user_id=user_id)), schema, fields, export_format)
+        return f"{name}.{export_format}", EXPORT_FORMATS[export_format], chunks
+    return handler
+
+def _yearly_review_job(user_id, params, progress):
+    review = ReportService.compute_yearly_review(user_id, params['year'], progress)
+    if review.get('error'):
+        raise JobServiceError(review['error'])
+    return f"yearly_review_{params['year']}.json", 'application/json', [json.dumps(review, ensure_ascii=False)]
+
+def _recompute_summaries_job(user_id, params, progress):
+    progress(10, "Checking monthly summaries")
+    drift = SummaryService.find_drift(user_id=user_id)
+    progress(50, "Rebuilding monthly summaries")
+    # Prepočet a zvýšenie verzie v jednej transakcii, inak by sa nové súhrny čítali pod starou verziou z cache
+    SummaryService.rebuild(user_id=user_id, commit=False)
+    if drift:
+        # Súhrny sa zmenili, prehľady v cache už neplatia
+        CacheService.bump_data_version(user_id)
+    db.session.commit()
+    result = {'drift_rows': len(drift), 'rebuilt': True}
+    return 'recompute_summaries.json', 'application/json', [json.dumps(result)]
+
+JOB_HANDLERS = {
+    'export_expenses': _export_job(Expense, ExpenseService.iter_expenses, expense_schema, EXPENSE_EXPORT_FIELDS, 'expenses'),
+    'export_incomes': _export_job(Income, IncomeService.iter_incomes, income_schema, INCOME_EXPORT_FIELDS, 'incomes'),
+    'yearly_review': _yearly_review_job,
+    'recompute_summaries': _recompute_summaries_job,
+}
+
+def run_job(job_id):
+    """Spustí zabranú úlohu, výsledok zapíše do JOB_RESULTS_DIR a nastaví stav."""
+    job = db.session.get(Job, job_id)
+    partial_path = os.path.join(JobService.results_dir(), f"{job_id}.part")
+    try:
+        filename, content_type, chunks = JOB_HANDLERS[job.kind](job.user_id, json.loads(job.params), JobProgress(job_id))
+        with open(partial_path, 'w', encoding='utf-8', newline='') as output:
+            for chunk in chunks:
+                output.write(chunk)
+        db.session.rollback() # Ukončí čítaciu transakciu handlera
+        os.replace(partial_path, os.path.join(JobService.results_dir(), f"{job_id}_{filename}"))
+        JobService.mark_succeeded(job_id, filename, content_type)
+        return True
+    except Exception as e:
+        db.session.rollback()
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        print(f"Job {job_id} ({job.kind}) failed: {e}")
+        message = str(e) if isinstance(e, (JobServiceError, SummaryServiceError)) else "Unexpected error while running the job."
+        JobService.mark_failed(job_id, message)
+        return False
+
+class JobWorkerPool:
+    """
+    Vlákna, ktoré si berú úlohy z tabuľky job. Počet vlákien je horná hranica súbežne bežiacich
+    úloh v procese. Nová úloha v tom istom procese vlákna zobudí hneď, inak sa fronta kontroluje
+    každých JOB_POLL_SECONDS (úlohy z iného procesu alebo po reštarte).
+    """
+
+    def __init__(self, app, threads):
+        self.app = app
+        self.threads = threads
+        self.poll_seconds = app.config.get('JOB_POLL_SECONDS', 2.0)
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+        self.maintenance_lock = threading.Lock()
+        self.last_maintenance = 0.0
+        self.workers = []
+
+    def start(self):
+        for index in range(self.threads):
+            thread = threading.Thread(target=self._run, name=f'job-worker-{index}', daemon=True)
+            thread.start()
+            self.workers.append(thread)
+        print(f"Started {self.threads} job worker threads")
+        return self
+
+    def wake(self):
+        self.wakeup.set()
+
+    def stop(self):
+        self.stopping.set()
+        self.wakeup.set()
+
+    def _maintain(self):
+        """Zaseknuté úlohy vráti do fronty a zmaže staré výsledky (jedno vlákno naraz)."""
+        if time.monotonic() - self.last_maintenance < MAINTENANCE_INTERVAL_SECONDS or not self.maintenance_lock.acquire(blocking=False):
+            return
+        try:
+            self.last_maintenance = time.monotonic()
+            config = self.app.config
+            requeued, failed = JobService.recover_stale(config.get('JOB_STALE_SECONDS', 600), config.get('JOB_MAX_ATTEMPTS', 2))
+            purged = JobService.purge_finished(config.get('JOB_RESULT_RETENTION_DAYS', 7))
+            if requeued or failed or purged:
+                print(f"Job maintenance: {requeued} requeued, {failed} failed, {purged} purged")
+        except Exception as e:
+            db.session.rollback()
+            print(f"Job maintenance failed: {e}")
+        finally:
+            self.maintenance_lock.release()
+
+    def _run(self):
+        while not self.stopping.is_set():
+            job_id = None
+            try:
+                with self.app.app_context():
+                    self._maintain()
+                    job_id = JobService.claim_next()
+                    if job_id is not None:
+                        run_job(job_id)
+            except Exception as e:
+                print(f"Job worker error (job {job_id}): {e}")
+            if job_id is None:
+                self.wakeup.wait(self.poll_seconds)
+                self.wakeup.clear()
+
+def ensure_job_workers(app):
+    """
+    Spustí vlákna workerov v tomto procese pri prvom použití /api/jobs (nie pri štarte,
+    aby ich nespúšťali CLI príkazy). Pri JOB_WORKER_THREADS = 0 úlohy spracúva len flask run-jobs.
+    """
+    pool = app.extensions.get('finapp_job_workers')
+    if pool is not None:
+        return pool
+    threads = app.config.get('JOB_WORKER_THREADS', 2)
+    if threads <= 0:
+        return None
+    with _start_lock:
+        pool = app.extensions.get('finapp_job_workers')
+        if pool is None:
+            pool = app.extensions['finapp_job_workers'] = JobWorkerPool(app, threads).start()
+    return pool
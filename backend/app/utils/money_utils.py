@@ -0,0 +1,33 @@
+# backend/app/utils/money_utils.py
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy.ext.hybrid import hybrid_property
+
+CENT = Decimal('0.01')
+
+def to_cents(value):
+    """Suma v eurách (float, str, Decimal) na celé centy, 0.005 sa zaokrúhli nahor."""
+    if value is None:
+        return None
+    return int(Decimal(str(value)).quantize(CENT, rounding=ROUND_HALF_UP) * 100)
+
+def from_cents(cents):
+    """Centy na float v eurách, v rovnakom tvare ako doteraz vracalo API."""
+    if cents is None:
+        return None
+    return int(cents) / 100
+
+def money_property(cents_column):
+    """
+    Hybrid atribút `amount` nad celočíselným stĺpcom s centami. Modely a schémy
+    pracujú naďalej s eurami, databáza ukladá a sčítava presné centy.
+    """
+    def fget(self):
+        return from_cents(getattr(self, cents_column))
+
+    def fset(self, value):
+        setattr(self, cents_column, to_cents(value))
+
+    def expr(cls):
+        return getattr(cls, cents_column) / 100.0
+
+    return hybrid_property(fget, fset, expr=expr)
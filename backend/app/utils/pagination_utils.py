@@ -0,0 +1,95 @@
+# backend/app/utils/pagination_utils.py
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+
+# Povolené zoradenia zoznamov: názov -> stĺpec modelu, '-' pred názvom = zostupne
+SORT_COLUMNS = {'date': 'date_created', 'amount': 'amount_cents', 'description': 'description'}
+DEFAULT_SORT = '-date'
+
+def parse_sort(value):
+    """Overí parameter sort (napr. '-date', 'amount'). Pri neplatnom vstupe vyhodí ValueError."""
+    sort = value or DEFAULT_SORT
+    if sort.lstrip('-') not in SORT_COLUMNS or sort.count('-') > 1:
+        allowed = ', '.join(SORT_COLUMNS)
+        raise ValueError(f"Invalid sort '{sort}', allowed: {allowed} (prefix '-' for descending)")
+    return sort
+
+def sort_order(model, sort):
+    """(stĺpec, zostupne) pre overený parameter sort."""
+    return getattr(model, SORT_COLUMNS[sort.lstrip('-')]), sort.startswith('-')
+
+def encode_cursor(value, row_id, sort=DEFAULT_SORT):
+    """Zakóduje pozíciu posledného riadku stránky do nepriehľadného reťazca."""
+    raw = [value.isoformat() if isinstance(value, datetime) else value, row_id]
+    if sort != DEFAULT_SORT:
+        raw.append(sort)
+    return base64.urlsafe_b64encode(json.dumps(raw, separators=(',', ':')).encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, sort=DEFAULT_SORT):
+    """
+    Dekóduje cursor na (hodnota stĺpca zoradenia, id). Cursor patrí k jednému zoradeniu,
+    pri inom alebo neplatnom vstupe vyhodí ValueError.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        value, row_id = raw[0], int(raw[1])
+        cursor_sort = raw[2] if len(raw) > 2 else DEFAULT_SORT
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    if cursor_sort != sort:
+        raise ValueError("Cursor belongs to a different sort order")
+    if SORT_COLUMNS[sort.lstrip('-')] == 'date_created':
+        try:
+            value = datetime.fromisoformat(value)
+        except Exception as e:
+            raise ValueError("Invalid cursor") from e
+    return value, row_id
+
+def is_paginated_request(args):
+    """Stránkovanie je voliteľné, bez 'limit' aj 'cursor' ostáva pôvodná odpoveď (celý zoznam)."""
+    return 'limit' in args or 'cursor' in args
+
+def parse_page_args(args, sort=DEFAULT_SORT):
+    """Načíta (limit, cursor) z query parametrov. Pri neplatnom vstupe vyhodí ValueError."""
+    limit = int(args.get('limit', DEFAULT_PAGE_LIMIT))
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise ValueError(f"Limit must be between 1 and {MAX_PAGE_LIMIT}")
+    cursor = args.get('cursor')
+    return limit, (decode_cursor(cursor, sort) if cursor else None)
+
+def keyset_after(model, cursor, sort=DEFAULT_SORT):
+    """
+    Podmienka "za kurzorom" pre zoradenie (stĺpec, id) v smere sort.
+    Databáza pokračuje priamo z indexu (napr. user_id, date_created), takže
+    každá stránka stojí rovnako bez ohľadu na to, ako hlboko je.
+    """
+    value, row_id = cursor
+    column, descending = sort_order(model, sort)
+    if descending:
+        return or_(column < value, and_(column == value, model.id < row_id))
+    return or_(column > value, and_(column == value, model.id > row_id))
+
+def order_by_sort(query, model, sort=DEFAULT_SORT):
+    """Zoradenie podľa sort, pri zhode podľa id v rovnakom smere (stabilné poradie aj pre keyset)."""
+    column, descending = sort_order(model, sort)
+    if descending:
+        return query.order_by(column.desc(), model.id.desc())
+    return query.order_by(column.asc(), model.id.asc())
+
+def keyset_page(query, model, limit, cursor=None, sort=DEFAULT_SORT):
+    """Vráti (položky, next_cursor) pre jednu stránku zoradenú podľa sort (predvolene od najnovších)."""
+    if cursor:
+        query = query.filter(keyset_after(model, cursor, sort))
+    rows = order_by_sort(query, model, sort).limit(limit + 1).all()
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        attribute = SORT_COLUMNS[sort.lstrip('-')]
+        next_cursor = encode_cursor(getattr(items[-1], attribute), items[-1].id, sort)
+    return items, next_cursor
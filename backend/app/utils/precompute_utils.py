@@ -0,0 +1,133 @@
+# backend/app/utils/precompute_utils.py
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, union, delete
+from ..database import db
+from ..models import Expense, Income, ReportCache
+from ..services.cache_service import CacheService
+from ..services.report_service import ReportService, SNAPSHOT_DEFAULT_DAYS
+from ..services.budget_service import BudgetService
+from ..services.dashboard_service import DashboardService
+
+# Záznamy staršie ako toto sa pri prepočte mažú (snapshot je kľúčovaný dňom, starý sa už nenačíta)
+REPORT_CACHE_RETENTION_DAYS = 7
+
+def get_active_user_ids(active_days):
+    """Používatelia s výdavkom alebo príjmom za posledných `active_days` dní."""
+    since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=active_days)
+    query = union(
+        select(Expense.user_id).where(Expense.date_created >= since),
+        select(Income.user_id).where(Income.date_created >= since),
+    )
+    return sorted(row[0] for row in db.session.execute(query))
+
+def precompute_user_reports(user_id):
+    """
+    Spočíta prehľady dashboardu pre aktuálny mesiac a uloží ich do report_cache s verziou dát
+    zistenou pred výpočtom. Ak medzitým používateľ niečo zmení, záznam sa už nepoužije.
+    """
+    today = datetime.now(timezone.utc).date()
+    year, month = today.year, today.month
+    data_version = CacheService.get_data_version(user_id)
+    reports = (
+        ('weekly_snapshot', (today.isoformat(), SNAPSHOT_DEFAULT_DAYS),
+         lambda: ReportService._compute_weekly_snapshot(user_id, SNAPSHOT_DEFAULT_DAYS)),
+        ('budget_status', (year, month), lambda: BudgetService._compute_budget_status_for_month(year, month, user_id)),
+        ('rules_status', (year, month), lambda: BudgetService._compute_rules_status(year, month, user_id)),
+        ('dashboard', (year, month, SNAPSHOT_DEFAULT_DAYS, today.isoformat()),
+         lambda: DashboardService._compute_dashboard(year, month, user_id, SNAPSHOT_DEFAULT_DAYS)),
+    )
+    stored = 0
+    for name, params, compute in reports:
+        value = compute()
+        if isinstance(value, dict) and value.get('error'):
+            print(f"Skipping precomputed {name} for user {user_id}: {value['error']}")
+            continue
+        CacheService.store_precomputed(user_id, name, params, data_version, value)
+        stored += 1
+    db.session.commit()
+    return stored
+
+def precompute_users(user_ids):
+    totals = {'users': 0, 'reports': 0, 'failed': 0}
+    for user_id in user_ids:
+        try:
+            totals['reports'] += precompute_user_reports(user_id)
+            totals['users'] += 1
+        except Exception as e:
+            db.session.rollback()
+            totals['failed'] += 1
+            print(f"Error precomputing reports for user {user_id}: {e}")
+    return totals
+
+def _precompute_worker(database_uri, user_ids):
+    # Každý proces má vlastnú aplikáciu a engine (ako pri seed-load)
+    from .. import create_app
+    from ..config import Config
+    app = create_app(type('PrecomputeConfig', (Config,), {
+        'SQLALCHEMY_DATABASE_URI': database_uri, 'METRICS_ENABLED': False, 'REPORT_PRECOMPUTE_AT': None,
+    }))
+    with app.app_context():
+        return precompute_users(user_ids)
+
+def precompute_reports(database_uri, workers=1, active_days=90):
+    """Prepočet pre všetkých aktívnych používateľov, pri workers > 1 rozdelených medzi procesy."""
+    started = time.perf_counter()
+    db.session.execute(delete(ReportCache).where(
+        ReportCache.computed_at < datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=REPORT_CACHE_RETENTION_DAYS)
+    ))
+    db.session.commit()
+    user_ids = get_active_user_ids(active_days)
+    if workers <= 1 or len(user_ids) <= 1:
+        results = [precompute_users(user_ids)]
+    else:
+        partitions = [user_ids[worker::workers] for worker in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_precompute_worker, database_uri, partition) for partition in partitions if partition]
+            results = [future.result() for future in futures]
+    totals = {'users': 0, 'reports': 0, 'failed': 0}
+    for result in results:
+        for key, value in result.items():
+            totals[key] += value
+    totals['seconds'] = time.perf_counter() - started
+    return totals
+
+def start_report_scheduler(app):
+    """
+    Voliteľný plánovač v procese: každý deň o REPORT_PRECOMPUTE_AT (HH:MM, UTC) spustí prepočet.
+    Pri viacerých workeroch servera ho zapni len v jednom (alebo použi cron s flask precompute-reports).
+    """
+    run_at = app.config.get('REPORT_PRECOMPUTE_AT')
+    if not run_at:
+        return None
+    # Pri debug reloaderi beží aplikácia dvakrát, plánovač patrí len do procesu, ktorý obsluhuje požiadavky
+    if app.debug and os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+        return None
+    hour, minute = (int(part) for part in run_at.split(':'))
+
+    def run_forever():
+        while True:
+            now = datetime.now(timezone.utc)
+            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            time.sleep((next_run - now).total_seconds())
+            try:
+                with app.app_context():
+                    totals = precompute_reports(
+                        app.config['SQLALCHEMY_DATABASE_URI'],
+                        workers=app.config.get('REPORT_PRECOMPUTE_WORKERS', 1),
+                        active_days=app.config.get('REPORT_ACTIVE_DAYS', 90),
+                    )
+                print(f"Precomputed {totals['reports']} reports for {totals['users']} users in {totals['seconds']:.1f}s")
+            except Exception as e:
+                print(f"Scheduled report precompute failed: {e}")
+
+    thread = threading.Thread(target=run_forever, name='report-precompute', daemon=True)
+    thread.start()
+    app.extensions['finapp_report_scheduler'] = thread
+    print(f"Report precompute scheduled daily at {run_at} UTC")
+    return thread
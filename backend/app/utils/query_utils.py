@@ -0,0 +1,27 @@
+# backend/app/utils/query_utils.py
+import asyncio
+
+def fetch_result(result, mode):
+    """Výsledok dotazu podľa spôsobu načítania: 'scalar', 'all' alebo 'first'."""
+    if mode == 'scalar':
+        return result.scalar()
+    if mode == 'all':
+        return result.all()
+    return result.first()
+
+async def fetch_concurrently(engine, queries, concurrency=3):
+    """
+    Spustí nezávislé dotazy {názov: (dotaz, spôsob)} súbežne, každý na vlastnom spojení z poolu
+    async enginu (jedno spojenie vykonáva dotazy len postupne). Naraz drží najviac `concurrency`
+    spojení, aby jedna požiadavka (dashboard má 7 dotazov) nevyčerpala pool ostatným. Vracia {názov: výsledok}.
+    """
+    limit = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(query, mode):
+        async with limit:
+            async with engine.connect() as connection:
+                return fetch_result(await connection.execute(query), mode)
+
+    names = list(queries)
+    values = await asyncio.gather(*(run(*queries[name]) for name in names))
+    return dict(zip(names, values))
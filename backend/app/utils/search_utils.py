@@ -0,0 +1,88 @@
+# backend/app/utils/search_utils.py
+import re
+from sqlalchemy import DDL, event, table, column, literal_column, func, or_, and_
+from ..database import db
+from .pagination_utils import MAX_PAGE_LIMIT
+
+# Najviac toľko slov z dopytu sa použije (každé ako prefix)
+MAX_SEARCH_TERMS = 8
+DEFAULT_SEARCH_LIMIT = 50
+# Váha stĺpcov v bm25: zhoda v popise je dôležitejšia ako v kategórii / zdroji
+FTS_COLUMN_WEIGHTS = (10.0, 3.0)
+
+def fts_ddl(source, fts_name, columns):
+    """
+    FTS5 index s externým obsahom (text sa neukladá dvakrát) a triggre, ktoré ho držia
+    v súlade so zdrojovou tabuľkou. Platí aj pre hromadný import cez insert(), ktorý obchádza ORM.
+    remove_diacritics 2: 'kava' nájde 'Káva'.
+    """
+    names = ', '.join(columns)
+    new_values = ', '.join(f'new.{name}' for name in columns)
+    old_values = ', '.join(f'old.{name}' for name in columns)
+    delete_old = f"INSERT INTO {fts_name}({fts_name}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+    insert_new = f"INSERT INTO {fts_name}(rowid, {names}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_name} USING fts5({names}, content='{source}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ai AFTER INSERT ON {source} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ad AFTER DELETE ON {source} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_au AFTER UPDATE OF {names} ON {source} BEGIN {delete_old} {insert_new} END",
+    ]
+
+def register_fts_index(source_table, fts_name, columns):
+    """Pri db.create_all() na SQLite vytvorí aj FTS index a triggre (migrácia robí to isté pre existujúce DB)."""
+    for statement in fts_ddl(source_table.name, fts_name, columns):
+        event.listen(source_table, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+    event.listen(source_table, 'before_drop', DDL(f"DROP TABLE IF EXISTS {fts_name}").execute_if(dialect='sqlite'))
+    source_table.info['fts'] = (fts_name, tuple(columns))
+
+def rebuild_fts_index(source_table):
+    """Znovu vytvorí chýbajúce triggre (napr. po batch_alter_table) a naplní index zo zdrojovej tabuľky."""
+    fts_name, columns = source_table.info['fts']
+    with db.engine.begin() as connection:
+        for statement in fts_ddl(source_table.name, fts_name, columns):
+            connection.exec_driver_sql(statement)
+        connection.exec_driver_sql(f"INSERT INTO {fts_name}({fts_name}) VALUES ('rebuild')")
+
+def build_match_query(text):
+    """
+    Voľný text na FTS5 dopyt: každé slovo ako prefix v úvodzovkách ("kav"* AND "tesc"*),
+    takže operátory a špeciálne znaky z vstupu nemôžu rozbiť syntax. Bez slov vráti None.
+    """
+    terms = re.findall(r'\w+', text or '')[:MAX_SEARCH_TERMS]
+    return ' '.join(f'"{term}"*' for term in terms) or None
+
+def search_rows(model, columns, user_id, text, limit, offset):
+    """
+    Vyhľadá záznamy používateľa, vráti (riadky s `columns`, next_offset). Na SQLite cez FTS5
+    zoradené podľa bm25 a potom od najnovších, na iných databázach LIKE nad rovnakými stĺpcami.
+    Pri prázdnom dopyte vyhodí ValueError.
+    """
+    match = build_match_query(text)
+    if match is None:
+        raise ValueError("Search query must contain at least one word")
+    fts_name, fts_columns = model.__table__.info['fts']
+    query = db.session.query(*columns).filter(model.user_id == user_id)
+    if db.engine.dialect.name == 'sqlite':
+        fts = table(fts_name, column('rowid'))
+        rank = func.bm25(literal_column(fts_name), *FTS_COLUMN_WEIGHTS)
+        query = query.join(fts, fts.c.rowid == model.id).filter(
+            literal_column(fts_name).op('MATCH')(match)
+        ).order_by(rank, model.date_created.desc(), model.id.desc())
+    else:
+        terms = re.findall(r'\w+', text)[:MAX_SEARCH_TERMS]
+        query = query.filter(and_(*(
+            or_(*(getattr(model, name).ilike(f'%{term}%') for name in fts_columns)) for term in terms
+        ))).order_by(model.date_created.desc(), model.id.desc())
+    rows = query.offset(offset).limit(limit + 1).all()
+    return rows[:limit], (offset + limit if len(rows) > limit else None)
+
+def parse_search_args(args):
+    """(q, limit, offset) z query parametrov. Pri neplatnom vstupe vyhodí ValueError."""
+    limit = int(args.get('limit', DEFAULT_SEARCH_LIMIT))
+    offset = int(args.get('offset', 0))
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise ValueError(f"Limit must be between 1 and {MAX_PAGE_LIMIT}")
+    if offset < 0:
+        raise ValueError("Offset must not be negative")
+    return args.get('q', ''), limit, offset
@@ -0,0 +1,147 @@
+# backend/app/utils/seed_utils.py
+import random
+import time
+from calendar import monthrange
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert
+from werkzeug.security import generate_password_hash
+from ..database import db
+from ..models import User, Expense, Income, Budget
+from ..services.summary_service import SummaryService, EXPENSE, INCOME
+from .money_utils import to_cents
+
+SEED_PASSWORD = 'password'
+INSERT_CHUNK_SIZE = 5000
+
+# (kategória, rule_category, váha, min, max, popisy)
+EXPENSE_PROFILES = (
+    ('Potraviny', 'Needs', 30, 3.0, 90.0, ('Tesco', 'Lidl', 'Billa', 'Kaufland', 'Potraviny Jednota')),
+    ('Doprava', 'Needs', 14, 1.2, 60.0, ('Lístok MHD', 'Tankovanie', 'Vlak', 'Taxi')),
+    ('Energie', 'Needs', 4, 25.0, 140.0, ('Elektrina', 'Plyn', 'Voda')),
+    ('Zdravie', 'Needs', 4, 2.0, 80.0, ('Lekáreň', 'Zubár', 'Vitamíny')),
+    ('Reštaurácie', 'Wants', 14, 4.0, 70.0, ('Obed', 'Kaviareň', 'Pizza', 'Večera')),
+    ('Zábava', 'Wants', 10, 5.0, 120.0, ('Kino', 'Netflix', 'Koncert', 'Spotify', 'Hry')),
+    ('Oblečenie', 'Wants', 6, 10.0, 180.0, ('Zara', 'H&M', 'Topánky', 'Decathlon')),
+    ('Sporenie', 'Savings', 3, 20.0, 400.0, ('Investičný fond', 'Sporiaci účet', 'Dôchodkové sporenie')),
+    ('Nezaradené', None, 5, 1.0, 150.0, ('Platba kartou', 'Prevod', 'Výber z bankomatu')),
+)
+RENT = ('Bývanie', 'Needs', 'Nájom')
+BUDGET_CATEGORIES = ('Potraviny', 'Doprava', 'Reštaurácie', 'Zábava', 'Oblečenie')
+
+def _months_between(start, end):
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+def generate_user_ledger(user_index, expenses_per_user, years, seed, end_date):
+    """
+    Deterministicky vygeneruje výdavky, príjmy a rozpočty jedného používateľa.
+    Rovnaké (seed, user_index, end_date) dá vždy rovnaké dáta.
+    """
+    rng = random.Random(f"{seed}:{user_index}")
+    end = datetime.combine(end_date, datetime.min.time()) + timedelta(days=1)
+    start = end - timedelta(days=365 * years)
+    span_seconds = int((end - start).total_seconds()) - 1
+    months = list(_months_between(start, end - timedelta(seconds=1)))
+    salary = round(rng.uniform(900, 3500), -1)
+
+    expenses, incomes, budgets = [], [], []
+    # Nájom raz mesačne, zvyšok náhodne podľa váh kategórií
+    rent = to_cents(salary * rng.uniform(0.25, 0.4))
+    for year, month in months:
+        day = min(rng.randint(1, 5), monthrange(year, month)[1])
+        rent_date = datetime(year, month, day, 9, 0)
+        if start <= rent_date < end and len(expenses) < expenses_per_user:
+            expenses.append({'description': RENT[2], 'amount_cents': rent, 'category': RENT[0], 'rule_category': RENT[1], 'date_created': rent_date})
+
+    weights = [profile[2] for profile in EXPENSE_PROFILES]
+    for profile in rng.choices(EXPENSE_PROFILES, weights=weights, k=max(expenses_per_user - len(expenses), 0)):
+        category, rule_category, _, low, high, descriptions = profile
+        expenses.append({
+            'description': rng.choice(descriptions),
+            'amount_cents': to_cents(rng.uniform(low, high)),
+            'category': category,
+            'rule_category': rule_category,
+            'date_created': start + timedelta(seconds=rng.randint(0, span_seconds)),
+        })
+    expenses.sort(key=lambda row: row['date_created'])
+
+    total_weight = sum(weights)
+    random_per_month = max(expenses_per_user - len(months), 0) / len(months)
+    expected_monthly = {profile[0]: random_per_month * profile[2] / total_weight * (profile[3] + profile[4]) / 2 for profile in EXPENSE_PROFILES}
+    for year, month in months:
+        payday = datetime(year, month, min(10, monthrange(year, month)[1]), 8, 0)
+        if start <= payday < end:
+            incomes.append({'description': 'Výplata', 'amount_cents': to_cents(salary), 'source': 'Zamestnávateľ', 'date_created': payday})
+        if month in (6, 12) and start <= payday < end:
+            incomes.append({'description': 'Bonus', 'amount_cents': to_cents(salary * rng.uniform(0.2, 1.0)), 'source': 'Zamestnávateľ', 'date_created': payday + timedelta(days=1)})
+        if rng.random() < 0.3:
+            side_date = payday + timedelta(days=rng.randint(3, 15))
+            if start <= side_date < end:
+                incomes.append({'description': 'Brigáda', 'amount_cents': to_cents(rng.uniform(50, 400)), 'source': 'Vedľajší príjem', 'date_created': side_date})
+        for category in BUDGET_CATEGORIES:
+            # Rozpočet okolo očakávaných mesačných výdavkov v kategórii (±20 %)
+            budget_amount = expected_monthly[category] * rng.uniform(0.8, 1.2)
+            budgets.append({'category': category, 'amount_cents': to_cents(max(round(budget_amount), 10)), 'month': month, 'year': year})
+    return expenses, incomes, budgets
+
+def _insert_chunked(model, rows):
+    for offset in range(0, len(rows), INSERT_CHUNK_SIZE):
+        db.session.execute(insert(model), rows[offset:offset + INSERT_CHUNK_SIZE])
+
+def seed_users(user_indices, expenses_per_user, years, seed, end_date, password_hash):
+    """Vloží používateľov s vygenerovanými dátami. Existujúcich (podľa mena) preskočí. Vracia počet riadkov."""
+    inserted = {'users': 0, 'expenses': 0, 'incomes': 0, 'budgets': 0}
+    for user_index in user_indices:
+        username = f"loaduser{user_index}"
+        if db.session.query(User.id).filter_by(username=username).first():
+            continue
+        user_id = db.session.execute(insert(User).values(
+            username=username, email=f"{username}@example.com", password_hash=password_hash,
+            date_registered=datetime.now(timezone.utc)
+        )).inserted_primary_key[0]
+        expenses, incomes, budgets = generate_user_ledger(user_index, expenses_per_user, years, seed, end_date)
+        for rows in (expenses, incomes, budgets):
+            for row in rows:
+                row['user_id'] = user_id
+        _insert_chunked(Expense, expenses)
+        _insert_chunked(Income, incomes)
+        _insert_chunked(Budget, budgets)
+        SummaryService.record_bulk(EXPENSE, expenses)
+        SummaryService.record_bulk(INCOME, incomes)
+        db.session.commit()
+        inserted['users'] += 1
+        inserted['expenses'] += len(expenses)
+        inserted['incomes'] += len(incomes)
+        inserted['budgets'] += len(budgets)
+    return inserted
+
+def _seed_worker(database_uri, user_indices, expenses_per_user, years, seed, end_date, password_hash):
+    # Každý proces má vlastnú aplikáciu a engine (spojenia sa nedajú zdieľať cez fork)
+    from .. import create_app
+    from ..config import Config
+    app = create_app(type('SeedLoadConfig', (Config,), {'SQLALCHEMY_DATABASE_URI': database_uri, 'METRICS_ENABLED': False, 'REPORT_PRECOMPUTE_AT': None}))
+    with app.app_context():
+        return seed_users(user_indices, expenses_per_user, years, seed, end_date, password_hash)
+
+def seed_load(database_uri, users, expenses_per_user, years, seed, end_date, workers=1):
+    """Naplní databázu `users` používateľmi, pri workers > 1 rozdelí používateľov medzi procesy."""
+    started = time.perf_counter()
+    # Hash hesla je drahý, pre všetkých testovacích používateľov stačí jeden
+    password_hash = generate_password_hash(SEED_PASSWORD)
+    totals = {'users': 0, 'expenses': 0, 'incomes': 0, 'budgets': 0}
+    if workers <= 1:
+        results = [seed_users(range(users), expenses_per_user, years, seed, end_date, password_hash)]
+    else:
+        partitions = [list(range(worker, users, workers)) for worker in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_seed_worker, database_uri, partition, expenses_per_user, years, seed, end_date, password_hash)
+                       for partition in partitions if partition]
+            results = [future.result() for future in futures]
+    for result in results:
+        for key, value in result.items():
+            totals[key] += value
+    totals['seconds'] = time.perf_counter() - started
+    return totals
@@ -0,0 +1,79 @@
+# backend/app/utils/server_utils.py
+import os
+import time
+from marshmallow import Schema
+from sqlalchemy.orm import configure_mappers
+from ..database import db
+
+def available_cpus():
+    """CPU, na ktorých smie proces bežať (v kontajneri môže byť menej ako os.cpu_count())."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def autotune_workers(config, cpus=None):
+    """
+    (workers, threads) pre gunicorn. Bez nastavenia 2 * CPU + 1 procesov (ohraničené WEB_MAX_WORKERS)
+    po 2 vláknach: procesy obídu GIL pri serializácii, vlákna prekryjú čakanie na DB a pomalých klientov.
+    """
+    cpus = cpus or available_cpus()
+    workers = config.get('WEB_WORKERS') or min(2 * cpus + 1, config.get('WEB_MAX_WORKERS', 16))
+    threads = config.get('WEB_THREADS') or 2
+    return max(1, workers), max(1, threads)
+
+def warm_up(app):
+    """
+    Pripraví všetko, čo by inak spomalilo prvú požiadavku každého workera: konfigurácia mapperov,
+    prvé spojenie a skompilované SELECT-y modelov, polia marshmallow schém a URL mapa.
+    Na konci zavrie spojenia, aby sa pri forku nezdieľali medzi procesmi. Vracia trvanie v sekundách.
+    """
+    from .. import schemas
+
+    started = time.perf_counter()
+    configure_mappers()
+    with app.app_context():
+        for mapper in db.Model.registry.mappers:
+            try:
+                db.session.query(mapper.class_).limit(0).all()
+            except Exception as e:
+                # Napr. tabuľka z novej migrácie ešte neexistuje, server sa aj tak spustí
+                db.session.rollback()
+                print(f"Warm-up query for {mapper.class_.__name__} failed: {e}")
+        for schema in vars(schemas).values():
+            if not isinstance(schema, Schema):
+                continue
+            model = getattr(schema.Meta, 'model', None)
+            if model is not None:
+                instance = model()
+                schema.dump([instance] if schema.many else instance)
+            schema.validate({})
+        db.session.remove()
+        db.engine.dispose()
+    adapter = app.url_map.bind('localhost')
+    adapter.match('/api/ping')
+    return time.perf_counter() - started
+
+def after_fork(app, start_scheduler=False):
+    """
+    Volá sa v novom workeri. Spojenia z rodiča sa nesmú použiť (close=False ich nezatvorí rodičovi),
+    vlákna úloh sa pri forku neprenášajú, worker si ich spustí sám pri prvom /api/jobs.
+    start_scheduler=True spustí plánovač prepočtu prehľadov (master ho určí práve jednému workeru).
+    """
+    from .precompute_utils import start_report_scheduler
+
+    with app.app_context():
+        db.engine.dispose(close=False)
+    app.extensions.pop('finapp_job_workers', None)
+    if start_scheduler:
+        start_report_scheduler(app)
+
+def before_worker_exit(app, timeout):
+    """Pri ukončení workera počká na rozbehnuté úlohy najviac `timeout` sekúnd, zvyšok neskôr vráti recover_stale."""
+    pool = app.extensions.get('finapp_job_workers')
+    if pool is None:
+        return
+    pool.stop()
+    deadline = time.monotonic() + timeout
+    for thread in pool.workers:
+        thread.join(max(0.0, deadline - time.monotonic()))
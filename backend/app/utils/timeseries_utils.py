@@ -0,0 +1,59 @@
+# backend/app/utils/timeseries_utils.py
+import numpy as np
+
+GRANULARITIES = ('day', 'week', 'month')
+# Predvolené okno kĺzavého priemeru (počet období) pre každú granularitu
+DEFAULT_WINDOWS = {'day': 7, 'week': 4, 'month': 3}
+
+def to_day_array(dates):
+    """Zoznam datetime/date na pole datetime64[D]."""
+    return np.array(dates, dtype='datetime64[D]') if len(dates) else np.array([], dtype='datetime64[D]')
+
+def period_starts(days, granularity):
+    """Začiatok obdobia (deň, pondelok týždňa, prvý deň mesiaca) pre každý deň v poli."""
+    if granularity == 'day':
+        return days
+    if granularity == 'week':
+        # 1970-01-01 bol štvrtok, pondelok = 0
+        weekday = (days.astype('int64') + 3) % 7
+        return days - weekday.astype('timedelta64[D]')
+    return days.astype('datetime64[M]').astype('datetime64[D]')
+
+def period_range(start, end, granularity):
+    """Všetky začiatky období od obdobia obsahujúceho start po obdobie obsahujúce end."""
+    first, last = period_starts(to_day_array([start, end]), granularity)
+    if granularity == 'month':
+        return np.arange(first.astype('datetime64[M]'), last.astype('datetime64[M]') + 1).astype('datetime64[D]')
+    step = 7 if granularity == 'week' else 1
+    return np.arange(first, last + 1, step)
+
+def bucket_sums(days, cents, periods, granularity):
+    """Súčet centov za každé obdobie (np.bincount namiesto cyklu cez riadky)."""
+    if not len(days):
+        return np.zeros(len(periods), dtype='int64')
+    index = np.searchsorted(periods, period_starts(days, granularity))
+    return np.bincount(index, weights=cents, minlength=len(periods)).round().astype('int64')
+
+def rolling_mean(values, window):
+    """Kĺzavý priemer cez kumulatívny súčet, na začiatku sa priemeruje cez kratšie okno."""
+    cumulative = np.concatenate(([0], np.cumsum(values, dtype='float64')))
+    upper = np.arange(1, len(values) + 1)
+    lower = np.maximum(upper - window, 0)
+    return (cumulative[upper] - cumulative[lower]) / (upper - lower)
+
+def period_delta(values):
+    """Rozdiel oproti predchádzajúcemu obdobiu a percentuálna zmena (NaN pri prvom období alebo nule)."""
+    values = values.astype('float64')
+    delta = np.full(len(values), np.nan)
+    pct = np.full(len(values), np.nan)
+    if len(values) > 1:
+        delta[1:] = np.diff(values)
+        previous = values[:-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct[1:] = np.where(previous != 0, delta[1:] / previous * 100, np.nan)
+    return delta, pct
+
+def to_json_list(values, scale=1, decimals=2):
+    """Pole na zoznam pre JSON, NaN -> None."""
+    scaled = np.round(values / scale, decimals)
+    return [None if np.isnan(value) else value for value in scaled.tolist()]
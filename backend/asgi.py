@@ -0,0 +1,23 @@
+# backend/asgi.py
+"""
+Vstupný bod pre ASGI server (voliteľný async režim):
+
+    uvicorn asgi:app --workers 4
+
+Prehľady (týždenný prehľad, dashboard, stav rozpočtov a 50/30/20) bežia ako korutíny nad async
+ovládačom (aiosqlite / asyncpg), ostatné endpointy obsluhuje nezmenená Flask aplikácia.
+Potrebuje balíky zo requirements-async.txt.
+Každý worker uvicornu importuje tento modul sám, takže s REPORT_PRECOMPUTE_AT by ich plánovač
+bežal N-krát: pri viacerých workeroch použi cron s flask precompute-reports.
+"""
+import os
+from app import create_app
+from app.asgi_app import create_asgi_app
+from app.utils.server_utils import warm_up
+
+flask_app = create_app()
+
+if flask_app.config.get('WEB_WARMUP', True):
+    print(f"Application warmed up in {warm_up(flask_app) * 1000:.0f} ms (pid {os.getpid()})")
+
+app = create_asgi_app(flask_app)
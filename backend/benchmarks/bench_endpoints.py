@@ -0,0 +1,222 @@
+# backend/benchmarks/bench_endpoints.py
+"""
+Benchmark API endpointov cez Flask test client nad vygenerovanými dátami.
+
+Spúšťa sa z priečinka backend:
+
+    python -m benchmarks.bench_endpoints --sizes 1000,10000 --output benchmarks/baseline.json
+    python -m benchmarks.bench_endpoints --sizes 1000,10000 --compare benchmarks/baseline.json
+
+Pre každú veľkosť (počet výdavkov na používateľa) sa vytvorí nová SQLite databáza
+v dočasnom priečinku, naplní sa cez seed_utils a každý endpoint sa zavolá
+`--iterations`-krát. Výsledkom je p50/p95/p99 latencia, priepustnosť a počet SQL
+príkazov na požiadavku. Režim --compare porovná výsledky s uloženou baseline
+a pri regresii skončí s kódom 1.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timezone
+
+import sqlalchemy
+from werkzeug.security import generate_password_hash
+
+from app import create_app
+from app.config import Config
+from app.database import db
+from app.utils.seed_utils import seed_users, SEED_PASSWORD
+
+DEFAULT_SIZES = (1000, 10000)
+DEFAULT_ITERATIONS = 50
+DEFAULT_WARMUP = 5
+DEFAULT_USERS = 3
+# Regresia = p95 horšie o viac ako threshold a zároveň aspoň o min-delta (šum pri rýchlych endpointoch)
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_MIN_DELTA_MS = 1.0
+
+def endpoint_cases(today):
+    """Zoznam (názov, metóda, url, json telo). Všetky volania idú s tokenom prvého používateľa."""
+    month_query = f"year={today.year}&month={today.month}"
+    return [
+        ("expenses_list", "GET", "/api/expenses", None),
+        ("expenses_page", "GET", "/api/expenses?limit=50", None),
+        ("expenses_search", "GET", "/api/expenses/search?q=potrav", None),
+        ("incomes_list", "GET", "/api/incomes", None),
+        ("incomes_page", "GET", "/api/incomes?limit=50", None),
+        ("budgets", "GET", f"/api/budgets?{month_query}", None),
+        ("budget_status", "GET", f"/api/budget-status?{month_query}", None),
+        ("budget_rules_status", "GET", f"/api/budget-rules-status?{month_query}", None),
+        ("weekly_snapshot_7", "GET", "/api/reports/weekly-snapshot?days=7", None),
+        ("weekly_snapshot_90", "GET", "/api/reports/weekly-snapshot?days=90", None),
+        ("dashboard", "GET", f"/api/dashboard?{month_query}", None),
+        ("timeseries_day", "GET", "/api/reports/timeseries?granularity=day", None),
+        ("timeseries_month", "GET", "/api/reports/timeseries?granularity=month", None),
+        ("auth_login", "POST", "/api/auth/login", {"login": "loaduser0", "password": SEED_PASSWORD}),
+        ("auth_me", "GET", "/api/auth/me", None),
+    ]
+
+def percentile(sorted_values, fraction):
+    """Percentil metódou najbližšieho poradia (bez interpolácie)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(fraction * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+def build_app(database_uri, cache_enabled):
+    config = type('BenchConfig', (Config,), {
+        'SQLALCHEMY_DATABASE_URI': database_uri,
+        'METRICS_ENABLED': True,
+        'CACHE_BACKEND': 'memory' if cache_enabled else 'null',
+        'TESTING': True,
+        'REPORT_PRECOMPUTE_AT': None,
+    })
+    return create_app(config)
+
+def seed_dataset(app, users, expenses_per_user, years, seed):
+    with app.app_context():
+        db.create_all()
+        password_hash = generate_password_hash(SEED_PASSWORD)
+        return seed_users(range(users), expenses_per_user, years, seed, date.today(), password_hash)
+
+def run_endpoint(app, client, case, token, iterations, warmup):
+    name, method, url, body = case
+    headers = {"Authorization": f"Bearer {token}"}
+    registry = app.extensions['finapp_metrics']
+    endpoint = app.url_map.bind('localhost').match(url.split('?')[0], method=method)[0]
+
+    for _ in range(warmup):
+        client.open(url, method=method, json=body, headers=headers).close()
+
+    # Registry zapisuje v after_request, takže po návrate z test clienta je počet SQL aktuálny
+    sql_before = registry.sql_statements[endpoint]
+    timings = []
+    statuses = set()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        request_started = time.perf_counter()
+        response = client.open(url, method=method, json=body, headers=headers)
+        response.get_data()
+        timings.append(time.perf_counter() - request_started)
+        statuses.add(response.status_code)
+        response.close()
+    elapsed = time.perf_counter() - started
+    sql_statements = registry.sql_statements[endpoint] - sql_before
+
+    timings.sort()
+    return {
+        "endpoint": endpoint,
+        "status": sorted(statuses),
+        "iterations": iterations,
+        "p50_ms": round(percentile(timings, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(timings, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(timings, 0.99) * 1000, 3),
+        "mean_ms": round(sum(timings) / len(timings) * 1000, 3),
+        "throughput_rps": round(iterations / elapsed, 1) if elapsed else 0.0,
+        "sql_per_request": round(sql_statements / iterations, 2),
+    }
+
+def benchmark_size(expenses_per_user, args):
+    with tempfile.TemporaryDirectory(prefix='finapp-bench-') as tmpdir:
+        app = build_app('sqlite:///' + os.path.join(tmpdir, 'bench.db'), args.cache)
+        seed_started = time.perf_counter()
+        seeded = seed_dataset(app, args.users, expenses_per_user, args.years, args.seed)
+        print(f"[{expenses_per_user} expenses/user] seeded {seeded['expenses']} expenses, {seeded['incomes']} incomes "
+              f"for {seeded['users']} users in {time.perf_counter() - seed_started:.1f}s")
+
+        client = app.test_client()
+        login = client.post('/api/auth/login', json={"login": "loaduser0", "password": SEED_PASSWORD})
+        token = login.get_json()["access_token"]
+
+        results = {}
+        for case in endpoint_cases(date.today()):
+            if args.only and case[0] not in args.only:
+                continue
+            row = run_endpoint(app, client, case, token, args.iterations, args.warmup)
+            results[case[0]] = row
+            print(f"  {case[0]:22s} p50 {row['p50_ms']:9.2f} ms  p95 {row['p95_ms']:9.2f} ms  p99 {row['p99_ms']:9.2f} ms  "
+                  f"{row['throughput_rps']:8.1f} req/s  {row['sql_per_request']:6.2f} sql/req")
+            if any(status >= 400 for status in row['status']):
+                print(f"  WARNING: {case[0]} returned status {row['status']}")
+        with app.app_context():
+            db.engine.dispose()
+        return results
+
+def compare_results(baseline, current, threshold, min_delta_ms):
+    """Vráti zoznam regresií (p95 latencia alebo počet SQL) medzi baseline a aktuálnym behom."""
+    regressions = []
+    for size, endpoints in current['results'].items():
+        base_endpoints = baseline['results'].get(size)
+        if base_endpoints is None:
+            print(f"[{size}] not in baseline, skipping comparison")
+            continue
+        for name, row in endpoints.items():
+            base = base_endpoints.get(name)
+            if base is None:
+                continue
+            delta_ms = row['p95_ms'] - base['p95_ms']
+            ratio = row['p95_ms'] / base['p95_ms'] if base['p95_ms'] else float('inf')
+            if delta_ms > min_delta_ms and ratio > 1 + threshold:
+                regressions.append(f"[{size}] {name}: p95 {base['p95_ms']:.2f} -> {row['p95_ms']:.2f} ms ({(ratio - 1) * 100:+.0f}%)")
+            if row['sql_per_request'] > base['sql_per_request']:
+                regressions.append(f"[{size}] {name}: SQL per request {base['sql_per_request']} -> {row['sql_per_request']}")
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark API endpoints against generated datasets.")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='Comma separated expenses-per-user dataset sizes.')
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS, help='Users in each dataset.')
+    parser.add_argument('--years', type=int, default=2, help='Length of each generated ledger in years.')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the generated data.')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help='Measured requests per endpoint.')
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP, help='Unmeasured requests per endpoint.')
+    parser.add_argument('--only', type=lambda value: set(value.split(',')), default=None,
+                        help='Comma separated benchmark names to run (default: all).')
+    parser.add_argument('--cache', action='store_true', help='Keep the report cache enabled (default: null cache).')
+    parser.add_argument('--output', help='Write results as JSON (e.g. a new baseline).')
+    parser.add_argument('--compare', help='Baseline JSON to compare against; exits with 1 on regression.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Allowed relative p95 slowdown.')
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS, help='Ignore p95 slowdowns below this.')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    current = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+            "users": args.users, "years": args.years, "seed": args.seed,
+            "iterations": args.iterations, "warmup": args.warmup, "cache": args.cache,
+        },
+        "results": {},
+    }
+    for size in sizes:
+        current["results"][str(size)] = benchmark_size(size, args)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, current, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"No regressions against {args.compare}.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
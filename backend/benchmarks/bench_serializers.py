@@ -0,0 +1,87 @@
+# backend/benchmarks/bench_serializers.py
+"""
+Meranie rýchlej cesty zoznamov (stĺpce ako n-tice + RowSerializer) oproti pôvodnej
+ceste (ORM objekty + marshmallow schéma + jsonify).
+
+Spúšťa sa z priečinka backend:
+
+    python -m benchmarks.bench_serializers --sizes 1000,10000
+
+Bajtovú zhodu oboch ciest overuje tests/test_row_serializers.py (python -m pytest).
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from flask import jsonify
+
+from app.database import db
+from app.schemas import expenses_schema, incomes_schema, budgets_schema, expense_rows, income_rows, budget_rows
+from app.services import ExpenseService, IncomeService, BudgetService
+from .bench_endpoints import build_app, seed_dataset, percentile
+
+DEFAULT_SIZES = (1000, 10000)
+DEFAULT_ITERATIONS = 20
+
+def list_cases(user_id, today):
+    """(názov, pôvodná cesta, rýchla cesta), obe vracajú Response."""
+    return [
+        ("expenses_list",
+         lambda: jsonify(expenses_schema.dump(ExpenseService.get_all_expenses(user_id))),
+         lambda: expense_rows.list_response(ExpenseService.get_all_expense_rows(user_id))),
+        ("expenses_page",
+         lambda: (lambda page: jsonify({"items": expenses_schema.dump(page[0]), "next_cursor": page[1]}))(ExpenseService.get_expenses_page(user_id, 50)),
+         lambda: expense_rows.page_response(*ExpenseService.get_expense_rows_page(user_id, 50))),
+        ("incomes_list",
+         lambda: jsonify(incomes_schema.dump(IncomeService.get_all_incomes(user_id))),
+         lambda: income_rows.list_response(IncomeService.get_all_income_rows(user_id))),
+        ("incomes_page",
+         lambda: (lambda page: jsonify({"items": incomes_schema.dump(page[0]), "next_cursor": page[1]}))(IncomeService.get_incomes_page(user_id, 50)),
+         lambda: income_rows.page_response(*IncomeService.get_income_rows_page(user_id, 50))),
+        ("budgets",
+         lambda: jsonify(budgets_schema.dump(BudgetService.get_budgets_for_month(today.year, today.month, user_id))),
+         lambda: budget_rows.list_response(BudgetService.get_budget_rows_for_month(today.year, today.month, user_id))),
+    ]
+
+def time_path(path, iterations):
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        path().get_data()
+        # Nová identity map, aby pôvodná cesta nedostala ORM objekty zadarmo z predchádzajúceho volania
+        db.session.remove()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return percentile(timings, 0.50) * 1000, percentile(timings, 0.95) * 1000
+
+def benchmark_size(expenses_per_user, args):
+    with tempfile.TemporaryDirectory(prefix='finapp-bench-') as tmpdir:
+        app = build_app('sqlite:///' + os.path.join(tmpdir, 'bench.db'), cache_enabled=False)
+        seed_dataset(app, 1, expenses_per_user, args.years, args.seed)
+        print(f"[{expenses_per_user} expenses/user]")
+        with app.test_request_context():
+            for name, schema_path, fast_path in list_cases(1, datetime.now()):
+                size = len(fast_path().get_data())
+                db.session.remove()
+                schema_p50, schema_p95 = time_path(schema_path, args.iterations)
+                fast_p50, fast_p95 = time_path(fast_path, args.iterations)
+                print(f"  {name:14s} {size:9d} B  schema p50 {schema_p50:8.2f} ms  p95 {schema_p95:8.2f} ms  "
+                      f"fast p50 {fast_p50:8.2f} ms  p95 {fast_p95:8.2f} ms  x{schema_p50 / max(fast_p50, 1e-9):.1f}")
+        with app.app_context():
+            db.engine.dispose()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the fast list serializer with the marshmallow schemas.")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help='Comma separated expenses-per-user sizes.')
+    parser.add_argument('--years', type=int, default=2, help='Length of the generated ledger in years.')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the generated data.')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help='Measured calls per path.')
+    args = parser.parse_args(argv)
+
+    for size in (int(size) for size in args.sizes.split(',') if size):
+        benchmark_size(size, args)
+
+if __name__ == '__main__':
+    main()
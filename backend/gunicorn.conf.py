@@ -0,0 +1,57 @@
+# backend/gunicorn.conf.py
+"""
+Konfigurácia gunicornu pre produkciu, spúšťa sa z priečinka backend:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Hodnoty sa berú z Config (WEB_*), takže platia rovnaké .env / premenné prostredia ako pre aplikáciu.
+Plynulý reštart: `kill -HUP <master>` vymení workery bez výpadku. S preloadom HUP nenačíta nový kód
+(master ho má v pamäti), pri nasadení použi `kill -USR2 <master>` (nový master popri starom)
+a potom `kill -QUIT <starý master>`.
+Plánovač prepočtu prehľadov (REPORT_PRECOMPUTE_AT) beží práve v jednom workeri, po jeho recyklácii
+ho prevezme ďalší nový worker. Master zostáva bez vlákien, takže fork je bezpečný.
+"""
+import os
+from app.config import Config, LOADED_ENV_FILE
+from app.utils.server_utils import autotune_workers
+
+app_config = {key: getattr(Config, key) for key in dir(Config) if key.isupper()}
+
+bind = os.environ.get('GUNICORN_BIND') or f"{os.environ.get('FLASK_RUN_HOST', '0.0.0.0')}:{os.environ.get('FLASK_RUN_PORT', 5000)}"
+workers, threads = autotune_workers(app_config)
+worker_class = 'gthread'
+preload_app = app_config['WEB_PRELOAD']
+max_requests = app_config['WEB_MAX_REQUESTS']
+max_requests_jitter = max_requests // 10
+timeout = app_config['WEB_TIMEOUT']
+graceful_timeout = app_config['WEB_GRACEFUL_TIMEOUT']
+keepalive = 5
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG') or None
+
+def on_starting(server):
+    print(f"Environment loaded from: {LOADED_ENV_FILE or 'process environment only'}")
+
+def when_ready(server):
+    print(f"Serving on {bind} with {workers} workers x {threads} threads (preload: {preload_app})")
+
+def _application():
+    # Pri preloade je modul už načítaný v mastri, bez neho ho worker naimportuje (a zahreje) sám
+    from wsgi import app
+    return app
+
+# Worker s plánovačom prepočtu, sleduje ho master (pre_fork beží v mastri, post_fork už vo workeri)
+scheduler_worker = None
+
+def pre_fork(server, worker):
+    global scheduler_worker
+    if scheduler_worker is None or scheduler_worker not in server.WORKERS.values():
+        scheduler_worker = worker
+        worker.runs_report_scheduler = True
+
+def post_fork(server, worker):
+    from app.utils.server_utils import after_fork
+    after_fork(_application(), start_scheduler=getattr(worker, 'runs_report_scheduler', False))
+
+def worker_exit(server, worker):
+    from app.utils.server_utils import before_worker_exit
+    before_worker_exit(_application(), graceful_timeout)
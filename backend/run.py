@@ -1,5 +1,7 @@
 # backend/run.py
+# Vývojový server. V produkcii: gunicorn -c gunicorn.conf.py wsgi:app
 from app import create_app
+from app.config import LOADED_ENV_FILE
 import os
 
 app = create_app()
@@ -8,6 +10,7 @@ if __name__ == '__main__':
     port = int(os.environ.get('FLASK_RUN_PORT', 5000))
     host = os.environ.get('FLASK_RUN_HOST', '127.0.0.1')
     debug_mode = os.environ.get('FLASK_ENV') == 'development'
+    print(f"Environment loaded from: {LOADED_ENV_FILE or 'process environment only'}")
     
     # Add this line to ensure routes are registered
     with app.app_context():
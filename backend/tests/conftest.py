@@ -0,0 +1,28 @@
+# backend/tests/conftest.py
+import pytest
+from app import create_app
+from app.config import Config
+from app.database import db
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    CACHE_BACKEND = 'null'
+    METRICS_ENABLED = False
+    REPORT_PRECOMPUTE_AT = None
+    JOB_WORKER_THREADS = 0
+
+@pytest.fixture
+def app():
+    app = create_app(TestConfig, start_scheduler=False)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+@pytest.fixture
+def request_context(app):
+    # jsonify a RowSerializer potrebujú request kontext
+    with app.test_request_context():
+        yield
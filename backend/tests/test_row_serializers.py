@@ -0,0 +1,62 @@
+# backend/tests/test_row_serializers.py
+"""Rýchla cesta zoznamov (RowSerializer) musí vracať bajtovo to isté ako marshmallow schéma + jsonify."""
+from datetime import datetime
+import pytest
+from flask import jsonify
+from app.database import db
+from app.models import User, Expense, Income, Budget
+from app.schemas import expenses_schema, incomes_schema, budgets_schema, expense_rows, income_rows, budget_rows
+from app.services import ExpenseService, IncomeService, BudgetService
+
+EDGE_TEXTS = ('Káva ☕ "u Nováka"', 'tab\tnew\nline \\ /', '\x00\x1f 😀', 'a' * 200, 'Potraviny')
+# Celé eurá (100 -> 1.0), centy, hranice a veľké sumy
+EDGE_AMOUNTS = (1, 10, 99, 100, 2500, 123456789, 2 ** 31 - 1)
+WHEN = datetime(2024, 2, 29, 23, 59, 59, 123456)
+
+@pytest.fixture
+def user_id(app, request_context):
+    user = User(username='serializer', email='serializer@example.com')
+    user.set_password('password')
+    db.session.add(user)
+    db.session.flush()
+    for index, cents in enumerate(EDGE_AMOUNTS * 2):
+        text = EDGE_TEXTS[index % len(EDGE_TEXTS)]
+        db.session.add(Expense(user_id=user.id, description=text, amount_cents=cents, date_created=WHEN.replace(second=index % 60),
+                               category=None if index % 2 else text[:50], rule_category=None if index % 3 else 'Needs'))
+        db.session.add(Income(user_id=user.id, description=text, amount_cents=cents, date_created=WHEN.replace(microsecond=index),
+                              source=None if index % 2 else text[:100]))
+    for index, cents in enumerate(EDGE_AMOUNTS[:len(EDGE_TEXTS)]):
+        db.session.add(Budget(user_id=user.id, category=EDGE_TEXTS[index][:50], amount_cents=cents, month=2, year=2024))
+    db.session.commit()
+    return user.id
+
+def _assert_identical(expected, actual):
+    # Nová identity map, aby obe cesty čítali z DB rovnako
+    db.session.remove()
+    assert actual.get_data() == expected.get_data()
+
+def test_expenses_list(user_id):
+    expected = jsonify(expenses_schema.dump(ExpenseService.get_all_expenses(user_id)))
+    _assert_identical(expected, expense_rows.list_response(ExpenseService.get_all_expense_rows(user_id)))
+
+def test_expenses_page(user_id):
+    items, next_cursor = ExpenseService.get_expenses_page(user_id, 5)
+    expected = jsonify({"items": expenses_schema.dump(items), "next_cursor": next_cursor})
+    _assert_identical(expected, expense_rows.page_response(*ExpenseService.get_expense_rows_page(user_id, 5)))
+
+def test_incomes_list(user_id):
+    expected = jsonify(incomes_schema.dump(IncomeService.get_all_incomes(user_id)))
+    _assert_identical(expected, income_rows.list_response(IncomeService.get_all_income_rows(user_id)))
+
+def test_incomes_page(user_id):
+    items, next_cursor = IncomeService.get_incomes_page(user_id, 5)
+    expected = jsonify({"items": incomes_schema.dump(items), "next_cursor": next_cursor})
+    _assert_identical(expected, income_rows.page_response(*IncomeService.get_income_rows_page(user_id, 5)))
+
+def test_budgets(user_id):
+    expected = jsonify(budgets_schema.dump(BudgetService.get_budgets_for_month(2024, 2, user_id)))
+    _assert_identical(expected, budget_rows.list_response(BudgetService.get_budget_rows_for_month(2024, 2, user_id)))
+
+def test_empty_lists(user_id):
+    assert expense_rows.list_response([]).get_data() == jsonify(expenses_schema.dump([])).get_data()
+    assert budget_rows.list_response([]).get_data() == jsonify(budgets_schema.dump([])).get_data()
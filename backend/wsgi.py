@@ -0,0 +1,18 @@
+# backend/wsgi.py
+"""
+Vstupný bod pre produkčný WSGI server:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+S preloadom (predvolené) sa modul importuje raz v master procese, aplikácia sa zahreje
+a workery ju zdedia hotovú pri forku. Plánovač prepočtu prehľadov tu nebeží (vlákno v mastri
+by sa kopírovalo do každého forku), spustí ho gunicorn.conf.py práve v jednom workeri.
+"""
+import os
+from app import create_app
+from app.utils.server_utils import warm_up
+
+app = create_app(start_scheduler=False)
+
+if app.config.get('WEB_WARMUP', True):
+    print(f"Application warmed up in {warm_up(app) * 1000:.0f} ms (pid {os.getpid()})")
@@ -40,7 +40,7 @@ export const changePassword = async (passwordData) => {
     try {
         // Použi apiClient, lebo táto operácia vyžaduje byť prihlásený (token)
         const response = await apiClient.put(`/auth/change-password`, passwordData); // Cesta je relatívna k baseURL apiClientu
-        return response.data; // Vráti {"message": "..."}
+        return response.data; // Vráti {"message": "...", "access_token": "..."}
     } catch (error) {
         console.error("API Error changing password:", error.response?.data || error.message);
         throw error;
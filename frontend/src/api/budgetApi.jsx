@@ -31,4 +31,12 @@ export const getRuleStatus = async (year, month) => {
       const response = await apiClient.get('api/budget-rules-status', { params: { year, month } });
       return response.data;
     } catch (error) { console.error("API: getBudgetRulesStatus failed:", error.response?.data || error.message); throw error; }
-  };
\ No newline at end of file
+  };
+// Stav čerpania za viac mesiacov naraz (from/to vo formáte 'YYYY-MM'):
+// [{ year, month, budgets: [...] }, ...]
+export const getBudgetStatusRange = async (from, to) => {
+  try {
+    const response = await apiClient.get('api/budget-status', { params: { from, to } });
+    return response.data;
+  } catch (error) { console.error("API: getBudgetStatusRange failed:", error.response?.data || error.message); throw error; }
+};
@@ -0,0 +1,30 @@
+import apiClient from './axiosConfig';
+
+// Pravidlo: { pattern, match_type: 'contains' | 'word', category, rule_category, priority }
+export const getCategoryRules = async () => {
+  try {
+    const response = await apiClient.get('api/category-rules');
+    return response.data;
+  } catch (error) { console.error("API: getCategoryRules failed:", error.response?.data || error.message); throw error; }
+};
+
+export const addCategoryRule = async (ruleData) => {
+  try {
+    const response = await apiClient.post('api/category-rules', ruleData);
+    return response.data;
+  } catch (error) { console.error("API: addCategoryRule failed:", error.response?.data || error.message); throw error; }
+};
+
+export const updateCategoryRule = async (ruleId, ruleData) => {
+  try {
+    const response = await apiClient.put(`api/category-rules/${ruleId}`, ruleData);
+    return response.data;
+  } catch (error) { console.error("API: updateCategoryRule failed:", error.response?.data || error.message); throw error; }
+};
+
+export const deleteCategoryRule = async (ruleId) => {
+  try {
+    const response = await apiClient.delete(`api/category-rules/${ruleId}`);
+    return response.data;
+  } catch (error) { console.error("API: deleteCategoryRule failed:", error.response?.data || error.message); throw error; }
+};
@@ -0,0 +1,10 @@
+import apiClient from './axiosConfig';
+
+// Všetky dáta dashboardu jednou požiadavkou:
+// { year, month, budgets, budget_status, rules_status, weekly_snapshot }
+export const getDashboard = async (year, month, days = 7) => {
+  try {
+    const response = await apiClient.get('api/dashboard', { params: { year, month, days } });
+    return response.data;
+  } catch (error) { console.error("API: getDashboard failed:", error.response?.data || error.message); throw error; }
+};
@@ -1,12 +1,30 @@
 import apiClient from './axiosConfig';
 
-export const getExpenses = async () => {
+// filters: { category, rule_category, min_amount, max_amount, date_from, date_to, sort }
+// (sort: 'date' | 'amount' | 'description', s '-' zostupne), filtruje a zoraďuje server
+export const getExpenses = async (filters = {}) => {
   try {
-    const response = await apiClient.get('api/expenses');
+    const response = await apiClient.get('api/expenses', { params: filters });
     return response.data;
   } catch (error) { console.error("API: getExpenses failed:", error.response?.data || error.message); throw error; }
 };
 
+// Jedna stránka výdavkov (keyset stránkovanie), vracia { items, next_cursor }
+export const getExpensesPage = async ({ limit = 50, cursor, ...filters } = {}) => {
+  try {
+    const response = await apiClient.get('api/expenses', { params: { limit, cursor, ...filters } });
+    return response.data;
+  } catch (error) { console.error("API: getExpensesPage failed:", error.response?.data || error.message); throw error; }
+};
+
+// Fulltextové vyhľadávanie (prefixy slov, bez diakritiky), vracia { items, next_offset }
+export const searchExpenses = async (q, { limit = 50, offset = 0 } = {}) => {
+  try {
+    const response = await apiClient.get('api/expenses/search', { params: { q, limit, offset } });
+    return response.data;
+  } catch (error) { console.error("API: searchExpenses failed:", error.response?.data || error.message); throw error; }
+};
+
 export const addExpense = async (expenseData) => {
   try {
     const response = await apiClient.post('api/expenses', expenseData);
@@ -28,6 +46,14 @@ export const updateExpense = async (expenseId, expenseData) => {
     } catch (error) { console.error("API: updateExpense failed:", error.response?.data || error.message); throw error; }
 };
 
+// Použije pravidlá kategorizácie na históriu; onlyUncategorized = false prepíše aj ručne zadané kategórie
+export const recategorizeExpenses = async (onlyUncategorized = true) => {
+    try {
+        const response = await apiClient.post('api/expenses/recategorize', { only_uncategorized: onlyUncategorized });
+        return response.data;
+    } catch (error) { console.error("API: recategorizeExpenses failed:", error.response?.data || error.message); throw error; }
+};
+
 export const pingApi = async () => {
     try {
         const response = await apiClient.get('api/ping');
@@ -1,12 +1,30 @@
 import apiClient from './axiosConfig';
 
-export const getIncomes = async () => {
+// filters: { source, min_amount, max_amount, date_from, date_to, sort }
+// (sort: 'date' | 'amount' | 'description', s '-' zostupne), filtruje a zoraďuje server
+export const getIncomes = async (filters = {}) => {
   try {
-    const response = await apiClient.get('api/incomes');
+    const response = await apiClient.get('api/incomes', { params: filters });
     return response.data;
   } catch (error) { console.error("API: getIncomes failed:", error.response?.data || error.message); throw error; }
 };
 
+// Jedna stránka príjmov (keyset stránkovanie), vracia { items, next_cursor }
+export const getIncomesPage = async ({ limit = 50, cursor, ...filters } = {}) => {
+  try {
+    const response = await apiClient.get('api/incomes', { params: { limit, cursor, ...filters } });
+    return response.data;
+  } catch (error) { console.error("API: getIncomesPage failed:", error.response?.data || error.message); throw error; }
+};
+
+// Fulltextové vyhľadávanie (prefixy slov, bez diakritiky), vracia { items, next_offset }
+export const searchIncomes = async (q, { limit = 50, offset = 0 } = {}) => {
+  try {
+    const response = await apiClient.get('api/incomes/search', { params: { q, limit, offset } });
+    return response.data;
+  } catch (error) { console.error("API: searchIncomes failed:", error.response?.data || error.message); throw error; }
+};
+
 export const addIncome = async (incomeData) => {
   try {
     const response = await apiClient.post('api/incomes', incomeData);
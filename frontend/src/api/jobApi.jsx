@@ -0,0 +1,31 @@
+import apiClient from './axiosConfig';
+
+// Úlohy na pozadí: kind = 'export_expenses' | 'export_incomes' | 'yearly_review' | 'recompute_summaries'
+export const createJob = async (kind, params = {}) => {
+  try {
+    const response = await apiClient.post('api/jobs', { kind, params });
+    return response.data;
+  } catch (error) { console.error("API: createJob failed:", error.response?.data || error.message); throw error; }
+};
+
+// { id, kind, status: 'queued' | 'running' | 'succeeded' | 'failed', progress, message, result_url, ... }
+export const getJob = async (jobId) => {
+  try {
+    const response = await apiClient.get(`api/jobs/${jobId}`);
+    return response.data;
+  } catch (error) { console.error("API: getJob failed:", error.response?.data || error.message); throw error; }
+};
+
+export const getJobs = async () => {
+  try {
+    const response = await apiClient.get('api/jobs');
+    return response.data;
+  } catch (error) { console.error("API: getJobs failed:", error.response?.data || error.message); throw error; }
+};
+
+export const downloadJobResult = async (jobId) => {
+  try {
+    const response = await apiClient.get(`api/jobs/${jobId}/result`, { responseType: 'blob' });
+    return response.data;
+  } catch (error) { console.error("API: downloadJobResult failed:", error.response?.data || error.message); throw error; }
+};
@@ -1,10 +1,11 @@
 // frontend/src/api/reportApi.js
 import apiClient from './axiosConfig';
 
-export const getWeeklySnapshot = async () => {
-  console.log("API: Calling GET /api/reports/weekly-snapshot");
+// days: dĺžka obdobia prehľadu (7, 30 alebo 90 dní)
+export const getWeeklySnapshot = async (days = 7) => {
+  console.log("API: Calling GET /api/reports/weekly-snapshot", { days });
   try {
-    const response = await apiClient.get('/api/reports/weekly-snapshot');
+    const response = await apiClient.get('/api/reports/weekly-snapshot', { params: { days } });
     return response.data;
   } catch (error) {
     console.error("Error fetching weekly snapshot:", error.response?.data || error.message, error);
@@ -13,6 +14,17 @@ export const getWeeklySnapshot = async () => {
   }
 };
 
+// Časový rad výdavkov a príjmov: granularity 'day' | 'week' | 'month', from/to 'YYYY-MM-DD'
+export const getTimeseries = async ({ granularity = 'month', from, to, category, window } = {}) => {
+  try {
+    const response = await apiClient.get('/api/reports/timeseries', { params: { granularity, from, to, category, window } });
+    return response.data;
+  } catch (error) {
+    console.error("Error fetching timeseries:", error.response?.data || error.message, error);
+    throw error.response?.data || new Error(error.message || 'Unknown error fetching timeseries');
+  }
+};
+
 export const setWeeklyFocus = async (focusData) => {
   console.log("API: Calling POST /api/reports/weekly-focus with:", focusData);
   try {
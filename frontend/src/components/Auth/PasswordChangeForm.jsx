@@ -1,9 +1,11 @@
 import React, { useState } from 'react';
 import { changePassword } from '../../api/authApi';
+import { useAuth } from '../../contexts/AuthContext';
 import Alert from '../UI/Alert';
 import Spinner from '../UI/Spinner';
 
 const PasswordChangeForm = () => {
+    const { replaceToken } = useAuth();
     const [currentPassword, setCurrentPassword] = useState('');
     const [newPassword, setNewPassword] = useState('');
     const [confirmNewPassword, setConfirmNewPassword] = useState('');
@@ -28,6 +30,8 @@ const PasswordChangeForm = () => {
         setLoading(true);
         try {
             const data = await changePassword({ currentPassword, newPassword, confirmNewPassword });
+            // Starý token už neplatí, pokračujeme s novým
+            if (data.access_token) replaceToken(data.access_token);
             setSuccess(data.message || "Heslo úspešne zmenené.");
             setCurrentPassword('');
             setNewPassword('');
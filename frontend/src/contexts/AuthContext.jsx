@@ -84,7 +84,12 @@ export const AuthProvider = ({ children }) => {
         console.log("User logged out");
     }, []);
 
-    const value = { token, user, isAuthenticated: !!user, isLoading, authError, login, register, logout };
+    // Po zmene hesla backend zneplatní staré tokeny a vráti nový
+    const replaceToken = useCallback((newToken) => {
+        updateAuthState(newToken, user);
+    }, [user]);
+
+    const value = { token, user, isAuthenticated: !!user, isLoading, authError, login, register, logout, replaceToken };
 
     // Zobrazíme deti až keď sa dokončí prvotné načítavanie
     return <AuthContext.Provider value={value}>{!isLoading ? children : <div className="flex justify-center items-center h-screen">Načítavam aplikáciu...</div>}</AuthContext.Provider>;
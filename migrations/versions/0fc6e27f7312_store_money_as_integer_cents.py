@@ -0,0 +1,73 @@
+"""Store money as integer cents
+
+Revision ID: 0fc6e27f7312
+Revises: 7d033c88fe0a
+Create Date: 2026-10-18 17:41:09.512337
+
+expense.amount, income.amount and budget.amount (Float) are replaced by
+amount_cents (Integer), monthly_summary.total by total_cents (BigInteger).
+Existing values are backfilled in Python with the same half-up Decimal rounding
+as money_utils.to_cents (1.005 -> 101), so migrated and newly written rows agree.
+Run `flask rebuild-summaries` afterwards to make summary totals exact sums of the rows.
+
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0fc6e27f7312'
+down_revision = '7d033c88fe0a'
+branch_labels = None
+depends_on = None
+
+# (tabuľka, pôvodný stĺpec, nový stĺpec, typ)
+MONEY_COLUMNS = (
+    ('expense', 'amount', 'amount_cents', sa.Integer()),
+    ('income', 'amount', 'amount_cents', sa.Integer()),
+    ('budget', 'amount', 'amount_cents', sa.Integer()),
+    ('monthly_summary', 'total', 'total_cents', sa.BigInteger()),
+)
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _to_cents(value):
+    # Kópia money_utils.to_cents v čase migrácie (migrácie neimportujú kód aplikácie)
+    return int(Decimal(str(value)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP) * 100)
+
+
+def _backfill_cents(table, old_column, new_column):
+    """ROUND(amount * 100) v SQL zaokrúhľuje binárny float (1.005 -> 100), preto po dávkach v Pythone."""
+    bind = op.get_bind()
+    update = sa.text(f"UPDATE {table} SET {new_column} = :cents WHERE id = :id")
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(f"SELECT id, {old_column} FROM {table} WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {'last_id': last_id, 'limit': BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            return
+        bind.execute(update, [{'id': row_id, 'cents': _to_cents(amount or 0)} for row_id, amount in rows])
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    for table, old_column, new_column, column_type in MONEY_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column(new_column, column_type, nullable=True))
+        _backfill_cents(table, old_column, new_column)
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(new_column, existing_type=column_type, nullable=False)
+            batch_op.drop_column(old_column)
+
+
+def downgrade():
+    for table, old_column, new_column, column_type in MONEY_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column(old_column, sa.Float(), nullable=True))
+        op.execute(f"UPDATE {table} SET {old_column} = {new_column} / 100.0")
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(old_column, existing_type=sa.Float(), nullable=False)
+            batch_op.drop_column(new_column)
@@ -0,0 +1,60 @@
+"""Add FTS5 search index for expenses and incomes
+
+Revision ID: 4b8d2a7e91c5
+Revises: c3e91f04a6b2
+Create Date: 2026-10-18 19:12:47.330925
+
+SQLite only: expense_fts / income_fts (external content) kept in sync by
+triggers and filled from existing rows. batch_alter_table on expense or
+income recreates the table and drops the triggers; run
+`flask rebuild-search-index` after such a migration.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b8d2a7e91c5'
+down_revision = 'c3e91f04a6b2'
+branch_labels = None
+depends_on = None
+
+# (tabuľka, FTS tabuľka, indexované stĺpce)
+FTS_INDEXES = (
+    ('expense', 'expense_fts', ('description', 'category')),
+    ('income', 'income_fts', ('description', 'source')),
+)
+
+
+def _statements(source, fts_name, columns):
+    names = ', '.join(columns)
+    new_values = ', '.join(f'new.{name}' for name in columns)
+    old_values = ', '.join(f'old.{name}' for name in columns)
+    delete_old = f"INSERT INTO {fts_name}({fts_name}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+    insert_new = f"INSERT INTO {fts_name}(rowid, {names}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_name} USING fts5({names}, content='{source}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ai AFTER INSERT ON {source} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ad AFTER DELETE ON {source} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_au AFTER UPDATE OF {names} ON {source} BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts_name}({fts_name}) VALUES ('rebuild')",
+    ]
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for source, fts_name, columns in FTS_INDEXES:
+        for statement in _statements(source, fts_name, columns):
+            op.execute(statement)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for source, fts_name, columns in FTS_INDEXES:
+        for suffix in ('ai', 'ad', 'au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts_name}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts_name}")
@@ -0,0 +1,38 @@
+"""Add composite indexes for list filters and sorting
+
+Revision ID: e5a1c9d37b40
+Revises: 4b8d2a7e91c5
+Create Date: 2026-10-18 19:38:05.118472
+
+Plain CREATE INDEX (no batch mode), so the expense/income tables are not
+recreated and the FTS triggers stay in place.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a1c9d37b40'
+down_revision = '4b8d2a7e91c5'
+branch_labels = None
+depends_on = None
+
+# (index, tabuľka, stĺpce)
+INDEXES = (
+    ('ix_expense_user_id_category_date_created', 'expense', ['user_id', 'category', 'date_created']),
+    ('ix_expense_user_id_rule_category_date_created', 'expense', ['user_id', 'rule_category', 'date_created']),
+    ('ix_expense_user_id_amount_cents', 'expense', ['user_id', 'amount_cents']),
+    ('ix_income_user_id_source_date_created', 'income', ['user_id', 'source', 'date_created']),
+    ('ix_income_user_id_amount_cents', 'income', ['user_id', 'amount_cents']),
+)
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    for name, table, columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)